@@ -2,62 +2,91 @@
 """Export database data to JSONL for backup/migration.
 
 Exports: channels, users, messages, reactions, reminders, sync_state
-Each table is exported to a separate .jsonl file (one JSON object per line).
+Each table is exported to a separate gzip-compressed .jsonl.gz file (one JSON object per line).
 """
 
 import asyncio
-import json
+import functools
+import gzip
+import operator
 from datetime import datetime
+from decimal import Decimal
 from pathlib import Path
 from typing import Any
 
+import orjson
 from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from slack_assistant.db.connection import close_db, get_session, init_db
 from slack_assistant.db.models import Channel, Message, Reaction, Reminder, SyncState, User
 
 
-def serialize_value(obj: Any) -> Any:
-    """Serialize a value for JSON output."""
-    if isinstance(obj, datetime):
-        return obj.isoformat()
-    if isinstance(obj, list):
-        return [serialize_value(item) for item in obj]
-    if isinstance(obj, dict):
-        return {k: serialize_value(v) for k, v in obj.items()}
-    return obj
+def serialize_default(obj: Any) -> Any:
+    """Serialize values orjson doesn't handle natively."""
+    if isinstance(obj, Decimal):
+        return str(obj)
+    raise TypeError(f'Type is not JSON serializable: {type(obj).__name__}')
 
 
+# Rows fetched per round-trip when streaming a table
+STREAM_CHUNK_SIZE = 10_000
+
+# Serialized bytes accumulated before each write syscall
+WRITE_BUFFER_SIZE = 4 * 1024 * 1024
+
+# Compression level for exported files
+GZIP_LEVEL = 1
+
+# Tables exported at the same time (each holds a pooled connection)
+MAX_PARALLEL_EXPORTS = 3
+
 # Mapping from database column names to Python attribute names
 COLUMN_TO_ATTR = {
     'metadata': 'metadata_',
 }
 
 
+@functools.cache
+def _column_plan(model: type) -> tuple[tuple[str, ...], operator.attrgetter]:
+    """Get column names and a getter fetching all mapped attributes at once, built once per model."""
+    columns = model.__table__.columns
+    column_names = tuple(column.name for column in columns)
+    # Use the mapped attribute name if it exists
+    attr_names = [COLUMN_TO_ATTR.get(name, name) for name in column_names]
+    return column_names, operator.attrgetter(*attr_names)
+
+
 def model_to_dict(row: Any, model: type) -> dict[str, Any]:
     """Convert a SQLAlchemy model instance to a dictionary."""
-    result = {}
-    for column in model.__table__.columns:
-        # Use the mapped attribute name if it exists
-        attr_name = COLUMN_TO_ATTR.get(column.name, column.name)
-        value = getattr(row, attr_name)
-        # Use original column name as the key
-        result[column.name] = serialize_value(value)
-    return result
+    column_names, get_values = _column_plan(model)
+    # Use original column name as the key
+    return dict(zip(column_names, get_values(row), strict=True))
 
 
-async def export_table_jsonl(model: type, output_file: Path) -> int:
+async def export_table_jsonl(session: AsyncSession, model: type, output_file: Path) -> int:
     """Export all rows from a table to a JSONL file."""
     count = 0
-    async with get_session() as session:
-        result = await session.execute(select(model))
-        rows = result.scalars().all()
 
-        with open(output_file, 'w') as f:  # noqa: ASYNC230
-            for row in rows:
-                data = model_to_dict(row, model)
-                f.write(json.dumps(data) + '\n')
-                count += 1
+    # Stream rows through a server-side cursor instead of loading the whole table
+    stmt = select(model).execution_options(yield_per=STREAM_CHUNK_SIZE)
+    rows = await session.stream_scalars(stmt)
+
+    # Level 1 is fast and still shrinks the highly repetitive JSONL several times over
+    with gzip.open(output_file, 'wb', compresslevel=GZIP_LEVEL) as f:
+        buffer = bytearray()
+        async for row in rows:
+            data = model_to_dict(row, model)
+            buffer += orjson.dumps(data, default=serialize_default, option=orjson.OPT_APPEND_NEWLINE)
+            count += 1
+
+            # Hand full buffers to a worker thread so disk writes don't block the event loop
+            if len(buffer) >= WRITE_BUFFER_SIZE:
+                chunk, buffer = buffer, bytearray()
+                await asyncio.to_thread(f.write, chunk)
+
+        if buffer:
+            await asyncio.to_thread(f.write, buffer)
 
     return count
 
@@ -88,12 +117,19 @@ async def main():
             (SyncState, 'sync_state'),
         ]
 
-        counts = {}
-        for model, name in tables:
-            output_file = export_dir / f'{name}.jsonl'
-            count = await export_table_jsonl(model, output_file)
-            counts[name] = count
+        # Export tables concurrently; a session can't be shared across tasks, so each
+        # gets its own pooled one, and the semaphore caps how many are checked out
+        semaphore = asyncio.Semaphore(MAX_PARALLEL_EXPORTS)
+
+        async def export_one(model: type, name: str) -> int:
+            output_file = export_dir / f'{name}.jsonl.gz'
+            async with semaphore, get_session() as session:
+                count = await export_table_jsonl(session, model, output_file)
             print(f'  {name}: {count} records -> {output_file.name}')
+            return count
+
+        results = await asyncio.gather(*(export_one(model, name) for model, name in tables))
+        counts = {name: count for (_, name), count in zip(tables, results, strict=True)}
 
         # Write metadata file
         metadata = {
@@ -101,8 +137,8 @@ async def main():
             'counts': counts,
         }
         metadata_file = export_dir / 'metadata.json'
-        with open(metadata_file, 'w') as f:  # noqa: ASYNC230
-            json.dump(metadata, f, indent=2)
+        with open(metadata_file, 'wb') as f:  # noqa: ASYNC230
+            f.write(orjson.dumps(metadata, option=orjson.OPT_INDENT_2))
 
         print()
         print(f'Export complete: {export_dir}')
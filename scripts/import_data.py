@@ -2,18 +2,24 @@
 """Import database data from JSONL backup.
 
 Imports: channels, users, messages, reactions, reminders, sync_state
-Reads from .jsonl files (one JSON object per line) for memory efficiency.
+Reads from .jsonl.gz (or plain .jsonl) files (one JSON object per line) for memory efficiency.
 """
 
 import argparse
 import asyncio
-import json
+import functools
+import gzip
+import itertools
 import logging
+import operator
+from collections.abc import Iterator
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO
 
-from sqlalchemy.dialects.postgresql import insert
+import orjson
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from slack_assistant.db.connection import close_db, get_session, init_db
 from slack_assistant.db.models import Channel, Message, Reaction, Reminder, SyncState, User
@@ -27,6 +33,21 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def open_jsonl(path: Path) -> BinaryIO:
+    """Open a JSONL export for binary reading, decompressing .gz files transparently."""
+    if path.suffix == '.gz':
+        return gzip.open(path, 'rb')
+    return open(path, 'rb')
+
+
+def find_table_file(export_dir: Path, name: str) -> Path:
+    """Find the export file for a table, preferring the compressed variant."""
+    compressed = export_dir / f'{name}.jsonl.gz'
+    if compressed.exists():
+        return compressed
+    return export_dir / f'{name}.jsonl'
+
+
 def parse_datetime(value: str | None) -> datetime | None:
     """Parse ISO format datetime string."""
     if value is None:
@@ -37,102 +58,168 @@ def parse_datetime(value: str | None) -> datetime | None:
         return None
 
 
+@functools.cache
+def _column_plan(model: type) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """Get (column_names, datetime_column_names) for a model, computed once per model."""
+    columns = model.__table__.columns
+    datetime_columns = tuple(col.name for col in columns if getattr(col.type, 'python_type', None) is datetime)
+    return tuple(col.name for col in columns), datetime_columns
+
+
 def deserialize_row(data: dict[str, Any], model: type) -> dict[str, Any]:
     """Convert JSON data to model-compatible dictionary."""
-    result = {}
-    for column in model.__table__.columns:
-        if column.name not in data:
-            continue
+    column_names, datetime_columns = _column_plan(model)
+    result = {name: data[name] for name in column_names if name in data}
 
-        value = data[column.name]
+    # Only datetime columns need conversion; everything else is already the right JSON type
+    for name in datetime_columns:
+        if name in result:
+            result[name] = parse_datetime(result[name])
 
-        # Handle datetime columns
-        if hasattr(column.type, 'python_type') and column.type.python_type == datetime:
-            value = parse_datetime(value)
+    return result
 
-        result[column.name] = value
 
-    return result
+@functools.cache
+def _table_plan(model: type) -> tuple[frozenset[str], tuple[tuple[str, Any], ...], str]:
+    """Get (jsonb_columns, python_defaults, conflict_clause) for a model's table, built once per model.
+
+    The conflict clause updates every non-pk column from EXCLUDED, so columns missing
+    from the JSON are reset to their defaults, as the ORM insert used to do.
+    """
+    table = model.__table__
+    jsonb_cols = frozenset(col.name for col in table.columns if isinstance(col.type, JSONB))
+    # Python-side defaults are applied by the ORM only, so raw inserts must fill them in
+    python_defaults = tuple(
+        (col.name, col.default)
+        for col in table.columns
+        if col.default is not None and (col.default.is_scalar or col.default.is_callable)
+    )
+    pk_cols = [col.name for col in table.primary_key.columns]
+    update_list = ', '.join(f'{col.name} = EXCLUDED.{col.name}' for col in table.columns if col.name not in pk_cols)
+    conflict_clause = f'ON CONFLICT ({", ".join(pk_cols)}) DO UPDATE SET {update_list}'
+    return jsonb_cols, python_defaults, conflict_clause
+
+
+@functools.cache
+def _upsert_sql(model: type, columns: tuple[str, ...]) -> str:
+    """Build the upsert statement for the given subset of a model's columns."""
+    _, _, conflict_clause = _table_plan(model)
+    placeholders = ', '.join(f'${i}' for i in range(1, len(columns) + 1))
+    return f'INSERT INTO {model.__table__.name} ({", ".join(columns)}) VALUES ({placeholders}) {conflict_clause}'
+
+
+def _iter_records(model: type, input_file: Path) -> Iterator[tuple[tuple[str, ...], tuple]]:
+    """Yield (columns, values) for each row of a JSONL file.
+
+    Only columns present in the JSON or having a Python-side default are included,
+    so server defaults (e.g. ``created_at``) still apply to the rest.
+    """
+    jsonb_cols, python_defaults, _ = _table_plan(model)
+    with open_jsonl(input_file) as f:
+        for line in f:
+            if not line.strip():
+                continue
+            row_data = deserialize_row(orjson.loads(line), model)
+            for name, default in python_defaults:
+                if name not in row_data:
+                    row_data[name] = default.arg(None) if default.is_callable else default.arg
+            # asyncpg's JSONB codec (as registered by SQLAlchemy) expects encoded text
+            for name in jsonb_cols:
+                if name in row_data:
+                    row_data[name] = orjson.dumps(row_data[name] or {}).decode()
+            yield tuple(row_data), tuple(row_data.values())
+
+
+async def _driver_connection(session: AsyncSession) -> Any:
+    """Get the raw asyncpg connection behind a session."""
+    connection = await session.connection()
+    raw_connection = await connection.get_raw_connection()
+    return raw_connection.driver_connection
 
 
 async def import_table_jsonl(
+    session: AsyncSession,
     model: type,
     input_file: Path,
     batch_size: int = 100,
 ) -> int:
-    """Import rows from a JSONL file into a table."""
+    """Import rows from a JSONL file into a table.
+
+    Each batch is sent with asyncpg's executemany against one prepared upsert
+    statement, so parameter sets are pipelined without per-row compilation.
+    """
     if not input_file.exists():
         logger.warning(f'File not found: {input_file}')
         return 0
 
     count = 0
     batch = []
+    batch_columns: tuple[str, ...] = ()
 
-    # Get the metadata column reference for tables that have it
-    metadata_col = None
-    if hasattr(model, 'metadata_'):
-        metadata_col = model.__table__.c.metadata
-
-    async with get_session() as session:
-        with open(input_file) as f:  # noqa: ASYNC230
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
+    conn = await _driver_connection(session)
 
-                data = json.loads(line)
-                row_data = deserialize_row(data, model)
+    async with conn.transaction():
+        for columns, values in _iter_records(model, input_file):
+            # Rows missing different keys need a different column list
+            if batch and (columns != batch_columns or len(batch) >= batch_size):
+                await conn.executemany(_upsert_sql(model, batch_columns), batch)
+                batch = []
+            batch_columns = columns
+            batch.append(values)
+            count += 1
 
-                # Handle metadata column separately due to SQLAlchemy name conflict
-                metadata_value = row_data.pop('metadata', None)
-
-                batch.append((row_data, metadata_value))
-                count += 1
-
-                if len(batch) >= batch_size:
-                    await _insert_batch(session, model, batch, metadata_col)
-                    batch = []
-
-            # Insert remaining rows
-            if batch:
-                await _insert_batch(session, model, batch, metadata_col)
-
-        await session.commit()
+        # Insert remaining rows
+        if batch:
+            await conn.executemany(_upsert_sql(model, batch_columns), batch)
 
     return count
 
 
-async def _insert_batch(session, model: type, batch: list, metadata_col) -> None:
-    """Insert a batch of rows with upsert."""
-    for row_data, metadata_value in batch:
-        # Build the insert statement
-        if metadata_col is not None and metadata_value is not None:
-            stmt = insert(model).values(**row_data).values({metadata_col: metadata_value})
-        else:
-            stmt = insert(model).values(**row_data)
-
-        # Get primary key columns for conflict resolution
-        pk_cols = [col.name for col in model.__table__.primary_key.columns]
+async def import_table_copy(session: AsyncSession, model: type, input_file: Path) -> int:
+    """Import rows from a JSONL file using COPY into a temp table, then upsert.
 
-        # Build update set (all non-pk columns)
-        update_cols = {
-            col.name: getattr(stmt.excluded, col.name) for col in model.__table__.columns if col.name not in pk_cols
-        }
+    Much faster than batched INSERTs for large tables: rows are streamed over
+    asyncpg's binary COPY protocol and merged with a single INSERT ... SELECT.
+    """
+    if not await asyncio.to_thread(input_file.exists):
+        logger.warning(f'File not found: {input_file}')
+        return 0
 
-        # Add metadata to update if present
-        if metadata_col is not None and metadata_value is not None:
-            update_cols[metadata_col] = stmt.excluded.metadata
+    table = model.__table__
+    _, _, conflict_clause = _table_plan(model)
+    tmp_table = f'tmp_import_{table.name}'
+    column_list = ', '.join(col.name for col in table.columns)
+    count = 0
 
-        stmt = stmt.on_conflict_do_update(index_elements=pk_cols, set_=update_cols)
+    conn = await _driver_connection(session)
+
+    async with conn.transaction():
+        await conn.execute(f'CREATE TEMP TABLE {tmp_table} (LIKE {table.name} INCLUDING DEFAULTS) ON COMMIT DROP')
+        # COPY takes one column list, so stream each run of rows with the same keys separately;
+        # omitted columns pick up the server defaults copied onto the temp table
+        for columns, rows in itertools.groupby(_iter_records(model, input_file), key=operator.itemgetter(0)):
+            status = await conn.copy_records_to_table(
+                tmp_table, records=(values for _, values in rows), columns=list(columns)
+            )
+            # Status string looks like 'COPY 1234'
+            count += int(status.split()[-1])
+        await conn.execute(
+            f'INSERT INTO {table.name} ({column_list}) SELECT {column_list} FROM {tmp_table} {conflict_clause}'
+        )
 
-        await session.execute(stmt)
+    return count
 
 
 async def main():
     """Run the import."""
     parser = argparse.ArgumentParser(description='Import Slack data from JSONL backup')
-    parser.add_argument('export_dir', type=Path, help='Path to export directory containing .jsonl files')
+    parser.add_argument('export_dir', type=Path, help='Path to export directory containing .jsonl(.gz) files')
     parser.add_argument('--batch-size', type=int, default=100, help='Batch size for inserts (default: 100)')
+    parser.add_argument(
+        '--fresh',
+        action='store_true',
+        help='Load the messages table with COPY (fastest when importing into an empty database)',
+    )
     args = parser.parse_args()
 
     if not args.export_dir.exists():
@@ -142,8 +229,8 @@ async def main():
     # Check for metadata file
     metadata_file = args.export_dir / 'metadata.json'
     if metadata_file.exists():
-        with open(metadata_file) as f:  # noqa: ASYNC230
-            metadata = json.load(f)
+        with open(metadata_file, 'rb') as f:  # noqa: ASYNC230
+            metadata = orjson.loads(f.read())
         logger.info(f'Importing from backup created at: {metadata.get("exported_at", "unknown")}')
 
     # Initialize database
@@ -165,11 +252,16 @@ async def main():
         ]
 
         counts = {}
-        for model, name in tables:
-            input_file = args.export_dir / f'{name}.jsonl'
-            count = await import_table_jsonl(model, input_file, args.batch_size)
-            counts[name] = count
-            print(f'  {name}: {count} records imported')
+        # One session (and pooled connection) for the whole import; each table commits separately
+        async with get_session() as session:
+            for model, name in tables:
+                input_file = find_table_file(args.export_dir, name)
+                if args.fresh and model is Message:
+                    count = await import_table_copy(session, model, input_file)
+                else:
+                    count = await import_table_jsonl(session, model, input_file, args.batch_size)
+                counts[name] = count
+                print(f'  {name}: {count} records imported')
 
         print()
         print('Import complete!')
@@ -43,6 +43,12 @@ async def main():
         default=100,
         help='Maximum messages per channel (default: 100)',
     )
+    parser.add_argument(
+        '--concurrency',
+        type=int,
+        default=5,
+        help='Number of channels to sync in parallel (default: 5)',
+    )
     args = parser.parse_args()
 
     config = get_config()
@@ -80,25 +86,41 @@ async def main():
             channels = await repository.get_all_channels()
             total_messages = 0
 
-            for i, channel in enumerate(channels, 1):
-                try:
-                    await poller._sync_channel_messages(channel.id)
-                    if (i % 10) == 0:
-                        logger.info(f'Progress: {i}/{len(channels)} channels synced')
-                except Exception as e:
-                    logger.warning(f'Failed to sync channel {channel.name}: {e}')
+            # Sync several channels at once; the client's rate limiter still paces API calls
+            semaphore = asyncio.Semaphore(args.concurrency)
+            done = 0
 
-            # Get final count
-            from sqlalchemy import func, select
+            async def sync_one(channel) -> None:
+                nonlocal done
+                async with semaphore:
+                    try:
+                        await poller._sync_channel_messages(channel)
+                    except Exception as e:
+                        logger.warning(f'Failed to sync channel {channel.name}: {e}')
+                done += 1
+                if (done % 10) == 0:
+                    logger.info(f'Progress: {done}/{len(channels)} channels synced')
+
+            await asyncio.gather(*(sync_one(channel) for channel in channels))
+
+            # Get final count from planner statistics instead of a full table scan
+            from sqlalchemy import func, select, text
 
             from slack_assistant.db.connection import get_session
             from slack_assistant.db.models import Message
 
             async with get_session() as session:
-                result = await session.execute(select(func.count()).select_from(Message))
-                total_messages = result.scalar_one()
+                result = await session.execute(
+                    text("SELECT reltuples::bigint FROM pg_class WHERE relname = 'messages'")
+                )
+                total_messages = result.scalar_one_or_none()
+
+                # reltuples is -1 until the table has been analyzed at least once
+                if total_messages is None or total_messages < 0:
+                    result = await session.execute(select(func.count()).select_from(Message))
+                    total_messages = result.scalar_one()
 
-            logger.info(f'Synced {total_messages} messages total')
+            logger.info(f'Synced ~{total_messages} messages total')
 
         print()
         print('=' * 60)
@@ -12,37 +12,50 @@ Use scripts/initial_sync.py for that.
 
 import argparse
 import asyncio
-import subprocess
 import sys
 from pathlib import Path
 
+import asyncpg
+
+from slack_assistant.config import get_config
+
 
 # Get project root
 PROJECT_ROOT = Path(__file__).parent.parent
 
 
-async def wait_for_postgres(max_attempts: int = 30) -> bool:
+async def _probe_postgres(dsn: str) -> bool:
+    """Try a single connection to PostgreSQL."""
+    try:
+        conn = await asyncpg.connect(dsn, timeout=1)
+    except (OSError, TimeoutError, asyncpg.PostgresError):
+        return False
+    await conn.close()
+    return True
+
+
+async def wait_for_postgres(max_wait: float = 30.0, interval: float = 0.25) -> bool:
     """Wait for PostgreSQL to accept connections."""
     print('   Waiting for PostgreSQL to be ready...')
-    for i in range(max_attempts):
-        result = subprocess.run(  # noqa: ASYNC221
-            ['docker', 'exec', 'slack_assistant_db', 'pg_isready', '-U', 'slack_assistant'],
-            capture_output=True,
-        )
-        if result.returncode == 0:
+    dsn = get_config().database_url
+    attempts = int(max_wait / interval)
+    report_every = int(5 / interval)
+    for i in range(attempts):
+        if await _probe_postgres(dsn):
             return True
-        await asyncio.sleep(1)
-        if (i + 1) % 5 == 0:
-            print(f'   Still waiting... ({i + 1}/{max_attempts})')
+        await asyncio.sleep(interval)
+        if (i + 1) % report_every == 0:
+            print(f'   Still waiting... ({(i + 1) * interval:.0f}/{max_wait:.0f}s)')
     return False
 
 
-def run_command(cmd: list[str], description: str, cwd: Path | None = None) -> bool:
+async def run_command(cmd: list[str], description: str, cwd: Path | None = None) -> bool:
     """Run a command and return success status."""
     print(f'   Running: {" ".join(cmd)}')
-    result = subprocess.run(cmd, cwd=cwd or PROJECT_ROOT)
-    if result.returncode != 0:
-        print(f'   ERROR: {description} failed with code {result.returncode}')
+    proc = await asyncio.create_subprocess_exec(*cmd, cwd=cwd or PROJECT_ROOT)
+    returncode = await proc.wait()
+    if returncode != 0:
+        print(f'   ERROR: {description} failed with code {returncode}')
         return False
     return True
 
@@ -63,14 +76,14 @@ async def main():
     if not args.skip_docker:
         if args.reset:
             print('1. Resetting Docker containers (with volumes)...')
-            run_command(['docker', 'compose', 'down', '-v'], 'docker compose down', cwd=PROJECT_ROOT)
+            await run_command(['docker', 'compose', 'down', '-v'], 'docker compose down', cwd=PROJECT_ROOT)
         else:
             print('1. Stopping Docker containers...')
-            run_command(['docker', 'compose', 'down'], 'docker compose down', cwd=PROJECT_ROOT)
+            await run_command(['docker', 'compose', 'down'], 'docker compose down', cwd=PROJECT_ROOT)
 
         # 2. Start PostgreSQL container
         print('\n2. Starting PostgreSQL container...')
-        if not run_command(['docker', 'compose', 'up', '-d', 'postgres'], 'docker compose up', cwd=PROJECT_ROOT):
+        if not await run_command(['docker', 'compose', 'up', '-d', 'postgres'], 'docker compose up', cwd=PROJECT_ROOT):
             sys.exit(1)
 
         # 3. Wait for PostgreSQL
@@ -84,7 +97,7 @@ async def main():
 
     # 4. Run migrations
     print('\n4. Running Alembic migrations...')
-    if not run_command(['uv', 'run', 'alembic', 'upgrade', 'head'], 'alembic upgrade', cwd=PROJECT_ROOT):
+    if not await run_command(['uv', 'run', 'alembic', 'upgrade', 'head'], 'alembic upgrade', cwd=PROJECT_ROOT):
         sys.exit(1)
     print('   Migrations applied!')
 
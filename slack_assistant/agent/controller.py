@@ -1,12 +1,16 @@
 """Agent controller for orchestrating conversations."""
 
+import asyncio
 import logging
+from collections.abc import Sequence
 from dataclasses import dataclass
 from typing import Any
 
+import orjson
+
 from slack_assistant.agent.conversation import ConversationManager
 from slack_assistant.agent.llm import BaseLLMClient, get_llm_client
-from slack_assistant.agent.llm.models import ToolCall
+from slack_assistant.agent.llm.models import LLMResponse, ToolCall
 from slack_assistant.agent.prompts import (
     INITIAL_STATUS_PROMPT,
     RESUME_STATUS_PROMPT,
@@ -22,17 +26,18 @@ from slack_assistant.agent.tools import (
     ThreadTool,
     ToolRegistry,
 )
+from slack_assistant.config import get_config
 from slack_assistant.db.repository import Repository
 from slack_assistant.preferences import PreferenceStorage
 from slack_assistant.services.embeddings import EmbeddingService
-from slack_assistant.session import SessionState, SessionStorage
+from slack_assistant.session import DebouncedSessionStorage, SessionState, SessionStorage
 from slack_assistant.slack.client import SlackClient
 
 
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentResponse:
     """Response from the agent."""
 
@@ -60,26 +65,32 @@ class AgentController:
             repository: Database repository.
             llm_client: LLM client (defaults to config-based).
             preference_storage: Preference storage (defaults to file-based).
-            session_storage: Session storage (defaults to file-based).
+            session_storage: Session storage (defaults to file-based with debounced writes).
             embedding_service: Embedding service for vector search.
         """
         self._client = client
         self._repository = repository
         self._llm = llm_client or get_llm_client()
         self._prefs_storage = preference_storage or PreferenceStorage()
-        self._session_storage = session_storage or SessionStorage()
+        self._session_storage = session_storage or DebouncedSessionStorage()
         self._embedding_service = embedding_service
 
         # Session state (initialized later)
         self._session: SessionState | None = None
         self._is_resumed_session: bool = False
 
+        # Last built system prompt, keyed by preferences version/stat and context strings
+        self._prompt_cache: tuple[tuple, list[dict[str, Any]]] | None = None
+
         # Initialize conversation
         self._conversation = ConversationManager()
 
         # Initialize tool registry
         self._tools = ToolRegistry()
 
+        # Bounds concurrent tool calls to avoid Slack rate-limit bursts
+        self._tool_semaphore = asyncio.Semaphore(get_config().max_tool_concurrency)
+
     def _setup_tools(self) -> None:
         """Register all available tools."""
         # Analysis tool (primary tool for status requests)
@@ -104,10 +115,14 @@ class AgentController:
         if self._session is not None:
             self._tools.register(SessionTool(self._session_storage, self._session))
 
-    def _build_system_prompt(self) -> str:
-        """Build system prompt with current preferences and session context."""
-        prefs = self._prefs_storage.load()
+    async def _build_system_prompt(self) -> list[dict[str, Any]]:
+        """Build system prompt with current preferences and session context.
 
+        The prompt is cached and only rebuilt when preferences are saved, the
+        preferences file changes on disk, or the user/session context changes,
+        avoiding a disk read per message. On a miss the preferences file is read
+        in a worker thread so the event loop is not blocked.
+        """
         user_context = f'User ID: {self._client.user_id}' if self._client.user_id else ''
 
         # Build session context
@@ -118,13 +133,27 @@ class AgentController:
             else:
                 session_context = f'New session started: {self._session.session_id}'
 
-        return build_system_prompt(
+        try:
+            stat = self._prefs_storage.path.stat()
+            prefs_stat = (stat.st_mtime_ns, stat.st_size)
+        except FileNotFoundError:
+            prefs_stat = None
+
+        # The save counter catches in-process writes that land within the same mtime tick
+        cache_key = (self._prefs_storage.version, prefs_stat, user_context, session_context)
+        if self._prompt_cache is not None and self._prompt_cache[0] == cache_key:
+            return self._prompt_cache[1]
+
+        prefs = await asyncio.to_thread(self._prefs_storage.load)
+        prompt = build_system_prompt(
             user_context=user_context,
             custom_rules=prefs.get_rules_text(),
             remembered_facts=prefs.get_facts_text(),
             session_context=session_context,
             emoji_patterns=prefs.get_emoji_patterns_text(),
         )
+        self._prompt_cache = (cache_key, prompt)
+        return prompt
 
     async def initialize(self) -> AgentResponse:
         """Initialize agent and get initial status.
@@ -194,7 +223,7 @@ class AgentController:
         self._conversation.add_user_message(user_input)
 
         # Get system prompt
-        system_prompt = self._build_system_prompt()
+        system_prompt = await self._build_system_prompt()
 
         # Get tool definitions
         tool_definitions = self._tools.get_tool_definitions()
@@ -204,37 +233,31 @@ class AgentController:
 
         # Conversation loop with tool use
         max_iterations = 10
-        for _ in range(max_iterations):
-            # Call LLM
-            response = await self._llm.complete(
-                messages=self._conversation.build_messages(),
-                system=system_prompt,
-                tools=tool_definitions,
+        for iteration in range(max_iterations):
+            # Call LLM; independent tools start while the response is still streaming
+            response, started = await self._complete(
+                self._conversation.build_messages(), system_prompt, tool_definitions
             )
 
             # Track tokens
-            if response.usage:
-                total_tokens += response.usage.get('input_tokens', 0)
-                total_tokens += response.usage.get('output_tokens', 0)
-
-            # Add assistant response to history
-            tool_call_dicts = None
-            if response.tool_calls:
-                tool_call_dicts = [{'id': tc.id, 'name': tc.name, 'input': tc.input} for tc in response.tool_calls]
-            self._conversation.add_assistant_message(response.text, tool_call_dicts)
+            total_tokens += self._account_tokens(response, iteration)
 
-            # If no tool calls, we're done
+            # If no tool calls, record the final reply and we're done
             if not response.has_tool_calls:
+                self._conversation.add_assistant_message(response.text)
                 return AgentResponse(
                     text=response.text,
                     tool_calls_made=total_tool_calls,
                     tokens_used=total_tokens,
                 )
 
+            # Add assistant response with its tool calls to history
+            self._conversation.add_assistant_message(response.text, response.tool_calls)
+
             # Execute tools
-            for tool_call in response.tool_calls:
-                total_tool_calls += 1
-                result, is_error = await self._execute_tool(tool_call)
+            total_tool_calls += len(response.tool_calls)
+            results = await self._execute_tool_calls(response.tool_calls, started)
+            for tool_call, (result, is_error) in zip(response.tool_calls, results, strict=True):
                 self._conversation.add_tool_result(tool_call.id, result, is_error)
 
         # Max iterations reached
@@ -245,6 +268,106 @@ class AgentController:
             tokens_used=total_tokens,
         )
 
+    def _account_tokens(self, response: LLMResponse, iteration: int) -> int:
+        """Log and count token usage for one loop iteration.
+
+        Args:
+            response: LLM response for this iteration.
+            iteration: Zero-based loop iteration.
+
+        Returns:
+            Tokens used by the request (input plus output).
+        """
+        usage = response.usage
+        if not usage:
+            return 0
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                f'Iteration {iteration + 1}: {usage.input_tokens} input tokens '
+                f'({usage.cache_read_input_tokens} cached), {usage.output_tokens} output tokens'
+            )
+        return usage.total_tokens
+
+    async def _complete(
+        self,
+        messages: list[dict[str, Any]],
+        system_prompt: list[dict[str, Any]],
+        tool_definitions: list[dict[str, Any]],
+    ) -> tuple[LLMResponse, dict[str, asyncio.Task]]:
+        """Call the LLM, starting independent tool calls as soon as they are streamed.
+
+        Calls are only started early while that keeps the order the LLM requested:
+        none after a serialized call, and one at a time if the registry has any.
+
+        Args:
+            messages: Messages to send.
+            system_prompt: System prompt text blocks.
+            tool_definitions: Tool definitions.
+
+        Returns:
+            Tuple of (LLM response, tasks already running keyed by tool call ID).
+        """
+        started: dict[str, asyncio.Task] = {}
+        # Whether the batch contains a serialized call is only known once the stream ends, so
+        # while that is possible calls are started one at a time, in order, and starting stops
+        # at the first serialized call or the first call that has to wait
+        may_serialize = any(tool.serialize for tool in self._tools.get_all())
+        stopped = False
+
+        def start(tool_call: ToolCall) -> None:
+            nonlocal stopped
+            if stopped:
+                return
+            if self._is_serialized(tool_call) or (may_serialize and any(not task.done() for task in started.values())):
+                stopped = True
+                return
+            started[tool_call.id] = asyncio.create_task(self._execute_tool(tool_call))
+
+        try:
+            response = await self._llm.complete(
+                messages=messages,
+                system=system_prompt,
+                tools=tool_definitions,
+                on_tool_call=start,
+                message_cache=self._conversation.llm_message_cache,
+            )
+        except BaseException:
+            for task in started.values():
+                task.cancel()
+            raise
+        return response, started
+
+    async def _execute_tool_calls(
+        self,
+        tool_calls: Sequence[ToolCall],
+        started: dict[str, asyncio.Task] | None = None,
+    ) -> list[tuple[Any, bool]]:
+        """Execute the tool calls from one LLM response.
+
+        Independent calls run concurrently. If any call targets a tool marked
+        ``serialize``, calls that were already started are allowed to finish
+        and the rest of the batch runs sequentially, so that state changes
+        happen in the order the LLM requested them.
+
+        Args:
+            tool_calls: Tool calls to execute.
+            started: Tasks already running for some of the calls, keyed by tool call ID.
+
+        Returns:
+            List of (result, is_error) tuples in the same order as tool_calls.
+        """
+        started = started or {}
+        if len(tool_calls) > 1 and not any(self._is_serialized(tc) for tc in tool_calls):
+            return list(await asyncio.gather(*(started.get(tc.id) or self._execute_tool(tc) for tc in tool_calls)))
+        if started:
+            await asyncio.wait(started.values())
+        return [await (started.get(tc.id) or self._execute_tool(tc)) for tc in tool_calls]
+
+    def _is_serialized(self, tool_call: ToolCall) -> bool:
+        """Check whether a tool call must not run concurrently with others."""
+        tool = self._tools.get(tool_call.name)
+        return tool is not None and tool.serialize
+
     async def _execute_tool(self, tool_call: ToolCall) -> tuple[Any, bool]:
         """Execute a tool call.
 
@@ -252,15 +375,29 @@ class AgentController:
             tool_call: Tool call to execute.
 
         Returns:
-            Tuple of (result, is_error).
+            Tuple of (result encoded as a JSON string, is_error).
         """
         try:
-            result = await self._tools.execute(tool_call.name, **tool_call.input)
+            async with self._tool_semaphore:
+                result = await self._tools.execute(tool_call.name, **tool_call.input)
+            if not isinstance(result, str):
+                # Search and thread results can be tens of KB; encode them off the event loop.
+                # Tools return datetimes as-is and orjson writes them in ISO 8601.
+                encoded = await asyncio.to_thread(orjson.dumps, result, default=str, option=orjson.OPT_NON_STR_KEYS)
+                result = encoded.decode()
             return result, False
         except Exception as e:
             logger.exception(f'Tool execution failed: {tool_call.name}')
             return f'Error executing tool: {e!s}', True
 
+    async def close(self) -> None:
+        """Persist any pending session state. Call before shutdown.
+
+        The LLM client is shared process-wide and closed separately with
+        close_llm_clients().
+        """
+        self._session_storage.flush()
+
     def clear_conversation(self) -> None:
         """Clear the conversation history."""
         self._conversation.clear()
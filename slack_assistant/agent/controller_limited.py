@@ -22,7 +22,7 @@ class LimitedAgentController(AgentController):
     This controller replaces the standard ConversationManager with a
     SummarizingConversationManager that keeps context bounded by:
     1. Maintaining a rolling window of recent messages
-    2. Summarizing older messages beyond the window
+    2. Summarizing older messages beyond the window (in a background task)
     3. Injecting summaries at the start of context
 
     This prevents unbounded token growth while preserving conversation continuity.
@@ -44,7 +44,7 @@ class LimitedAgentController(AgentController):
             repository: Database repository.
             llm_client: LLM client (defaults to config-based).
             preference_storage: Preference storage (defaults to file-based).
-            session_storage: Session storage (defaults to file-based).
+            session_storage: Session storage (defaults to file-based with debounced writes).
             embedding_service: Embedding service for vector search.
         """
         # Call parent constructor
@@ -77,7 +77,7 @@ class LimitedAgentController(AgentController):
     async def process_message(self, user_input: str) -> AgentResponse:
         """Process a user message with automatic summarization.
 
-        This overrides the parent implementation to add summarization
+        This overrides the parent implementation to schedule summarization
         after tool execution completes in each iteration.
 
         Args:
@@ -90,7 +90,7 @@ class LimitedAgentController(AgentController):
         self._conversation.add_user_message(user_input)
 
         # Get system prompt
-        system_prompt = self._build_system_prompt()
+        system_prompt = await self._build_system_prompt()
 
         # Get tool definitions
         tool_definitions = self._tools.get_tool_definitions()
@@ -104,33 +104,23 @@ class LimitedAgentController(AgentController):
             # Build messages with summary (if any)
             messages = self._conversation.build_messages()
 
-            # Call LLM
-            response = await self._llm.complete(
-                messages=messages,
-                system=system_prompt,
-                tools=tool_definitions,
-            )
+            # Call LLM; independent tools start while the response is still streaming
+            response, started = await self._complete(messages, system_prompt, tool_definitions)
 
             # Track tokens
-            if response.usage:
-                input_tokens = response.usage.get('input_tokens', 0)
-                output_tokens = response.usage.get('output_tokens', 0)
-                total_tokens += input_tokens + output_tokens
-                logger.info(f'Iteration {iteration + 1}: {input_tokens} input tokens, {output_tokens} output tokens')
-
-            # Add assistant response to history
-            tool_call_dicts = None
-            if response.tool_calls:
-                tool_call_dicts = [{'id': tc.id, 'name': tc.name, 'input': tc.input} for tc in response.tool_calls]
-            self._conversation.add_assistant_message(response.text, tool_call_dicts)
-
-            # If no tool calls, we're done
+            total_tokens += self._account_tokens(response, iteration)
+
+            # If no tool calls, record the final reply and we're done
             if not response.has_tool_calls:
-                # Trigger summarization before returning (if needed)
-                await self._conversation.maybe_summarize(self._llm)
+                self._conversation.add_assistant_message(response.text)
+                # Summarize in the background (if needed) while the user reads the reply
+                self._conversation.schedule_summarize(self._llm)
 
-                logger.info(f'Conversation complete: {total_tool_calls} tool calls, {total_tokens} total tokens')
-                logger.info(f'Conversation state: {self._conversation.get_summary()}')
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(
+                        f'Conversation complete: {total_tool_calls} tool calls, {total_tokens} total tokens; '
+                        f'state: {self._conversation.get_summary()}'
+                    )
 
                 return AgentResponse(
                     text=response.text,
@@ -138,21 +128,34 @@ class LimitedAgentController(AgentController):
                     tokens_used=total_tokens,
                 )
 
+            # Add assistant response with its tool calls to history
+            self._conversation.add_assistant_message(response.text, response.tool_calls)
+
             # Execute tools
-            for tool_call in response.tool_calls:
-                total_tool_calls += 1
-                result, is_error = await self._execute_tool(tool_call)
+            total_tool_calls += len(response.tool_calls)
+            results = await self._execute_tool_calls(response.tool_calls, started)
+            for tool_call, (result, is_error) in zip(response.tool_calls, results, strict=True):
                 self._conversation.add_tool_result(tool_call.id, result, is_error)
 
-            # Trigger summarization after tool results added (if needed)
-            await self._conversation.maybe_summarize(self._llm)
+            # Summarize in the background (if needed) so the next LLM call is not delayed
+            self._conversation.schedule_summarize(self._llm)
 
         # Max iterations reached
         logger.warning('Max iterations reached in conversation loop')
-        logger.info(f'Final conversation state: {self._conversation.get_summary()}')
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f'Final conversation state: {self._conversation.get_summary()}')
 
         return AgentResponse(
             text=response.text or 'I apologize, but I encountered an issue processing your request.',
             tool_calls_made=total_tool_calls,
             tokens_used=total_tokens,
         )
+
+    async def close(self) -> None:
+        """Wait for a background summarization to finish, then persist pending session state.
+
+        The LLM client is closed separately, so the summary must complete first
+        or the trimmed messages would be lost.
+        """
+        await self._conversation.wait_for_summary()
+        await super().close()
@@ -1,36 +1,60 @@
 """Conversation history management for the agent."""
 
-import json
 import logging
+from collections import deque
+from collections.abc import Sequence
 from dataclasses import dataclass, field
+from operator import attrgetter, itemgetter
 from typing import Any
 
+import orjson
+
+from slack_assistant.agent.llm.models import ToolCall
+
 
 logger = logging.getLogger(__name__)
 
+_tool_call_attrs = attrgetter('id', 'name', 'input')
+_tool_call_items = itemgetter('id', 'name', 'input')
+
 
 @dataclass
 class ConversationManager:
     """Manages conversation history for LLM interactions."""
 
-    messages: list[dict[str, Any]] = field(default_factory=list)
+    messages: deque[dict[str, Any]] = field(default_factory=deque)
     max_messages: int = 100
 
+    # Per-role message counts, maintained on append/trim so get_summary is O(1)
+    _user_count: int = field(default=0, init=False, repr=False)
+    _assistant_count: int = field(default=0, init=False, repr=False)
+    # Provider-specific conversions of messages, reused by the LLM client across calls
+    llm_message_cache: dict[int, Any] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Bounded deque drops the oldest message on append, so trimming is O(1)
+        self.messages = deque(self.messages, maxlen=self.max_messages)
+        self._user_count = sum(1 for m in self.messages if m.get('role') == 'user')
+        self._assistant_count = sum(1 for m in self.messages if m.get('role') == 'assistant')
+
     def add_user_message(self, content: str) -> None:
         """Add a user message to the conversation.
 
         Args:
             content: The user's message text.
         """
-        self.messages.append({'role': 'user', 'content': content})
-        self._trim_if_needed()
+        self._append({'role': 'user', 'content': content})
 
-    def add_assistant_message(self, content: str | None = None, tool_calls: list[dict[str, Any]] | None = None) -> None:
+    def add_assistant_message(
+        self,
+        content: str | None = None,
+        tool_calls: Sequence[ToolCall | dict[str, Any]] | None = None,
+    ) -> None:
         """Add an assistant message to the conversation.
 
         Args:
             content: The assistant's text response.
-            tool_calls: Tool calls made by the assistant.
+            tool_calls: Tool calls made by the assistant, as ToolCall objects or dicts.
         """
         message: dict[str, Any] = {'role': 'assistant'}
 
@@ -42,19 +66,13 @@ class ConversationManager:
 
         if tool_calls:
             for tc in tool_calls:
-                content_blocks.append(
-                    {
-                        'type': 'tool_use',
-                        'id': tc['id'],
-                        'name': tc['name'],
-                        'input': tc['input'],
-                    }
-                )
+                getter = _tool_call_attrs if isinstance(tc, ToolCall) else _tool_call_items
+                tc_id, tc_name, tc_input = getter(tc)
+                content_blocks.append({'type': 'tool_use', 'id': tc_id, 'name': tc_name, 'input': tc_input})
 
         if content_blocks:
             message['content'] = content_blocks
-            self.messages.append(message)
-            self._trim_if_needed()
+            self._append(message)
         else:
             # Anthropic API requires non-empty content for non-final assistant messages.
             # Skip adding this message if there's no content.
@@ -68,9 +86,13 @@ class ConversationManager:
             result: The result from tool execution.
             is_error: Whether the result is an error.
         """
-        content = result if isinstance(result, str) else json.dumps(result, default=str, indent=2)
+        if isinstance(result, str):
+            content = result
+        else:
+            # Compact encoding; indentation only inflates the tokens sent to the LLM
+            content = orjson.dumps(result, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
 
-        self.messages.append(
+        self._append(
             {
                 'role': 'user',
                 'content': [
@@ -83,11 +105,13 @@ class ConversationManager:
                 ],
             }
         )
-        self._trim_if_needed()
 
     def build_messages(self) -> list[dict[str, Any]]:
         """Build messages list for LLM API call.
 
+        History is kept in a deque, so this materializes it as a list once per
+        call; LLM clients slice and index the result.
+
         Returns:
             List of messages in format suitable for LLM API.
         """
@@ -96,14 +120,25 @@ class ConversationManager:
     def clear(self) -> None:
         """Clear conversation history."""
         self.messages.clear()
-
-    def _trim_if_needed(self) -> None:
-        """Trim old messages if we exceed max_messages."""
-        if len(self.messages) > self.max_messages:
-            # Keep the most recent messages
-            excess = len(self.messages) - self.max_messages
-            self.messages = self.messages[excess:]
-            logger.debug(f'Trimmed {excess} old messages from conversation')
+        self.llm_message_cache.clear()
+        self._user_count = 0
+        self._assistant_count = 0
+
+    def _append(self, message: dict[str, Any]) -> None:
+        """Append a message and update role counts, dropping the oldest if full."""
+        if len(self.messages) == self.max_messages:
+            self._count(self.messages[0], -1)
+            logger.debug('Trimmed 1 old message from conversation')
+        self.messages.append(message)
+        self._count(message, 1)
+
+    def _count(self, message: dict[str, Any], delta: int) -> None:
+        """Adjust the role count for a message by delta."""
+        role = message.get('role')
+        if role == 'user':
+            self._user_count += delta
+        elif role == 'assistant':
+            self._assistant_count += delta
 
     def get_summary(self) -> str:
         """Get a brief summary of the conversation.
@@ -111,6 +146,4 @@ class ConversationManager:
         Returns:
             Summary string.
         """
-        user_count = sum(1 for m in self.messages if m.get('role') == 'user')
-        assistant_count = sum(1 for m in self.messages if m.get('role') == 'assistant')
-        return f'{len(self.messages)} messages ({user_count} user, {assistant_count} assistant)'
+        return f'{len(self.messages)} messages ({self._user_count} user, {self._assistant_count} assistant)'
@@ -1,15 +1,38 @@
 """Conversation history management with summarization for bounded context."""
 
-import json
+import asyncio
 import logging
+from bisect import bisect_left
+from collections.abc import Iterator, Sequence
 from dataclasses import dataclass, field
+from itertools import chain
+from operator import attrgetter, itemgetter
 from typing import Any
 
+import orjson
+
 from slack_assistant.agent.llm.base import BaseLLMClient
+from slack_assistant.agent.llm.models import ToolCall
 
 
 logger = logging.getLogger(__name__)
 
+_tool_call_attrs = attrgetter('id', 'name', 'input')
+_tool_call_items = itemgetter('id', 'name', 'input')
+
+_ROLE_LABELS = {'user': 'USER', 'assistant': 'ASSISTANT', 'tool': 'TOOL'}
+
+MASKED_OBSERVATION = '<MASKED: observation too old>'
+
+
+def _mask_tool_results(message: dict[str, Any]) -> dict[str, Any]:
+    """Return a copy of a tool result message with the result contents replaced by a placeholder."""
+    content = [
+        {**block, 'content': MASKED_OBSERVATION} if block.get('type') == 'tool_result' else block
+        for block in message['content']
+    ]
+    return {**message, 'content': content}
+
 
 @dataclass
 class SummarizingConversationManager:
@@ -30,6 +53,31 @@ class SummarizingConversationManager:
     max_recent_turns: int = 4  # Keep last N user-assistant exchanges in full detail
     max_summary_tokens: int = 1000  # Keep summary under this token estimate
     summarize_threshold: int = 6  # Summarize when conversation exceeds N turns
+    mask_old_observations: bool = True  # Send placeholders for tool results outside the last N-1 turns
+
+    # Per-role message counts and encoded history size, maintained on append so
+    # get_summary and token estimates avoid rescanning or re-serializing history
+    _user_count: int = field(default=0, init=False, repr=False)
+    _assistant_count: int = field(default=0, init=False, repr=False)
+    _history_bytes: int = field(default=0, init=False, repr=False)
+    # Indices into messages of the user messages that start a turn, and of tool result messages
+    _turn_starts: list[int] = field(default_factory=list, init=False, repr=False)
+    _tool_result_indices: list[int] = field(default_factory=list, init=False, repr=False)
+    # Tool result messages masked in the last build_messages call
+    _masked_count: int = field(default=0, init=False, repr=False, compare=False)
+
+    # Summary-prefixed list returned by build_messages, reset whenever messages change
+    _built: list[dict[str, Any]] | None = field(default=None, init=False, repr=False, compare=False)
+    _built_summary: str = field(default='', init=False, repr=False, compare=False)
+    # Provider-specific conversions of messages, reused by the LLM client across calls
+    llm_message_cache: dict[int, Any] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    # Background summarization started by schedule_summarize
+    _pending_summary: asyncio.Task | None = field(default=None, init=False, repr=False, compare=False)
+    _summarize_lock: asyncio.Lock = field(default_factory=asyncio.Lock, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._recount()
 
     def add_user_message(self, content: str) -> None:
         """Add a user message to the conversation.
@@ -37,14 +85,18 @@ class SummarizingConversationManager:
         Args:
             content: The user's message text.
         """
-        self.messages.append({'role': 'user', 'content': content})
+        self._append({'role': 'user', 'content': content})
 
-    def add_assistant_message(self, content: str | None = None, tool_calls: list[dict[str, Any]] | None = None) -> None:
+    def add_assistant_message(
+        self,
+        content: str | None = None,
+        tool_calls: Sequence[ToolCall | dict[str, Any]] | None = None,
+    ) -> None:
         """Add an assistant message to the conversation.
 
         Args:
             content: The assistant's text response.
-            tool_calls: Tool calls made by the assistant.
+            tool_calls: Tool calls made by the assistant, as ToolCall objects or dicts.
         """
         message: dict[str, Any] = {'role': 'assistant'}
 
@@ -56,18 +108,13 @@ class SummarizingConversationManager:
 
         if tool_calls:
             for tc in tool_calls:
-                content_blocks.append(
-                    {
-                        'type': 'tool_use',
-                        'id': tc['id'],
-                        'name': tc['name'],
-                        'input': tc['input'],
-                    }
-                )
+                getter = _tool_call_attrs if isinstance(tc, ToolCall) else _tool_call_items
+                tc_id, tc_name, tc_input = getter(tc)
+                content_blocks.append({'type': 'tool_use', 'id': tc_id, 'name': tc_name, 'input': tc_input})
 
         if content_blocks:
             message['content'] = content_blocks
-            self.messages.append(message)
+            self._append(message)
         else:
             # Anthropic API requires non-empty content for non-final assistant messages.
             # Skip adding this message if there's no content.
@@ -81,9 +128,13 @@ class SummarizingConversationManager:
             result: The result from tool execution.
             is_error: Whether the result is an error.
         """
-        content = result if isinstance(result, str) else json.dumps(result, default=str, indent=2)
+        if isinstance(result, str):
+            content = result
+        else:
+            # Compact encoding; indentation only inflates the tokens sent to the LLM
+            content = orjson.dumps(result, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
 
-        self.messages.append(
+        self._append(
             {
                 'role': 'user',
                 'content': [
@@ -97,9 +148,73 @@ class SummarizingConversationManager:
             }
         )
 
+    def schedule_summarize(self, llm_client: BaseLLMClient) -> asyncio.Task | None:
+        """Trim old messages now and summarize them in a background task.
+
+        Messages older than the recent window are removed from the context
+        immediately, so the next LLM call already sends the smaller history.
+        The removed messages are folded into the summary in the background,
+        keeping the summarization LLM round-trip off the user-facing path.
+
+        Args:
+            llm_client: LLM client to use for generating summaries.
+
+        Returns:
+            The pending summarization task, or None if no summarization is needed.
+        """
+        if self._pending_summary is not None and not self._pending_summary.done():
+            return self._pending_summary
+        self._pending_summary = None
+
+        if self._summarize_lock.locked():
+            # maybe_summarize drops the summarized prefix once its LLM call returns
+            return None
+
+        if self._count_turns() <= self.summarize_threshold:
+            return None
+
+        old_messages, _ = self._split_at_recent_window()
+        if not old_messages:
+            return None
+
+        del self.messages[: len(old_messages)]
+        self._recount()
+        logger.info(f'Trimmed {len(old_messages)} old messages, summarizing them in the background')
+
+        self._pending_summary = asyncio.create_task(self._consolidate(llm_client, old_messages))
+        return self._pending_summary
+
+    async def wait_for_summary(self) -> None:
+        """Wait for a background summarization started by schedule_summarize, if any."""
+        if self._pending_summary is not None:
+            await self._pending_summary
+
+    async def _consolidate(self, llm_client: BaseLLMClient, messages: list[dict[str, Any]]) -> None:
+        """Fold already-trimmed messages into the summary.
+
+        Args:
+            llm_client: LLM client to use for generating summaries.
+            messages: Messages removed from the context by schedule_summarize.
+        """
+        async with self._summarize_lock:
+            try:
+                await self._update_summary(llm_client, messages)
+                logger.info(f'Background summarization complete. Summary length: {len(self.summary)} chars')
+            except Exception as e:
+                logger.error(f'Background summarization failed, {len(messages)} trimmed messages not summarized: {e}')
+
     async def maybe_summarize(self, llm_client: BaseLLMClient) -> None:
         """Trigger summarization if conversation exceeds threshold.
 
+        Args:
+            llm_client: LLM client to use for generating summaries.
+        """
+        async with self._summarize_lock:
+            await self._summarize(llm_client)
+
+    async def _summarize(self, llm_client: BaseLLMClient) -> None:
+        """Summarize old messages if conversation exceeds threshold.
+
         Args:
             llm_client: LLM client to use for generating summaries.
         """
@@ -113,24 +228,17 @@ class SummarizingConversationManager:
 
         try:
             # Extract messages to summarize (keep last max_recent_turns)
-            messages_to_summarize = self._extract_old_messages()
+            messages_to_summarize, _ = self._split_at_recent_window()
 
             if not messages_to_summarize:
                 logger.debug('No old messages to summarize')
                 return
 
-            # Generate summary via LLM
-            new_summary = await self._generate_summary(llm_client, messages_to_summarize)
-
-            # Merge with existing summary if we have one
-            if self.summary:
-                logger.debug('Merging with existing summary')
-                self.summary = await self._merge_summaries(llm_client, self.summary, new_summary)
-            else:
-                self.summary = new_summary
+            await self._update_summary(llm_client, messages_to_summarize)
 
-            # Keep only recent messages
-            self.messages = self._get_recent_messages()
+            # Drop the summarized prefix; messages appended meanwhile are kept
+            del self.messages[: len(messages_to_summarize)]
+            self._recount()
 
             logger.info(f'Summarization complete. Summary length: {len(self.summary)} chars, '
                        f'kept {len(self.messages)} recent messages')
@@ -141,28 +249,73 @@ class SummarizingConversationManager:
             logger.warning('Falling back to simple message truncation')
             # Keep last 20 messages as emergency fallback
             if len(self.messages) > 20:
-                self.messages = self.messages[-20:]
+                del self.messages[:-20]
+                self._recount()
+
+    async def _update_summary(self, llm_client: BaseLLMClient, messages: list[dict[str, Any]]) -> None:
+        """Summarize messages and merge the result into the running summary.
+
+        Args:
+            llm_client: LLM client to use for generation.
+            messages: Messages to summarize.
+        """
+        # One LLM call both summarizes the segment and folds in the existing summary
+        self.summary = await self._generate_summary(llm_client, messages, self.summary)
 
     def build_messages(self) -> list[dict[str, Any]]:
         """Build messages list for LLM API call with summary prepended.
 
+        With ``mask_old_observations``, tool results from turns before the last
+        ``max_recent_turns - 1`` are sent as a short placeholder; the full results
+        stay in ``messages`` for summarization.
+
+        Without a summary or masked results the history list itself is returned
+        to avoid a copy per LLM call. Otherwise the list is built once and reused
+        until messages or the summary change. Callers must treat it as read-only.
+
         Returns:
             List of messages in format suitable for LLM API.
         """
-        if not self.summary:
-            return list(self.messages)
+        masked = bisect_left(self._tool_result_indices, self._mask_boundary()) if self.mask_old_observations else 0
+        self._masked_count = masked
+        if not self.summary and not masked:
+            return self.messages
+
+        if self._built is None or self._built_summary is not self.summary:
+            history = self.messages
+            if masked:
+                history = history.copy()
+                for idx in self._tool_result_indices[:masked]:
+                    history[idx] = _mask_tool_results(history[idx])
+                logger.debug(f'Masked {masked} old tool result messages')
 
-        # Inject summary as first user message
-        summary_message = {
-            'role': 'user',
-            'content': f'[Context Summary from earlier in conversation]\n{self.summary}\n[End of summary]',
-        }
-        return [summary_message, *list(self.messages)]
+            if self.summary:
+                # Inject summary as first user message
+                summary_message = {
+                    'role': 'user',
+                    'content': f'[Context Summary from earlier in conversation]\n{self.summary}\n[End of summary]',
+                }
+                self._built = [summary_message, *history]
+            else:
+                self._built = history
+            self._built_summary = self.summary
+        return self._built
 
     def clear(self) -> None:
         """Clear conversation history and summary."""
+        if self._pending_summary is not None:
+            self._pending_summary.cancel()
+            self._pending_summary = None
         self.messages.clear()
+        self.llm_message_cache.clear()
         self.summary = ""
+        self._user_count = 0
+        self._assistant_count = 0
+        self._history_bytes = 0
+        self._turn_starts.clear()
+        self._tool_result_indices.clear()
+        self._masked_count = 0
+        self._built = None
 
     def get_summary(self) -> str:
         """Get a brief summary of the conversation state.
@@ -170,13 +323,64 @@ class SummarizingConversationManager:
         Returns:
             Summary string with message counts and summarization status.
         """
-        user_count = sum(1 for m in self.messages if m.get('role') == 'user')
-        assistant_count = sum(1 for m in self.messages if m.get('role') == 'assistant')
         turn_count = self._count_turns()
 
         summary_status = f', has summary ({len(self.summary)} chars)' if self.summary else ''
-        return (f'{len(self.messages)} messages ({user_count} user, {assistant_count} assistant), '
-                f'{turn_count} turns{summary_status}')
+        masked_status = f', {self._masked_count} tool results masked' if self._masked_count else ''
+        return (f'{len(self.messages)} messages ({self._user_count} user, {self._assistant_count} assistant), '
+                f'{turn_count} turns{summary_status}{masked_status}, ~{self.estimated_tokens} tokens')
+
+    @property
+    def estimated_tokens(self) -> int:
+        """Rough token count of the context sent to the LLM (~4 bytes of JSON per token)."""
+        return (self._history_bytes + len(self.summary)) // 4
+
+    def _append(self, message: dict[str, Any]) -> None:
+        """Append a message and update role counts, turn and tool result indices and history size."""
+        self._built = None
+        if self._is_turn_start(message):
+            self._turn_starts.append(len(self.messages))
+        elif message['role'] == 'user':
+            self._tool_result_indices.append(len(self.messages))
+        self.messages.append(message)
+        self._history_bytes += len(orjson.dumps(message, default=str))
+        role = message['role']
+        if role == 'user':
+            self._user_count += 1
+        elif role == 'assistant':
+            self._assistant_count += 1
+
+    def _recount(self) -> None:
+        """Recompute role counts, turn and tool result indices and history size after the message list is replaced."""
+        self._built = None
+        turn_starts: list[int] = []
+        tool_result_indices: list[int] = []
+        user_count = assistant_count = history_bytes = 0
+        starts_turn = self._is_turn_start
+        dumps = orjson.dumps
+        for idx, msg in enumerate(self.messages):
+            role = msg.get('role')
+            if role == 'user':
+                user_count += 1
+                if starts_turn(msg):
+                    turn_starts.append(idx)
+                else:
+                    tool_result_indices.append(idx)
+            elif role == 'assistant':
+                assistant_count += 1
+            history_bytes += len(dumps(msg, default=str))
+        self._turn_starts = turn_starts
+        self._tool_result_indices = tool_result_indices
+        self._user_count = user_count
+        self._assistant_count = assistant_count
+        self._history_bytes = history_bytes
+
+    def _mask_boundary(self) -> int:
+        """Index of the first message whose tool results are sent in full."""
+        keep_turns = max(self.max_recent_turns - 1, 1)
+        if len(self._turn_starts) <= keep_turns:
+            return 0
+        return self._turn_starts[-keep_turns]
 
     def _count_turns(self) -> int:
         """Count completed user-assistant exchange turns.
@@ -187,23 +391,35 @@ class SummarizingConversationManager:
         Returns:
             Number of turns in the conversation.
         """
-        count = 0
-        for msg in self.messages:
-            # User messages that are NOT tool results indicate a new turn
-            if msg['role'] == 'user':
-                content = msg.get('content', '')
-                if isinstance(content, str):
-                    # Text message = new turn
-                    count += 1
-                elif isinstance(content, list):
-                    # Check if it's a tool_result
-                    has_tool_result = any(
-                        isinstance(c, dict) and c.get('type') == 'tool_result'
-                        for c in content
-                    )
-                    if not has_tool_result:
-                        count += 1
-        return count
+        return len(self._turn_starts)
+
+    @staticmethod
+    def _is_turn_start(msg: dict[str, Any]) -> bool:
+        """Check whether a message is a user message that starts a new turn (not a tool result)."""
+        if msg['role'] != 'user':
+            return False
+        content = msg.get('content', '')
+        if isinstance(content, str):
+            return True
+        if isinstance(content, list):
+            return not any(isinstance(c, dict) and c.get('type') == 'tool_result' for c in content)
+        return False
+
+    def _split_at_recent_window(self) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+        """Split messages into the old part to summarize and the recent window to keep.
+
+        Splits at the start of the last max_recent_turns turns, looked up from
+        the turn start indices maintained on append.
+
+        Returns:
+            Tuple of (old messages, recent messages).
+        """
+        if len(self._turn_starts) <= self.max_recent_turns:
+            # All messages are within recent window
+            return [], list(self.messages)
+
+        recent_start_idx = self._turn_starts[-self.max_recent_turns]
+        return self.messages[:recent_start_idx], self.messages[recent_start_idx:]
 
     def _extract_old_messages(self) -> list[dict[str, Any]]:
         """Extract messages beyond the recent window for summarization.
@@ -211,14 +427,7 @@ class SummarizingConversationManager:
         Returns:
             List of old messages to be summarized.
         """
-        recent_messages = self._get_recent_messages()
-        # Find index where recent messages start
-        if not recent_messages:
-            return list(self.messages)
-
-        # Get all messages up to (but not including) the recent window
-        recent_start_idx = len(self.messages) - len(recent_messages)
-        return self.messages[:recent_start_idx]
+        return self._split_at_recent_window()[0]
 
     def _get_recent_messages(self) -> list[dict[str, Any]]:
         """Get the recent message window to preserve in full detail.
@@ -226,41 +435,28 @@ class SummarizingConversationManager:
         Returns:
             List of recent messages (last max_recent_turns).
         """
-        # Find indices of user messages that start turns (not tool results)
-        turn_indices: list[int] = []
-        for idx, msg in enumerate(self.messages):
-            if msg['role'] == 'user':
-                content = msg.get('content', '')
-                if isinstance(content, str):
-                    turn_indices.append(idx)
-                elif isinstance(content, list):
-                    has_tool_result = any(
-                        isinstance(c, dict) and c.get('type') == 'tool_result'
-                        for c in content
-                    )
-                    if not has_tool_result:
-                        turn_indices.append(idx)
-
-        if len(turn_indices) <= self.max_recent_turns:
-            # All messages are within recent window
-            return list(self.messages)
+        return self._split_at_recent_window()[1]
 
-        # Get the start index of the recent window
-        recent_start_idx = turn_indices[-self.max_recent_turns]
-        return self.messages[recent_start_idx:]
-
-    async def _generate_summary(self, llm_client: BaseLLMClient, messages: list[dict[str, Any]]) -> str:
+    async def _generate_summary(
+        self, llm_client: BaseLLMClient, messages: list[dict[str, Any]], previous_summary: str = ''
+    ) -> str:
         """Generate compact summary of messages using LLM.
 
+        When a previous summary exists, the LLM extends it with the new segment
+        in the same request instead of summarizing and merging separately.
+
         Args:
             llm_client: LLM client to use for generation.
             messages: Messages to summarize.
+            previous_summary: Running summary of earlier messages, if any.
 
         Returns:
             Concise summary text.
         """
-        formatted_messages = self._format_messages_for_summary(messages)
-        prompt = f"""Summarize this conversation segment concisely (max 200 words):
+        if previous_summary:
+            logger.debug('Extending existing summary')
+            header = f"""Extend this running summary with the new conversation segment.
+Return ONE concise summary (max 250 words).
 
 Focus on:
 - Key facts discovered (channels, users, priorities, message IDs)
@@ -268,44 +464,31 @@ Focus on:
 - Items marked as reviewed, deferred, or acted upon
 - Important context for continuing the conversation
 
-Be extremely concise. Omit greetings and redundant information.
+Prioritize recent information over older information.
 Preserve specific identifiers (channel names, user names, timestamps) when mentioned.
 
-Conversation to summarize:
-{formatted_messages}
-"""
-        response = await llm_client.complete(
-            messages=[{'role': 'user', 'content': prompt}],
-            system=(
-                'You are a concise summarization assistant. '
-                'Your summaries are factual, brief, and preserve key details.'
-            ),
-            max_tokens=500,  # Force brevity
-        )
-        return response.text or ''
-
-    async def _merge_summaries(self, llm_client: BaseLLMClient, old_summary: str, new_summary: str) -> str:
-        """Merge two summaries into one condensed summary.
+Previous summary:
+{previous_summary}
 
-        Args:
-            llm_client: LLM client to use for merging.
-            old_summary: Older summary text.
-            new_summary: Recent summary text.
+New segment:"""
+            max_tokens = 600
+        else:
+            header = """Summarize this conversation segment concisely (max 200 words):
 
-        Returns:
-            Merged summary text.
-        """
-        prompt = f"""Merge these two summaries into ONE concise summary (max 250 words):
+Focus on:
+- Key facts discovered (channels, users, priorities, message IDs)
+- Actions taken or decisions made
+- Items marked as reviewed, deferred, or acted upon
+- Important context for continuing the conversation
 
-Summary 1 (older):
-{old_summary}
+Be extremely concise. Omit greetings and redundant information.
+Preserve specific identifiers (channel names, user names, timestamps) when mentioned.
 
-Summary 2 (recent):
-{new_summary}
+Conversation to summarize:"""
+            max_tokens = 500  # Force brevity
 
-Create a single merged summary. Prioritize recent information over older information.
-Preserve key facts, channel names, user names, and important decisions.
-"""
+        # Join header, formatted lines and trailing newline at once, without an intermediate transcript string
+        prompt = '\n'.join(chain((header,), self._format_messages_for_summary(messages), ('',)))
 
         response = await llm_client.complete(
             messages=[{'role': 'user', 'content': prompt}],
@@ -313,38 +496,34 @@ Preserve key facts, channel names, user names, and important decisions.
                 'You are a concise summarization assistant. '
                 'Your summaries are factual, brief, and preserve key details.'
             ),
-            max_tokens=600,
+            max_tokens=max_tokens,
         )
         return response.text or ''
 
-    def _format_messages_for_summary(self, messages: list[dict[str, Any]]) -> str:
-        """Format messages into readable text for summarization.
+    def _format_messages_for_summary(self, messages: list[dict[str, Any]]) -> Iterator[str]:
+        """Format messages into readable lines for summarization, one per message or content block.
 
         Args:
             messages: Messages to format.
 
-        Returns:
-            Formatted text representation.
+        Yields:
+            Formatted lines.
         """
-        lines = []
         for msg in messages:
             role = msg.get('role', 'unknown')
+            label = _ROLE_LABELS.get(role) or role.upper()
             content = msg.get('content', '')
 
             if isinstance(content, str):
-                lines.append(f'{role.upper()}: {content[:500]}')  # Truncate long messages
+                yield f'{label}: {content[:500]}'  # Truncate long messages
             elif isinstance(content, list):
                 # Handle structured content (tool_use, tool_result, etc.)
                 for block in content:
                     if isinstance(block, dict):
                         block_type = block.get('type', 'unknown')
                         if block_type == 'text':
-                            lines.append(f'{role.upper()}: {block.get("text", "")[:500]}')
+                            yield f'{label}: {block.get("text", "")[:500]}'
                         elif block_type == 'tool_use':
-                            tool_name = block.get('name', 'unknown')
-                            lines.append(f'{role.upper()}: [called tool: {tool_name}]')
+                            yield f'{label}: [called tool: {block.get("name", "unknown")}]'
                         elif block_type == 'tool_result':
-                            result_text = str(block.get('content', ''))[:300]
-                            lines.append(f'{role.upper()}: [tool result: {result_text}...]')
-
-        return '\n'.join(lines)
+                            yield f'{label}: [tool result: {str(block.get("content", ""))[:300]}...]'
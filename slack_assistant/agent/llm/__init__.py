@@ -1,12 +1,18 @@
 """LLM provider abstraction layer."""
 
 from slack_assistant.agent.llm.base import BaseLLMClient
-from slack_assistant.agent.llm.models import LLMResponse, ToolCall
+from slack_assistant.agent.llm.models import LLMResponse, TokenUsage, ToolCall
+
+
+_clients: dict[str, BaseLLMClient] = {}
 
 
 def get_llm_client(provider: str | None = None) -> BaseLLMClient:
     """Factory to get LLM client based on config.
 
+    Clients are created once per provider and shared by all callers in the
+    process; the SDK clients are safe for concurrent requests.
+
     Args:
         provider: LLM provider name ('anthropic', 'openai').
                   If None, uses config.llm_provider.
@@ -19,24 +25,45 @@ def get_llm_client(provider: str | None = None) -> BaseLLMClient:
     """
     from slack_assistant.config import get_config
 
-    config = get_config()
-    provider = provider or config.llm_provider
+    provider = provider or get_config().llm_provider
+    client = _clients.get(provider)
+    if client is not None:
+        return client
 
     if provider == 'anthropic':
         from slack_assistant.agent.llm.anthropic import AnthropicClient
 
-        return AnthropicClient()
+        client = AnthropicClient()
     elif provider == 'openai':
         from slack_assistant.agent.llm.openai import OpenAIClient
 
-        return OpenAIClient()
+        client = OpenAIClient()
     else:
         raise ValueError(f'Unknown LLM provider: {provider}')
 
+    _clients[provider] = client
+    return client
+
+
+async def close_llm_clients() -> None:
+    """Close all shared LLM clients. Call once at shutdown."""
+    clients = list(_clients.values())
+    _clients.clear()
+    for client in clients:
+        await client.aclose()
+
+
+def reset_llm_client_cache() -> None:
+    """Forget shared LLM clients without closing them (for tests)."""
+    _clients.clear()
+
 
 __all__ = [
     'BaseLLMClient',
     'LLMResponse',
+    'TokenUsage',
     'ToolCall',
+    'close_llm_clients',
     'get_llm_client',
+    'reset_llm_client_cache',
 ]
@@ -1,41 +1,105 @@
 """Anthropic Claude LLM client."""
 
-import json
 import logging
+from collections.abc import Callable
 from typing import Any
 
-from anthropic import AsyncAnthropic
+import orjson
+from anthropic import AsyncAnthropic, DefaultAsyncHttpxClient
 
 from slack_assistant.agent.llm.base import BaseLLMClient
-from slack_assistant.agent.llm.models import LLMResponse, ToolCall
+from slack_assistant.agent.llm.models import LLMResponse, TokenUsage, ToolCall
 from slack_assistant.config import get_config
 
 
 logger = logging.getLogger(__name__)
 
+EPHEMERAL_CACHE = {'type': 'ephemeral'}
+
+_http_client: DefaultAsyncHttpxClient | None = None
+
+
+def _get_http_client() -> DefaultAsyncHttpxClient:
+    """Get the process-wide HTTP/2 connection pool shared by all Anthropic clients."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = DefaultAsyncHttpxClient(http2=True)
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared connection pool."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+def _with_cache_breakpoint(messages: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Mark the last message as a prompt cache breakpoint.
+
+    Everything up to the newest message is resent unchanged on the next tool
+    loop iteration, so marking it lets the provider serve that prefix from
+    cache. The marked message and its last block are copied; the conversation
+    history itself is not modified.
+
+    Args:
+        messages: Conversation history.
+
+    Returns:
+        Messages with cache_control set on the last content block.
+    """
+    if not messages:
+        return messages
+
+    last = messages[-1]
+    content = last.get('content')
+    if isinstance(content, str):
+        blocks = [{'type': 'text', 'text': content, 'cache_control': EPHEMERAL_CACHE}]
+    elif content:
+        blocks = [*content[:-1], {**content[-1], 'cache_control': EPHEMERAL_CACHE}]
+    else:
+        return messages
+
+    return [*messages[:-1], {**last, 'content': blocks}]
+
 
 class AnthropicClient(BaseLLMClient):
     """Anthropic Claude API client."""
 
     def __init__(self):
         config = get_config()
-        self.client = AsyncAnthropic(api_key=config.anthropic_api_key)
+        # All clients in the process share one keep-alive HTTP/2 connection pool, so
+        # back-to-back and concurrent requests skip TCP/TLS setup
+        self.client = AsyncAnthropic(
+            api_key=config.anthropic_api_key,
+            http_client=_get_http_client(),
+        )
         self.model = config.llm_model
+        # Last tool definitions list seen and its formatted form; the registry hands out the same list every turn
+        self._tools_cache: tuple[list[dict[str, Any]] | None, list[dict[str, Any]]] = (None, [])
 
     async def complete(
         self,
         messages: list[dict[str, Any]],
-        system: str | None = None,
+        system: str | list[dict[str, Any]] | None = None,
         tools: list[dict[str, Any]] | None = None,
         max_tokens: int = 4096,
+        on_tool_call: Callable[[ToolCall], None] | None = None,
+        message_cache: dict[int, Any] | None = None,
     ) -> LLMResponse:
         """Send a completion request to Claude.
 
+        With ``on_tool_call`` the response is streamed, and each tool_use block
+        is handed over as soon as Claude finishes generating it.
+
         Args:
             messages: Conversation history.
-            system: System prompt.
+            system: System prompt, as a string or a list of text blocks.
             tools: Tool definitions.
             max_tokens: Maximum tokens in response.
+            on_tool_call: Called with each tool call as soon as it is complete.
+            message_cache: Unused; messages are already in Anthropic format.
 
         Returns:
             LLMResponse with text, tool calls, and metadata.
@@ -44,24 +108,49 @@ class AnthropicClient(BaseLLMClient):
         kwargs: dict[str, Any] = {
             'model': self.model,
             'max_tokens': max_tokens,
-            'messages': messages,
+            'messages': _with_cache_breakpoint(messages),
         }
 
-        if system:
-            kwargs['system'] = system
+        if isinstance(system, str):
+            # Mark the system prompt as a cache breakpoint so the tool loop reuses the prefill
+            kwargs['system'] = [{'type': 'text', 'text': system, 'cache_control': EPHEMERAL_CACHE}]
+        elif system:
+            # Mark the leading block (static instructions) and the last one, so a change in the
+            # per-user context still reuses the cached instructions
+            kwargs['system'] = [
+                {**block, 'cache_control': EPHEMERAL_CACHE} if idx in (0, len(system) - 1) else block
+                for idx, block in enumerate(system)
+            ]
 
         if tools:
-            kwargs['tools'] = self._format_tools(tools)
+            if self._tools_cache[0] is not tools:
+                self._tools_cache = (tools, self._format_tools(tools))
+            kwargs['tools'] = self._tools_cache[1]
 
         logger.debug(f'Sending request to Anthropic: {len(messages)} messages')
 
-        response = await self.client.messages.create(**kwargs)
+        if on_tool_call is None:
+            response = await self.client.messages.create(**kwargs)
+        else:
+            async with self.client.messages.stream(**kwargs) as stream:
+                async for event in stream:
+                    if event.type == 'content_block_stop' and event.content_block.type == 'tool_use':
+                        block = event.content_block
+                        on_tool_call(ToolCall(id=block.id, name=block.name, input=block.input))
+                response = await stream.get_final_message()
 
         # Log token usage concisely
-        logger.info(f'LLM ▸ {response.usage.input_tokens}→{response.usage.output_tokens} tokens')
+        logger.info(
+            f'LLM ▸ {response.usage.input_tokens}→{response.usage.output_tokens} tokens '
+            f'(cache read {response.usage.cache_read_input_tokens or 0})'
+        )
 
         return self._parse_response(response)
 
+    async def aclose(self) -> None:
+        """Close the shared HTTP connection pool. Call once at shutdown."""
+        await close_http_client()
+
     def format_tool_result(self, tool_use_id: str, result: Any, is_error: bool = False) -> dict[str, Any]:
         """Format a tool result for Anthropic's API.
 
@@ -73,7 +162,10 @@ class AnthropicClient(BaseLLMClient):
         Returns:
             Anthropic-formatted tool result message.
         """
-        content = result if isinstance(result, str) else json.dumps(result, default=str)
+        if isinstance(result, str):
+            content = result
+        else:
+            content = orjson.dumps(result, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
 
         return {
             'role': 'user',
@@ -90,6 +182,9 @@ class AnthropicClient(BaseLLMClient):
     def _format_tools(self, tools: list[dict[str, Any]]) -> list[dict[str, Any]]:
         """Format tools for Anthropic's API.
 
+        The last tool is marked as a cache breakpoint: tool definitions come
+        first in the prompt and never change within a session.
+
         Args:
             tools: Provider-agnostic tool definitions.
 
@@ -105,6 +200,8 @@ class AnthropicClient(BaseLLMClient):
                     'input_schema': tool['input_schema'],
                 }
             )
+        if anthropic_tools:
+            anthropic_tools[-1]['cache_control'] = EPHEMERAL_CACHE
         return anthropic_tools
 
     def _parse_response(self, response) -> LLMResponse:
@@ -123,21 +220,18 @@ class AnthropicClient(BaseLLMClient):
             if block.type == 'text':
                 text_parts.append(block.text)
             elif block.type == 'tool_use':
-                tool_calls.append(
-                    ToolCall(
-                        id=block.id,
-                        name=block.name,
-                        input=block.input,
-                    )
-                )
+                # block.input is already a dict from the SDK; keep the reference
+                tool_calls.append(ToolCall(id=block.id, name=block.name, input=block.input))
 
         return LLMResponse(
-            text='\n'.join(text_parts) if text_parts else None,
-            tool_calls=tool_calls if tool_calls else None,
+            text='\n'.join(text_parts) or None,
+            tool_calls=tool_calls or None,
             stop_reason=response.stop_reason,
-            usage={
-                'input_tokens': response.usage.input_tokens,
-                'output_tokens': response.usage.output_tokens,
-            },
+            usage=TokenUsage(
+                input_tokens=response.usage.input_tokens,
+                output_tokens=response.usage.output_tokens,
+                cache_creation_input_tokens=response.usage.cache_creation_input_tokens or 0,
+                cache_read_input_tokens=response.usage.cache_read_input_tokens or 0,
+            ),
             raw_response=response,
         )
@@ -1,9 +1,10 @@
 """Base class for LLM clients."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Callable
 from typing import Any
 
-from slack_assistant.agent.llm.models import LLMResponse
+from slack_assistant.agent.llm.models import LLMResponse, ToolCall
 
 
 class BaseLLMClient(ABC):
@@ -13,17 +14,23 @@ class BaseLLMClient(ABC):
     async def complete(
         self,
         messages: list[dict[str, Any]],
-        system: str | None = None,
+        system: str | list[dict[str, Any]] | None = None,
         tools: list[dict[str, Any]] | None = None,
         max_tokens: int = 4096,
+        on_tool_call: Callable[[ToolCall], None] | None = None,
+        message_cache: dict[int, Any] | None = None,
     ) -> LLMResponse:
         """Send a completion request to the LLM.
 
         Args:
             messages: Conversation history in provider-agnostic format.
-            system: System prompt.
+            system: System prompt, as a string or a list of text blocks.
             tools: Tool definitions in provider-agnostic format.
             max_tokens: Maximum tokens in response.
+            on_tool_call: Called with each tool call as soon as it is complete,
+                possibly before the rest of the response has arrived.
+            message_cache: Per-conversation dict the client may use to reuse
+                provider-specific conversions of messages across calls.
 
         Returns:
             LLMResponse with text, tool calls, and metadata.
@@ -41,3 +48,6 @@ class BaseLLMClient(ABC):
         Returns:
             Provider-formatted message dict.
         """
+
+    async def aclose(self) -> None:
+        """Release network resources held by the client."""
@@ -4,7 +4,7 @@ from dataclasses import dataclass, field
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ToolCall:
     """A tool call requested by the LLM."""
 
@@ -13,14 +13,29 @@ class ToolCall:
     input: dict[str, Any]
 
 
-@dataclass
+@dataclass(slots=True)
+class TokenUsage:
+    """Token counts reported for a single LLM request."""
+
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cache_creation_input_tokens: int = 0
+    cache_read_input_tokens: int = 0
+
+    @property
+    def total_tokens(self) -> int:
+        """Input plus output tokens."""
+        return self.input_tokens + self.output_tokens
+
+
+@dataclass(slots=True)
 class LLMResponse:
     """Unified response from any LLM provider."""
 
     text: str | None
     tool_calls: list[ToolCall] | None
     stop_reason: str
-    usage: dict[str, int] | None = None
+    usage: TokenUsage | None = None
     raw_response: Any = field(default=None, repr=False)
 
     @property
@@ -1,11 +1,13 @@
 """OpenAI LLM client (stub for future implementation)."""
 
-import json
 import logging
+from collections.abc import Callable
 from typing import Any
 
+import orjson
+
 from slack_assistant.agent.llm.base import BaseLLMClient
-from slack_assistant.agent.llm.models import LLMResponse, ToolCall
+from slack_assistant.agent.llm.models import LLMResponse, TokenUsage, ToolCall
 from slack_assistant.config import get_config
 
 
@@ -34,28 +36,48 @@ class OpenAIClient(BaseLLMClient):
     async def complete(
         self,
         messages: list[dict[str, Any]],
-        system: str | None = None,
+        system: str | list[dict[str, Any]] | None = None,
         tools: list[dict[str, Any]] | None = None,
         max_tokens: int = 4096,
+        on_tool_call: Callable[[ToolCall], None] | None = None,
+        message_cache: dict[int, Any] | None = None,
     ) -> LLMResponse:
         """Send a completion request to OpenAI.
 
         Args:
             messages: Conversation history.
-            system: System prompt.
+            system: System prompt, as a string or a list of text blocks.
             tools: Tool definitions.
             max_tokens: Maximum tokens in response.
+            on_tool_call: Called with each tool call once the response is parsed.
+            message_cache: Converted messages from the caller's previous request,
+                updated in place; only messages not found in it are converted.
 
         Returns:
             LLMResponse with text, tool calls, and metadata.
         """
         # Prepend system message if provided
         formatted_messages = []
+        if isinstance(system, list):
+            system = '\n'.join(block['text'] for block in system)
         if system:
             formatted_messages.append({'role': 'system', 'content': system})
 
+        # Only messages added since the caller's previous request need converting. Entries are
+        # keyed by id() and hold the message itself so a reused id is detected; history
+        # messages are never mutated. The client is shared, so the cache belongs to the caller.
+        previous = message_cache or {}
+        converted = {}
         for msg in messages:
-            formatted_messages.append(self._format_message(msg))
+            entry = previous.get(id(msg))
+            if entry is None or entry[0] is not msg:
+                entry = (msg, self._format_message(msg))
+            converted[id(msg)] = entry
+            formatted_messages.append(entry[1])
+        if message_cache is not None:
+            # Keep only this request's messages so trimmed or summarized history drops out
+            message_cache.clear()
+            message_cache.update(converted)
 
         kwargs: dict[str, Any] = {
             'model': self.model,
@@ -70,7 +92,11 @@ class OpenAIClient(BaseLLMClient):
         logger.debug(f'Sending request to OpenAI: {len(formatted_messages)} messages')
 
         response = await self.client.chat.completions.create(**kwargs)
-        return self._parse_response(response)
+        parsed = self._parse_response(response)
+        if on_tool_call is not None and parsed.tool_calls:
+            for tool_call in parsed.tool_calls:
+                on_tool_call(tool_call)
+        return parsed
 
     def format_tool_result(self, tool_use_id: str, result: Any, is_error: bool = False) -> dict[str, Any]:
         """Format a tool result for OpenAI's API.
@@ -83,7 +109,10 @@ class OpenAIClient(BaseLLMClient):
         Returns:
             OpenAI-formatted tool result message.
         """
-        content = result if isinstance(result, str) else json.dumps(result, default=str)
+        if isinstance(result, str):
+            content = result
+        else:
+            content = orjson.dumps(result, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
 
         if is_error:
             content = f'Error: {content}'
@@ -121,7 +150,7 @@ class OpenAIClient(BaseLLMClient):
                                 'type': 'function',
                                 'function': {
                                     'name': block.get('name'),
-                                    'arguments': json.dumps(block.get('input', {})),
+                                    'arguments': orjson.dumps(block.get('input', {})).decode(),
                                 },
                             }
                         )
@@ -181,26 +210,20 @@ class OpenAIClient(BaseLLMClient):
         choice = response.choices[0]
         message = choice.message
 
-        tool_calls = None
-        if message.tool_calls:
-            tool_calls = []
-            for tc in message.tool_calls:
-                tool_calls.append(
-                    ToolCall(
-                        id=tc.id,
-                        name=tc.function.name,
-                        input=json.loads(tc.function.arguments),
-                    )
-                )
+        loads = orjson.loads
+        tool_calls = [
+            ToolCall(id=tc.id, name=tc.function.name, input=loads(tc.function.arguments))
+            for tc in message.tool_calls or ()
+        ]
 
         return LLMResponse(
             text=message.content,
-            tool_calls=tool_calls,
+            tool_calls=tool_calls or None,
             stop_reason=choice.finish_reason,
-            usage={
-                'input_tokens': response.usage.prompt_tokens,
-                'output_tokens': response.usage.completion_tokens,
-            }
+            usage=TokenUsage(
+                input_tokens=response.usage.prompt_tokens,
+                output_tokens=response.usage.completion_tokens,
+            )
             if response.usage
             else None,
             raw_response=response,
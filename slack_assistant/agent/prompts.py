@@ -1,6 +1,14 @@
 """System prompts for the agent."""
 
-SYSTEM_PROMPT_TEMPLATE = """You are an AI assistant helping the user manage their Slack communications.
+from functools import lru_cache
+from string import Formatter
+from typing import Any
+
+
+# Instructions shared by every session. Kept free of placeholders and sent first so
+# providers can serve it from the prompt cache; per-user context follows in
+# SYSTEM_PROMPT_CONTEXT_TEMPLATE.
+SYSTEM_PROMPT_STATIC = """You are an AI assistant helping the user manage their Slack communications.
 
 Your role is to:
 1. Help the user understand what needs their attention in Slack
@@ -70,7 +78,7 @@ If using the legacy get_status tool, items are pre-prioritized as:
 
 ## Session Continuity
 
-{session_context}
+The current session state is described under "Current Session" below.
 
 When starting a session:
 - If resuming, acknowledge what was previously reviewed and any pending follow-ups
@@ -84,12 +92,21 @@ As you work through items:
 
 ## Communication Patterns
 
-{emoji_patterns}
+The user's known emoji patterns are listed under "Emoji Patterns" below.
 
 When the user tells you about their emoji usage (e.g., "I use 👀 to mean I've seen something"):
 1. Use manage_preferences with add_emoji_pattern action
 2. Set marks_as_handled=true if the emoji means they've addressed/acknowledged the item
 3. These patterns help filter status items automatically
+"""
+
+SYSTEM_PROMPT_CONTEXT_TEMPLATE = """## Current Session
+
+{session_context}
+
+## Emoji Patterns
+
+{emoji_patterns}
 
 ## User Context
 
@@ -101,15 +118,36 @@ When the user tells you about their emoji usage (e.g., "I use 👀 to mean I've
 """
 
 
+# Used for any section the caller leaves empty
+_PROMPT_DEFAULTS = {
+    'user_context': 'No specific user context.',
+    'custom_rules': 'No custom rules defined.',
+    'remembered_facts': 'No remembered facts.',
+    'session_context': 'This is a new session with no previous context.',
+    'emoji_patterns': 'No emoji patterns defined.',
+}
+
+_STATIC_BLOCK = {'type': 'text', 'text': SYSTEM_PROMPT_STATIC}
+
+# (literal text, field name) pairs, parsed once instead of on every str.format call
+_PROMPT_CHUNKS = [(literal, field) for literal, field, _, _ in Formatter().parse(SYSTEM_PROMPT_CONTEXT_TEMPLATE)]
+
+
+@lru_cache(maxsize=32)
 def build_system_prompt(
     user_context: str = '',
     custom_rules: str = '',
     remembered_facts: str = '',
     session_context: str = '',
     emoji_patterns: str = '',
-) -> str:
+) -> list[dict[str, Any]]:
     """Build the system prompt with user-specific context.
 
+    The prompt is returned as two text blocks: the static instructions, which
+    are identical for every session and form a stable prompt-cache prefix, and
+    the user/session context that follows them. Results are memoized on the
+    arguments, so callers must not modify the returned blocks.
+
     Args:
         user_context: Information about the user (e.g., user ID, workspace).
         custom_rules: User-defined prioritization rules.
@@ -118,15 +156,24 @@ def build_system_prompt(
         emoji_patterns: User's emoji communication patterns.
 
     Returns:
-        Complete system prompt.
+        System prompt as a list of text blocks, static instructions first.
     """
-    return SYSTEM_PROMPT_TEMPLATE.format(
-        user_context=user_context or 'No specific user context.',
-        custom_rules=custom_rules or 'No custom rules defined.',
-        remembered_facts=remembered_facts or 'No remembered facts.',
-        session_context=session_context or 'This is a new session with no previous context.',
-        emoji_patterns=emoji_patterns or 'No emoji patterns defined.',
-    )
+    values = {
+        'user_context': user_context,
+        'custom_rules': custom_rules,
+        'remembered_facts': remembered_facts,
+        'session_context': session_context,
+        'emoji_patterns': emoji_patterns,
+    }
+    parts = []
+    for literal, field in _PROMPT_CHUNKS:
+        parts.append(literal)
+        if field is not None:
+            parts.append(values[field] or _PROMPT_DEFAULTS[field])
+    return [
+        _STATIC_BLOCK,
+        {'type': 'text', 'text': ''.join(parts)},
+    ]
 
 
 INITIAL_STATUS_PROMPT = """Please check my Slack status and give me a summary of what needs my attention.
@@ -1,12 +1,12 @@
 """Analysis tool for LLM-based message categorization."""
 
+from collections.abc import Iterator
 from datetime import datetime, timedelta
 from typing import TYPE_CHECKING, Any
 
 from slack_assistant.agent.tools.base import BaseTool
 from slack_assistant.db.repository import Repository
-from slack_assistant.formatting import collect_entities
-from slack_assistant.formatting.patterns import format_text
+from slack_assistant.formatting import TextTemplate, prepare_text
 from slack_assistant.slack.client import SlackClient
 
 
@@ -14,6 +14,57 @@ if TYPE_CHECKING:
     from slack_assistant.session import SessionState
 
 
+_INPUT_SCHEMA: dict[str, Any] = {
+    'type': 'object',
+    'properties': {
+        'hours_back': {
+            'type': 'integer',
+            'description': 'Number of hours to look back (default: 24)',
+            'default': 24,
+            'minimum': 1,
+            'maximum': 168,
+        },
+        'max_messages': {
+            'type': 'integer',
+            'description': 'Maximum number of messages to return (default: 50)',
+            'default': 50,
+            'minimum': 1,
+            'maximum': 100,
+        },
+        'include_own_messages': {
+            'type': 'boolean',
+            'description': 'Include messages sent by the user (default: false, set true for self-DM testing)',
+            'default': False,
+        },
+        'text_limit': {
+            'type': 'integer',
+            'description': 'Maximum characters per message text (default: 500)',
+            'default': 500,
+            'minimum': 100,
+            'maximum': 2000,
+        },
+        'token_limit': {
+            'type': 'integer',
+            'description': 'Approximate tokens per message text; overrides text_limit at ~4 chars per token',
+            'minimum': 25,
+            'maximum': 500,
+        },
+        'exclude_analyzed': {
+            'type': 'boolean',
+            'description': 'Exclude messages already analyzed in this session (default: true)',
+            'default': True,
+        },
+    },
+    'required': [],
+}
+
+
+def _truncate(text: str, limit: int) -> str:
+    """Cut text to at most limit chars plus an ellipsis, preferring a word boundary."""
+    cut = max(text.rfind(' ', 0, limit), text.rfind('\n', 0, limit))
+    return text[: cut if cut > 0 else limit] + '…'
+
+
 class AnalysisTool(BaseTool):
     """Tool for LLM to analyze messages with full content access.
 
@@ -71,43 +122,51 @@ Set exclude_analyzed=false to include them if you need to re-analyze."""
 
     @property
     def input_schema(self) -> dict[str, Any]:
-        return {
-            'type': 'object',
-            'properties': {
-                'hours_back': {
-                    'type': 'integer',
-                    'description': 'Number of hours to look back (default: 24)',
-                    'default': 24,
-                    'minimum': 1,
-                    'maximum': 168,
-                },
-                'max_messages': {
-                    'type': 'integer',
-                    'description': 'Maximum number of messages to return (default: 50)',
-                    'default': 50,
-                    'minimum': 1,
-                    'maximum': 100,
-                },
-                'include_own_messages': {
-                    'type': 'boolean',
-                    'description': 'Include messages sent by the user (default: false, set true for self-DM testing)',
-                    'default': False,
-                },
-                'text_limit': {
-                    'type': 'integer',
-                    'description': 'Maximum characters per message text (default: 500)',
-                    'default': 500,
-                    'minimum': 100,
-                    'maximum': 2000,
-                },
-                'exclude_analyzed': {
-                    'type': 'boolean',
-                    'description': 'Exclude messages already analyzed in this session (default: true)',
-                    'default': True,
-                },
-            },
-            'required': [],
-        }
+        return _INPUT_SCHEMA
+
+    @staticmethod
+    def _iter_formatted(
+        raw_messages: list[dict[str, Any]],
+        templates: list[TextTemplate],
+        links: list[str],
+        user_map: dict[str, str],
+        text_limit: int,
+    ) -> Iterator[dict[str, Any]]:
+        """Yield LLM-facing message dicts one at a time.
+
+        Args:
+            raw_messages: Messages from the repository.
+            templates: Parsed text for each message.
+            links: Slack link for each message.
+            user_map: User ID to display name.
+            text_limit: Maximum characters per message text.
+
+        Yields:
+            Formatted message dicts in input order.
+        """
+        for msg, template, link in zip(raw_messages, templates, links, strict=True):
+            # Fill in user mentions; channel links, URLs, etc. were formatted while parsing
+            text = template.render(user_map)
+            if len(text) > text_limit:
+                text = _truncate(text, text_limit)
+
+            # Resolve user name
+            user_name = user_map.get(msg['user_id'], msg['user_id']) if msg['user_id'] else 'Unknown'
+
+            yield {
+                'id': msg['id'],
+                'channel': msg['channel'],
+                'channel_type': msg['channel_type'],
+                'user': user_name,
+                'is_own_message': msg['is_own_message'],
+                'is_mention': msg['is_mention'],
+                'is_dm': msg['is_dm'],
+                'is_self_dm': msg['is_self_dm'],
+                'text': text,
+                'timestamp': msg['timestamp'],
+                'link': link,
+                'metadata_priority': msg['metadata_priority'],
+            }
 
     async def execute(
         self,
@@ -116,6 +175,7 @@ Set exclude_analyzed=false to include them if you need to re-analyze."""
         include_own_messages: bool = False,
         text_limit: int = 500,
         exclude_analyzed: bool = True,
+        token_limit: int | None = None,
         **kwargs: Any,
     ) -> dict[str, Any]:
         """Analyze recent messages for LLM categorization.
@@ -126,6 +186,7 @@ Set exclude_analyzed=false to include them if you need to re-analyze."""
             include_own_messages: Include messages sent by the user.
             text_limit: Maximum characters per message text.
             exclude_analyzed: Exclude messages already analyzed in this session.
+            token_limit: Approximate tokens per message text; overrides text_limit.
 
         Returns:
             Dict with messages and metadata for LLM analysis.
@@ -134,70 +195,46 @@ Set exclude_analyzed=false to include them if you need to re-analyze."""
         if not user_id:
             return {'error': 'User ID not available. Please ensure Slack client is authenticated.'}
 
+        if token_limit is not None:
+            text_limit = token_limit * 4
+
         since = datetime.now() - timedelta(hours=hours_back)
 
+        # Already-analyzed messages are excluded in the query so the limit is still filled
+        analyzed_keys: set[str] = set()
+        if exclude_analyzed and self._session is not None:
+            analyzed_keys = self._session.get_analyzed_keys()
+
         # Get raw messages from repository
         raw_messages = await self._repository.get_recent_messages_for_analysis(
             user_id=user_id,
             since=since,
             limit=max_messages,
             include_own_messages=include_own_messages,
+            exclude_ids=analyzed_keys,
         )
 
-        # Filter out already-analyzed messages if session is available
-        analyzed_keys: set[str] = set()
-        if exclude_analyzed and self._session is not None:
-            analyzed_keys = self._session.get_analyzed_keys()
-            raw_messages = [
-                msg for msg in raw_messages if msg['id'] not in analyzed_keys
-            ]
-
-        # Collect all user IDs: message senders + users mentioned in text
+        # Parse each text once, collecting all user IDs: message senders + users mentioned in text
         all_user_ids: set[str] = set()
+        templates = []
         for msg in raw_messages:
             if msg['user_id']:
                 all_user_ids.add(msg['user_id'])
-            # Also collect users mentioned in message text
-            entities = collect_entities(msg['text'])
-            all_user_ids |= entities.user_ids
+            template = prepare_text(msg['text'], {})
+            all_user_ids |= template.user_ids
+            templates.append(template)
 
         # Get user info for resolving names
         users = await self._repository.get_users_batch(list(all_user_ids))
         user_map = {u.id: u.display_name or u.real_name or u.name or u.id for u in users}
 
-        # Format messages for LLM
-        messages = []
-        for msg in raw_messages:
-            # Format text to resolve user mentions, channel links, etc.
-            text = format_text(msg['text'], user_map, {})
-            # Truncate if needed
-            if len(text) > text_limit:
-                text = text[:text_limit] + '...'
-
-            # Generate Slack link
-            link = self._client.get_message_link(
-                msg['channel_id'],
-                msg['id'].split(':')[1],  # Extract ts from id
-                msg['thread_ts'],
-            )
-
-            # Resolve user name
-            user_name = user_map.get(msg['user_id'], msg['user_id']) if msg['user_id'] else 'Unknown'
+        # Slack links for all messages in one pass
+        links = self._client.get_message_links(
+            [(msg['channel_id'], msg['ts'], msg['thread_ts']) for msg in raw_messages]
+        )
 
-            messages.append({
-                'id': msg['id'],
-                'channel': msg['channel'],
-                'channel_type': msg['channel_type'],
-                'user': user_name,
-                'is_own_message': msg['is_own_message'],
-                'is_mention': msg['is_mention'],
-                'is_dm': msg['is_dm'],
-                'is_self_dm': msg['is_self_dm'],
-                'text': text,
-                'timestamp': msg['timestamp'],
-                'link': link,
-                'metadata_priority': msg['metadata_priority'],
-            })
+        # The tool protocol needs a complete result, so the generator is drained here
+        messages = list(self._iter_formatted(raw_messages, templates, links, user_map, text_limit))
 
         result: dict[str, Any] = {
             'user_id': user_id,
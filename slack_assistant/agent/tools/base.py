@@ -11,6 +11,9 @@ logger = logging.getLogger(__name__)
 class BaseTool(ABC):
     """Abstract base class for agent tools."""
 
+    # Tools that mutate shared state set this so their calls never overlap with others
+    serialize: bool = False
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -55,6 +58,7 @@ class ToolRegistry:
 
     def __init__(self):
         self._tools: dict[str, BaseTool] = {}
+        self._definitions: list[dict[str, Any]] | None = None
 
     def register(self, tool: BaseTool) -> None:
         """Register a tool.
@@ -63,6 +67,7 @@ class ToolRegistry:
             tool: Tool instance to register.
         """
         self._tools[tool.name] = tool
+        self._definitions = None
         logger.debug(f'Registered tool: {tool.name}')
 
     def get(self, name: str) -> BaseTool | None:
@@ -87,10 +92,15 @@ class ToolRegistry:
     def get_tool_definitions(self) -> list[dict[str, Any]]:
         """Get tool definitions for LLM API.
 
+        Definitions are built once and reused until another tool is
+        registered. Callers must not mutate the returned list.
+
         Returns:
             List of tool definitions.
         """
-        return [tool.to_dict() for tool in self._tools.values()]
+        if self._definitions is None:
+            self._definitions = [tool.to_dict() for tool in self._tools.values()]
+        return self._definitions
 
     async def execute(self, name: str, **kwargs: Any) -> Any:
         """Execute a tool by name.
@@ -1,5 +1,6 @@
 """Context tool for finding related messages."""
 
+import time
 from typing import Any
 
 from slack_assistant.agent.tools.base import BaseTool
@@ -9,14 +10,47 @@ from slack_assistant.services.search import SearchService
 from slack_assistant.slack.client import SlackClient
 
 
+_INPUT_SCHEMA: dict[str, Any] = {
+    'type': 'object',
+    'properties': {
+        'message_link': {
+            'type': 'string',
+            'description': 'Slack message permalink',
+        },
+        'limit': {
+            'type': 'integer',
+            'description': 'Maximum number of related messages (default: 10)',
+            'default': 10,
+            'minimum': 1,
+            'maximum': 25,
+        },
+    },
+    'required': ['message_link'],
+}
+
+
 class ContextTool(BaseTool):
-    """Tool for finding context/related messages."""
+    """Tool for finding context/related messages.
+
+    Results are cached per (message_link, limit) for a few minutes, so follow-up
+    questions about the same message skip the embedding and vector search.
+    """
 
-    def __init__(self, client: SlackClient, repository: Repository, embedding_service: EmbeddingService | None = None):
+    MAX_CACHE_ENTRIES = 128
+
+    def __init__(
+        self,
+        client: SlackClient,
+        repository: Repository,
+        embedding_service: EmbeddingService | None = None,
+        cache_ttl_seconds: int = 300,  # 5 minutes
+    ):
         self._client = client
         self._repository = repository
         self._embedding_service = embedding_service
         self._service = SearchService(client, repository, embedding_service)
+        self._cache_ttl = cache_ttl_seconds
+        self._cache: dict[tuple[str, int], tuple[float, dict[str, Any]]] = {}
 
     @property
     def name(self) -> str:
@@ -30,23 +64,7 @@ Returns messages that are semantically related to the given message."""
 
     @property
     def input_schema(self) -> dict[str, Any]:
-        return {
-            'type': 'object',
-            'properties': {
-                'message_link': {
-                    'type': 'string',
-                    'description': 'Slack message permalink',
-                },
-                'limit': {
-                    'type': 'integer',
-                    'description': 'Maximum number of related messages (default: 10)',
-                    'default': 10,
-                    'minimum': 1,
-                    'maximum': 25,
-                },
-            },
-            'required': ['message_link'],
-        }
+        return _INPUT_SCHEMA
 
     async def execute(
         self,
@@ -63,16 +81,22 @@ Returns messages that are semantically related to the given message."""
         Returns:
             Related messages as dict.
         """
+        key = (message_link, limit)
+        cached = self._cache.get(key)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+
         results = await self._service.find_context(message_link, limit=limit)
 
         if not results:
+            # Not cached: the message may simply not be synced yet
             return {
                 'message_link': message_link,
                 'count': 0,
                 'related_messages': [],
             }
 
-        return {
+        response = {
             'message_link': message_link,
             'count': len(results),
             'related_messages': [
@@ -80,10 +104,21 @@ Returns messages that are semantically related to the given message."""
                     'channel': f'#{result.channel_name}' if result.channel_name else result.message.channel_id,
                     'user': result.user_name or result.message.user_id or 'unknown',
                     'text': result.message.text or '',
-                    'timestamp': result.message.created_at.isoformat() if result.message.created_at else None,
+                    'timestamp': result.message.created_at,
                     'score': round(result.score, 3),
                     'link': result.link,
                 }
                 for result in results
             ],
         }
+
+        self._cache.pop(key, None)
+        if len(self._cache) >= self.MAX_CACHE_ENTRIES:
+            # Dicts keep insertion order, so the first entry is the oldest
+            del self._cache[next(iter(self._cache))]
+        self._cache[key] = (time.monotonic() + self._cache_ttl, response)
+        return response
+
+    def clear_cache(self) -> None:
+        """Clear all cached results."""
+        self._cache.clear()
@@ -1,17 +1,68 @@
 """Preferences tool for managing user preferences and memories."""
 
-from typing import Any
+from collections.abc import Callable
+from typing import Any, ClassVar
 
 from slack_assistant.agent.tools.base import BaseTool
-from slack_assistant.preferences import EmojiPattern, PreferenceStorage, UserFact, UserRule
+from slack_assistant.preferences import EmojiPattern, PreferenceStorage, UserFact, UserPreferences, UserRule
 from slack_assistant.preferences.models import normalize_emoji_name
 
 
+_INPUT_SCHEMA: dict[str, Any] = {
+    'type': 'object',
+    'properties': {
+        'action': {
+            'type': 'string',
+            'enum': [
+                'get_all',
+                'add_rule',
+                'remove_rule',
+                'add_fact',
+                'remove_fact',
+                'add_emoji_pattern',
+                'remove_emoji_pattern',
+                'get_emoji_patterns',
+            ],
+            'description': 'Action to perform',
+        },
+        'content': {
+            'type': 'string',
+            'description': 'Content for add_rule or add_fact actions',
+        },
+        'id': {
+            'type': 'string',
+            'description': 'ID for remove_rule, remove_fact, or remove_emoji_pattern actions',
+        },
+        'emoji': {
+            'type': 'string',
+            'description': 'Emoji name without colons (e.g., "eyes") for emoji pattern actions',
+        },
+        'meaning': {
+            'type': 'string',
+            'description': 'What the emoji means (e.g., "acknowledged", "will review later")',
+        },
+        'marks_as_handled': {
+            'type': 'boolean',
+            'description': 'If true, items with this reaction are considered handled and get lower priority',
+        },
+        'priority_adjustment': {
+            'type': 'integer',
+            'description': 'Priority adjustment from -2 to +2 (default 0)',
+        },
+    },
+    'required': ['action'],
+}
+
+
 class PreferencesTool(BaseTool):
     """Tool for managing user preferences and remembered facts."""
 
+    serialize = True
+
     def __init__(self, storage: 'PreferenceStorage'):
         self._storage = storage
+        # (prefs instance, storage version, response) of the last get_all
+        self._get_all_cache: tuple[UserPreferences, int, dict[str, Any]] | None = None
 
     @property
     def name(self) -> str:
@@ -38,50 +89,7 @@ Use this to:
 
     @property
     def input_schema(self) -> dict[str, Any]:
-        return {
-            'type': 'object',
-            'properties': {
-                'action': {
-                    'type': 'string',
-                    'enum': [
-                        'get_all',
-                        'add_rule',
-                        'remove_rule',
-                        'add_fact',
-                        'remove_fact',
-                        'add_emoji_pattern',
-                        'remove_emoji_pattern',
-                        'get_emoji_patterns',
-                    ],
-                    'description': 'Action to perform',
-                },
-                'content': {
-                    'type': 'string',
-                    'description': 'Content for add_rule or add_fact actions',
-                },
-                'id': {
-                    'type': 'string',
-                    'description': 'ID for remove_rule, remove_fact, or remove_emoji_pattern actions',
-                },
-                'emoji': {
-                    'type': 'string',
-                    'description': 'Emoji name without colons (e.g., "eyes") for emoji pattern actions',
-                },
-                'meaning': {
-                    'type': 'string',
-                    'description': 'What the emoji means (e.g., "acknowledged", "will review later")',
-                },
-                'marks_as_handled': {
-                    'type': 'boolean',
-                    'description': 'If true, items with this reaction are considered handled and get lower priority',
-                },
-                'priority_adjustment': {
-                    'type': 'integer',
-                    'description': 'Priority adjustment from -2 to +2 (default 0)',
-                },
-            },
-            'required': ['action'],
-        }
+        return _INPUT_SCHEMA
 
     async def execute(
         self,
@@ -108,133 +116,138 @@ Use this to:
         Returns:
             Action result.
         """
-        prefs = self._storage.load()
-
-        if action == 'get_all':
-            return {
-                'rules': [{'id': r.id, 'description': r.description, 'created_at': r.created_at} for r in prefs.rules],
-                'facts': [{'id': f.id, 'content': f.content, 'created_at': f.created_at} for f in prefs.facts],
-                'emoji_patterns': [
-                    {
-                        'id': p.id,
-                        'emoji': p.emoji,
-                        'meaning': p.meaning,
-                        'marks_as_handled': p.marks_as_handled,
-                        'priority_adjustment': p.priority_adjustment,
-                    }
-                    for p in prefs.emoji_patterns
-                ],
-            }
-
-        elif action == 'add_rule':
-            if not content:
-                return {'error': 'content is required for add_rule'}
-            rule = UserRule(description=content)
-            prefs.rules.append(rule)
-            self._storage.save(prefs)
-            return {'success': True, 'rule': {'id': rule.id, 'description': rule.description}}
-
-        elif action == 'remove_rule':
-            if not id:
-                return {'error': 'id is required for remove_rule'}
-            original_count = len(prefs.rules)
-            prefs.rules = [r for r in prefs.rules if r.id != id]
-            if len(prefs.rules) < original_count:
-                self._storage.save(prefs)
-                return {'success': True, 'removed_id': id}
-            return {'success': False, 'error': f'Rule with id {id} not found'}
+        handler = self._ACTIONS.get(action)
+        if handler is None:
+            return {'error': f'Unknown action: {action}'}
 
-        elif action == 'add_fact':
-            if not content:
-                return {'error': 'content is required for add_fact'}
-            fact = UserFact(content=content)
-            prefs.facts.append(fact)
-            self._storage.save(prefs)
-            return {'success': True, 'fact': {'id': fact.id, 'content': fact.content}}
-
-        elif action == 'remove_fact':
-            if not id:
-                return {'error': 'id is required for remove_fact'}
-            original_count = len(prefs.facts)
-            prefs.facts = [f for f in prefs.facts if f.id != id]
-            if len(prefs.facts) < original_count:
-                self._storage.save(prefs)
-                return {'success': True, 'removed_id': id}
+        return handler(
+            self,
+            self._storage.load(),
+            content=content,
+            id=id,
+            emoji=emoji,
+            meaning=meaning,
+            marks_as_handled=marks_as_handled,
+            priority_adjustment=priority_adjustment,
+        )
+
+    @staticmethod
+    def _pattern_dict(pattern: EmojiPattern) -> dict[str, Any]:
+        return {
+            'id': pattern.id,
+            'emoji': pattern.emoji,
+            'meaning': pattern.meaning,
+            'marks_as_handled': pattern.marks_as_handled,
+            'priority_adjustment': pattern.priority_adjustment,
+        }
+
+    def _get_all(self, prefs: UserPreferences, **_: Any) -> dict[str, Any]:
+        # Storage hands back the same instance until the file changes, and every mutation saves
+        cached = self._get_all_cache
+        if cached is not None and cached[0] is prefs and cached[1] == self._storage.version:
+            return cached[2]
+
+        response = {
+            'rules': [{'id': r.id, 'description': r.description, 'created_at': r.created_at} for r in prefs.rules],
+            'facts': [{'id': f.id, 'content': f.content, 'created_at': f.created_at} for f in prefs.facts],
+            'emoji_patterns': [self._pattern_dict(p) for p in prefs.emoji_patterns],
+        }
+        self._get_all_cache = (prefs, self._storage.version, response)
+        return response
+
+    def _add_rule(self, prefs: UserPreferences, content: str | None, **_: Any) -> dict[str, Any]:
+        if not content:
+            return {'error': 'content is required for add_rule'}
+        rule = UserRule(description=content)
+        prefs.rules.append(rule)
+        self._storage.save(prefs)
+        return {'success': True, 'rule': {'id': rule.id, 'description': rule.description}}
+
+    def _remove_rule(self, prefs: UserPreferences, id: str | None, **_: Any) -> dict[str, Any]:
+        if not id:
+            return {'error': 'id is required for remove_rule'}
+        if not prefs.remove_rule(id):
+            return {'success': False, 'error': f'Rule with id {id} not found'}
+        self._storage.save(prefs)
+        return {'success': True, 'removed_id': id}
+
+    def _add_fact(self, prefs: UserPreferences, content: str | None, **_: Any) -> dict[str, Any]:
+        if not content:
+            return {'error': 'content is required for add_fact'}
+        fact = UserFact(content=content)
+        prefs.facts.append(fact)
+        self._storage.save(prefs)
+        return {'success': True, 'fact': {'id': fact.id, 'content': fact.content}}
+
+    def _remove_fact(self, prefs: UserPreferences, id: str | None, **_: Any) -> dict[str, Any]:
+        if not id:
+            return {'error': 'id is required for remove_fact'}
+        if not prefs.remove_fact(id):
             return {'success': False, 'error': f'Fact with id {id} not found'}
+        self._storage.save(prefs)
+        return {'success': True, 'removed_id': id}
 
-        elif action == 'add_emoji_pattern':
-            if not emoji:
-                return {'error': 'emoji is required for add_emoji_pattern'}
-            if not meaning:
-                return {'error': 'meaning is required for add_emoji_pattern'}
-
-            # Normalize emoji name to Slack format (underscores, lowercase, no colons)
-            normalized_emoji = normalize_emoji_name(emoji)
-
-            # Check if pattern already exists (using normalized name)
-            existing = prefs.get_emoji_pattern(normalized_emoji)
-            if existing:
-                # Update existing pattern
-                existing.meaning = meaning
-                existing.marks_as_handled = marks_as_handled
-                existing.priority_adjustment = max(-2, min(2, priority_adjustment))
-                self._storage.save(prefs)
-                return {
-                    'success': True,
-                    'updated': True,
-                    'emoji_pattern': {
-                        'id': existing.id,
-                        'emoji': existing.emoji,
-                        'meaning': existing.meaning,
-                        'marks_as_handled': existing.marks_as_handled,
-                        'priority_adjustment': existing.priority_adjustment,
-                    },
-                }
-
-            # Create new pattern with normalized emoji name
-            pattern = EmojiPattern(
-                emoji=normalized_emoji,
-                meaning=meaning,
-                marks_as_handled=marks_as_handled,
-                priority_adjustment=max(-2, min(2, priority_adjustment)),
-            )
-            prefs.emoji_patterns.append(pattern)
+    def _add_emoji_pattern(
+        self,
+        prefs: UserPreferences,
+        emoji: str | None,
+        meaning: str | None,
+        marks_as_handled: bool,
+        priority_adjustment: int,
+        **_: Any,
+    ) -> dict[str, Any]:
+        if not emoji:
+            return {'error': 'emoji is required for add_emoji_pattern'}
+        if not meaning:
+            return {'error': 'meaning is required for add_emoji_pattern'}
+
+        # Normalize emoji name to Slack format (underscores, lowercase, no colons)
+        normalized_emoji = normalize_emoji_name(emoji)
+        priority_adjustment = max(-2, min(2, priority_adjustment))
+
+        # Check if pattern already exists (using normalized name)
+        existing = prefs.get_emoji_pattern(normalized_emoji)
+        if existing:
+            # Update existing pattern
+            existing.meaning = meaning
+            existing.marks_as_handled = marks_as_handled
+            existing.priority_adjustment = priority_adjustment
             self._storage.save(prefs)
-            return {
-                'success': True,
-                'emoji_pattern': {
-                    'id': pattern.id,
-                    'emoji': pattern.emoji,
-                    'meaning': pattern.meaning,
-                    'marks_as_handled': pattern.marks_as_handled,
-                    'priority_adjustment': pattern.priority_adjustment,
-                },
-            }
-
-        elif action == 'remove_emoji_pattern':
-            if not id:
-                return {'error': 'id is required for remove_emoji_pattern'}
-            original_count = len(prefs.emoji_patterns)
-            prefs.emoji_patterns = [p for p in prefs.emoji_patterns if p.id != id]
-            if len(prefs.emoji_patterns) < original_count:
-                self._storage.save(prefs)
-                return {'success': True, 'removed_id': id}
+            return {'success': True, 'updated': True, 'emoji_pattern': self._pattern_dict(existing)}
+
+        # Create new pattern with normalized emoji name
+        pattern = EmojiPattern(
+            emoji=normalized_emoji,
+            meaning=meaning,
+            marks_as_handled=marks_as_handled,
+            priority_adjustment=priority_adjustment,
+        )
+        prefs.emoji_patterns.append(pattern)
+        self._storage.save(prefs)
+        return {'success': True, 'emoji_pattern': self._pattern_dict(pattern)}
+
+    def _remove_emoji_pattern(self, prefs: UserPreferences, id: str | None, **_: Any) -> dict[str, Any]:
+        if not id:
+            return {'error': 'id is required for remove_emoji_pattern'}
+        if not prefs.remove_emoji_pattern(id):
             return {'success': False, 'error': f'Emoji pattern with id {id} not found'}
+        self._storage.save(prefs)
+        return {'success': True, 'removed_id': id}
 
-        elif action == 'get_emoji_patterns':
-            return {
-                'emoji_patterns': [
-                    {
-                        'id': p.id,
-                        'emoji': p.emoji,
-                        'meaning': p.meaning,
-                        'marks_as_handled': p.marks_as_handled,
-                        'priority_adjustment': p.priority_adjustment,
-                    }
-                    for p in prefs.emoji_patterns
-                ],
-                'acknowledgment_emojis': prefs.get_acknowledgment_emojis(),
-            }
-
-        else:
-            return {'error': f'Unknown action: {action}'}
+    def _get_emoji_patterns(self, prefs: UserPreferences, **_: Any) -> dict[str, Any]:
+        return {
+            'emoji_patterns': [self._pattern_dict(p) for p in prefs.emoji_patterns],
+            'acknowledgment_emojis': prefs.get_acknowledgment_emojis(),
+        }
+
+    # Action name -> handler, built once when the class is created
+    _ACTIONS: ClassVar[dict[str, Callable[..., dict[str, Any]]]] = {
+        'get_all': _get_all,
+        'add_rule': _add_rule,
+        'remove_rule': _remove_rule,
+        'add_fact': _add_fact,
+        'remove_fact': _remove_fact,
+        'add_emoji_pattern': _add_emoji_pattern,
+        'remove_emoji_pattern': _remove_emoji_pattern,
+        'get_emoji_patterns': _get_emoji_patterns,
+    }
@@ -1,7 +1,10 @@
 """Search tool for finding Slack messages."""
 
+import time
 from typing import Any
 
+import numpy as np
+
 from slack_assistant.agent.tools.base import BaseTool
 from slack_assistant.db.repository import Repository
 from slack_assistant.services.embeddings import EmbeddingService
@@ -9,14 +12,58 @@ from slack_assistant.services.search import SearchService
 from slack_assistant.slack.client import SlackClient
 
 
+_INPUT_SCHEMA: dict[str, Any] = {
+    'type': 'object',
+    'properties': {
+        'query': {
+            'type': 'string',
+            'description': 'Search query text',
+        },
+        'limit': {
+            'type': 'integer',
+            'description': 'Maximum number of results (default: 10)',
+            'default': 10,
+            'minimum': 1,
+            'maximum': 50,
+        },
+        'use_slack_api': {
+            'type': 'boolean',
+            'description': 'Also search using Slack API (slower but may find more)',
+            'default': False,
+        },
+    },
+    'required': ['query'],
+}
+
+
 class SearchTool(BaseTool):
-    """Tool for searching Slack messages."""
+    """Tool for searching Slack messages.
+
+    When embeddings are available, results are cached for a few minutes and
+    reused for later queries whose embedding is nearly identical (cosine
+    similarity at or above similarity_threshold), skipping the database search.
+    """
+
+    MAX_CACHE_ENTRIES = 128
 
-    def __init__(self, client: SlackClient, repository: Repository, embedding_service: EmbeddingService | None = None):
+    def __init__(
+        self,
+        client: SlackClient,
+        repository: Repository,
+        embedding_service: EmbeddingService | None = None,
+        cache_ttl_seconds: int = 300,  # 5 minutes
+        similarity_threshold: float = 0.95,
+    ):
         self._client = client
         self._repository = repository
         self._embedding_service = embedding_service
         self._service = SearchService(client, repository, embedding_service)
+        self._cache_ttl = cache_ttl_seconds
+        self._similarity_threshold = similarity_threshold
+        # (expires_at, limit, use_slack_api, response), least recently used first,
+        # with the unit-length query embeddings as matching rows of _cache_vectors
+        self._cache: list[tuple[float, int, bool, dict[str, Any]]] = []
+        self._cache_vectors: np.ndarray | None = None
 
     @property
     def name(self) -> str:
@@ -30,28 +77,7 @@ Returns matching messages with relevance scores."""
 
     @property
     def input_schema(self) -> dict[str, Any]:
-        return {
-            'type': 'object',
-            'properties': {
-                'query': {
-                    'type': 'string',
-                    'description': 'Search query text',
-                },
-                'limit': {
-                    'type': 'integer',
-                    'description': 'Maximum number of results (default: 10)',
-                    'default': 10,
-                    'minimum': 1,
-                    'maximum': 50,
-                },
-                'use_slack_api': {
-                    'type': 'boolean',
-                    'description': 'Also search using Slack API (slower but may find more)',
-                    'default': False,
-                },
-            },
-            'required': ['query'],
-        }
+        return _INPUT_SCHEMA
 
     async def execute(
         self,
@@ -70,6 +96,15 @@ Returns matching messages with relevance scores."""
         Returns:
             Search results as dict.
         """
+        embedding = None
+        if self._embedding_service is not None:
+            # Shares the query embedding cache with the vector search below
+            embedding = await self._embedding_service.embed_query(query)
+            if embedding is not None:
+                cached = self._lookup(embedding, limit, use_slack_api)
+                if cached is not None:
+                    return {**cached, 'query': query}
+
         results = await self._service.search(
             query=query,
             limit=limit,
@@ -78,7 +113,7 @@ Returns matching messages with relevance scores."""
             use_slack_api=use_slack_api,
         )
 
-        return {
+        response = {
             'query': query,
             'count': len(results),
             'results': [
@@ -86,7 +121,7 @@ Returns matching messages with relevance scores."""
                     'channel': f'#{result.channel_name}' if result.channel_name else result.message.channel_id,
                     'user': result.user_name or result.message.user_id or 'unknown',
                     'text': result.message.text or '',
-                    'timestamp': result.message.created_at.isoformat() if result.message.created_at else None,
+                    'timestamp': result.message.created_at,
                     'score': round(result.score, 3),
                     'match_type': result.match_type,
                     'link': result.link,
@@ -95,3 +130,66 @@ Returns matching messages with relevance scores."""
                 for result in results
             ],
         }
+
+        if embedding is not None and results:
+            self._store(embedding, limit, use_slack_api, response)
+        return response
+
+    @staticmethod
+    def _unit(embedding: list[float]) -> np.ndarray:
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def _keep_rows(self, keep: np.ndarray) -> None:
+        """Drop cache entries whose position is False in the keep mask."""
+        self._cache = [entry for entry, kept in zip(self._cache, keep, strict=True) if kept]
+        self._cache_vectors = self._cache_vectors[keep] if self._cache else None
+
+    def _store(self, embedding: list[float], limit: int, use_slack_api: bool, response: dict[str, Any]) -> None:
+        vector = self._unit(embedding)[np.newaxis]
+        if self._cache_vectors is not None and self._cache_vectors.shape[1] != vector.shape[1]:
+            # Embedding model changed; old vectors can't be compared
+            self.clear_cache()
+        if len(self._cache) >= self.MAX_CACHE_ENTRIES:
+            self._cache.pop(0)
+            self._cache_vectors = self._cache_vectors[1:]
+        self._cache.append((time.monotonic() + self._cache_ttl, limit, use_slack_api, response))
+        self._cache_vectors = vector if self._cache_vectors is None else np.vstack((self._cache_vectors, vector))
+
+    def _lookup(self, embedding: list[float], limit: int, use_slack_api: bool) -> dict[str, Any] | None:
+        """Find a cached response for a near-identical query with the same options."""
+        if not self._cache:
+            return None
+
+        now = time.monotonic()
+        alive = np.fromiter((entry[0] > now for entry in self._cache), dtype=bool, count=len(self._cache))
+        if not alive.all():
+            self._keep_rows(alive)
+            if not self._cache:
+                return None
+
+        vector = self._unit(embedding)
+        if self._cache_vectors.shape[1] != vector.shape[0]:
+            return None
+
+        # Rows and query are unit length, so the matrix-vector product gives cosine similarities
+        scores = self._cache_vectors @ vector
+        for i, (_, cached_limit, cached_slack_api, _) in enumerate(self._cache):
+            if cached_limit != limit or cached_slack_api != use_slack_api:
+                scores[i] = -np.inf
+
+        best = int(scores.argmax())
+        if scores[best] < self._similarity_threshold:
+            return None
+
+        # Move the hit to the most recently used end
+        order = np.r_[0:best, best + 1 : len(self._cache), best]
+        self._cache.append(self._cache.pop(best))
+        self._cache_vectors = self._cache_vectors[order]
+        return self._cache[-1][3]
+
+    def clear_cache(self) -> None:
+        """Clear all cached results."""
+        self._cache.clear()
+        self._cache_vectors = None
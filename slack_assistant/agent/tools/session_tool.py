@@ -1,6 +1,7 @@
 """Session management tool for tracking processed items."""
 
-from typing import Any
+from collections.abc import Callable
+from typing import Any, ClassVar
 
 from slack_assistant.agent.tools.base import BaseTool
 from slack_assistant.session import (
@@ -11,9 +12,92 @@ from slack_assistant.session import (
 )
 
 
+_INPUT_SCHEMA: dict[str, Any] = {
+    'type': 'object',
+    'properties': {
+        'action': {
+            'type': 'string',
+            'enum': [
+                'get_session_info',
+                'mark_item_reviewed',
+                'mark_item_deferred',
+                'mark_item_acted_on',
+                'set_focus',
+                'save_summary',
+                'get_processed_items',
+                'save_analysis',
+                'get_all_analyses',
+            ],
+            'description': 'Action to perform',
+        },
+        'channel_id': {
+            'type': 'string',
+            'description': 'Slack channel ID (for mark_item_* actions)',
+        },
+        'message_ts': {
+            'type': 'string',
+            'description': 'Message timestamp (for mark_item_* actions)',
+        },
+        'thread_ts': {
+            'type': 'string',
+            'description': 'Thread timestamp (optional, for mark_item_* actions)',
+        },
+        'notes': {
+            'type': 'string',
+            'description': 'Notes about the item (optional, for mark_item_* actions)',
+        },
+        'focus': {
+            'type': 'string',
+            'description': 'Current focus/topic (for set_focus action)',
+        },
+        'summary_text': {
+            'type': 'string',
+            'description': 'Summary of the conversation (for save_summary action)',
+        },
+        'key_topics': {
+            'type': 'array',
+            'items': {'type': 'string'},
+            'description': 'Key topics discussed (for save_summary action)',
+        },
+        'pending_follow_ups': {
+            'type': 'array',
+            'items': {'type': 'string'},
+            'description': 'Pending follow-up items (for save_summary action)',
+        },
+        'priority': {
+            'type': 'string',
+            'enum': ['CRITICAL', 'HIGH', 'MEDIUM', 'LOW'],
+            'description': 'Priority level for the message (for save_analysis action)',
+        },
+        'summary': {
+            'type': 'string',
+            'description': 'Brief description of the message (for save_analysis action)',
+        },
+        'action_needed': {
+            'type': 'string',
+            'description': 'What action is required (optional, for save_analysis action)',
+        },
+        'context_notes': {
+            'type': 'string',
+            'description': 'Relevant context notes (optional, for save_analysis action)',
+        },
+    },
+    'required': ['action'],
+}
+
+
+_MARK_DISPOSITIONS = {
+    'mark_item_reviewed': ItemDisposition.REVIEWED,
+    'mark_item_deferred': ItemDisposition.DEFERRED,
+    'mark_item_acted_on': ItemDisposition.ACTED_ON,
+}
+
+
 class SessionTool(BaseTool):
     """Tool for managing session state and tracking processed items."""
 
+    serialize = True
+
     def __init__(self, storage: SessionStorage, session: SessionState):
         """Initialize the session tool.
 
@@ -23,6 +107,8 @@ class SessionTool(BaseTool):
         """
         self._storage = storage
         self._session = session
+        # Serialized processed items; the list is append-only, so only new items are added
+        self._processed_cache: list[dict[str, Any]] = []
 
     @property
     def name(self) -> str:
@@ -51,78 +137,7 @@ Use this tool to:
 
     @property
     def input_schema(self) -> dict[str, Any]:
-        return {
-            'type': 'object',
-            'properties': {
-                'action': {
-                    'type': 'string',
-                    'enum': [
-                        'get_session_info',
-                        'mark_item_reviewed',
-                        'mark_item_deferred',
-                        'mark_item_acted_on',
-                        'set_focus',
-                        'save_summary',
-                        'get_processed_items',
-                        'save_analysis',
-                        'get_all_analyses',
-                    ],
-                    'description': 'Action to perform',
-                },
-                'channel_id': {
-                    'type': 'string',
-                    'description': 'Slack channel ID (for mark_item_* actions)',
-                },
-                'message_ts': {
-                    'type': 'string',
-                    'description': 'Message timestamp (for mark_item_* actions)',
-                },
-                'thread_ts': {
-                    'type': 'string',
-                    'description': 'Thread timestamp (optional, for mark_item_* actions)',
-                },
-                'notes': {
-                    'type': 'string',
-                    'description': 'Notes about the item (optional, for mark_item_* actions)',
-                },
-                'focus': {
-                    'type': 'string',
-                    'description': 'Current focus/topic (for set_focus action)',
-                },
-                'summary_text': {
-                    'type': 'string',
-                    'description': 'Summary of the conversation (for save_summary action)',
-                },
-                'key_topics': {
-                    'type': 'array',
-                    'items': {'type': 'string'},
-                    'description': 'Key topics discussed (for save_summary action)',
-                },
-                'pending_follow_ups': {
-                    'type': 'array',
-                    'items': {'type': 'string'},
-                    'description': 'Pending follow-up items (for save_summary action)',
-                },
-                'priority': {
-                    'type': 'string',
-                    'enum': ['CRITICAL', 'HIGH', 'MEDIUM', 'LOW'],
-                    'description': 'Priority level for the message (for save_analysis action)',
-                },
-                'summary': {
-                    'type': 'string',
-                    'description': 'Brief description of the message (for save_analysis action)',
-                },
-                'action_needed': {
-                    'type': 'string',
-                    'description': 'What action is required (optional, for save_analysis action)',
-                },
-                'context_notes': {
-                    'type': 'string',
-                    'description': 'Relevant context notes (optional, for save_analysis action)',
-                },
-            },
-            'required': ['action'],
-        }
+        return _INPUT_SCHEMA
 
     async def execute(
         self,
@@ -161,39 +176,30 @@ Use this tool to:
         Returns:
             Action result.
         """
-        if action == 'get_session_info':
-            return self._get_session_info()
-
-        elif action == 'mark_item_reviewed':
-            return self._mark_item(ItemDisposition.REVIEWED, channel_id, message_ts, thread_ts, notes)
-
-        elif action == 'mark_item_deferred':
-            return self._mark_item(ItemDisposition.DEFERRED, channel_id, message_ts, thread_ts, notes)
+        disposition = _MARK_DISPOSITIONS.get(action)
+        if disposition is not None:
+            return self._mark_item(disposition, channel_id, message_ts, thread_ts, notes)
 
-        elif action == 'mark_item_acted_on':
-            return self._mark_item(ItemDisposition.ACTED_ON, channel_id, message_ts, thread_ts, notes)
-
-        elif action == 'set_focus':
-            return self._set_focus(focus)
-
-        elif action == 'save_summary':
-            return self._save_summary(summary_text, key_topics, pending_follow_ups)
-
-        elif action == 'get_processed_items':
-            return self._get_processed_items()
-
-        elif action == 'save_analysis':
-            return self._save_analysis(
-                channel_id, message_ts, thread_ts, priority, summary, action_needed, context_notes
-            )
-
-        elif action == 'get_all_analyses':
-            return self._get_all_analyses()
-
-        else:
+        handler = self._ACTIONS.get(action)
+        if handler is None:
             return {'error': f'Unknown action: {action}'}
 
-    def _get_session_info(self) -> dict[str, Any]:
+        return handler(
+            self,
+            channel_id=channel_id,
+            message_ts=message_ts,
+            thread_ts=thread_ts,
+            focus=focus,
+            summary_text=summary_text,
+            key_topics=key_topics,
+            pending_follow_ups=pending_follow_ups,
+            priority=priority,
+            summary=summary,
+            action_needed=action_needed,
+            context_notes=context_notes,
+        )
+
+    def _get_session_info(self, **_: Any) -> dict[str, Any]:
         """Get current session information."""
         return {
             'session_id': self._session.session_id,
@@ -243,7 +249,7 @@ Use this tool to:
             'processed_at': item.processed_at,
         }
 
-    def _set_focus(self, focus: str | None) -> dict[str, Any]:
+    def _set_focus(self, focus: str | None, **_: Any) -> dict[str, Any]:
         """Set current focus."""
         self._session.current_focus = focus
         self._session.touch()
@@ -259,6 +265,7 @@ Use this tool to:
         summary_text: str | None,
         key_topics: list[str] | None,
         pending_follow_ups: list[str] | None,
+        **_: Any,
     ) -> dict[str, Any]:
         """Save conversation summary."""
         if not summary_text:
@@ -279,9 +286,13 @@ Use this tool to:
             'pending_follow_ups': pending_follow_ups or [],
         }
 
-    def _get_processed_items(self) -> dict[str, Any]:
+    def _get_processed_items(self, **_: Any) -> dict[str, Any]:
         """Get list of processed items."""
-        items = [
+        processed = self._session.processed_items
+        cache = self._processed_cache
+        if len(processed) < len(cache):
+            cache.clear()
+        cache.extend(
             {
                 'channel_id': item.channel_id,
                 'message_ts': item.message_ts,
@@ -290,8 +301,9 @@ Use this tool to:
                 'processed_at': item.processed_at,
                 'notes': item.notes,
             }
-            for item in self._session.processed_items
-        ]
+            for item in processed[len(cache) :]
+        )
+        items = list(cache)
 
         return {
             'session_id': self._session.session_id,
@@ -308,6 +320,7 @@ Use this tool to:
         summary: str | None,
         action_needed: str | None,
         context_notes: str | None,
+        **_: Any,
     ) -> dict[str, Any]:
         """Save LLM's analysis for a message item."""
         if not channel_id or not message_ts:
@@ -341,7 +354,7 @@ Use this tool to:
             'analyzed_at': item.analyzed_at,
         }
 
-    def _get_all_analyses(self) -> dict[str, Any]:
+    def _get_all_analyses(self, **_: Any) -> dict[str, Any]:
         """Get all LLM analyses from this session."""
         items = [
             {
@@ -362,3 +375,13 @@ Use this tool to:
             'total_items': len(items),
             'items': items,
         }
+
+    # Action name -> handler for everything except the mark_item_* actions
+    _ACTIONS: ClassVar[dict[str, Callable[..., dict[str, Any]]]] = {
+        'get_session_info': _get_session_info,
+        'set_focus': _set_focus,
+        'save_summary': _save_summary,
+        'get_processed_items': _get_processed_items,
+        'save_analysis': _save_analysis,
+        'get_all_analyses': _get_all_analyses,
+    }
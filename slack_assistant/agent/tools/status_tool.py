@@ -13,9 +13,34 @@ if TYPE_CHECKING:
     from slack_assistant.session import SessionState
 
 
+# Enum.name goes through a descriptor on every access
+_PRIORITY_NAMES = {p: p.name for p in Priority}
+
+_INPUT_SCHEMA: dict[str, Any] = {
+    'type': 'object',
+    'properties': {
+        'hours_back': {
+            'type': 'integer',
+            'description': 'Number of hours to look back (default: 24)',
+            'default': 24,
+            'minimum': 1,
+            'maximum': 168,
+        },
+        'include_processed': {
+            'type': 'boolean',
+            'description': 'Include items already processed in this session (default: false)',
+            'default': False,
+        },
+    },
+    'required': [],
+}
+
+
 class StatusTool(BaseTool):
     """Tool for getting Slack status and attention-needed items."""
 
+    serialize = True
+
     def __init__(
         self,
         client: SlackClient,
@@ -53,24 +78,7 @@ Items already processed in this session are filtered out unless include_processe
 
     @property
     def input_schema(self) -> dict[str, Any]:
-        return {
-            'type': 'object',
-            'properties': {
-                'hours_back': {
-                    'type': 'integer',
-                    'description': 'Number of hours to look back (default: 24)',
-                    'default': 24,
-                    'minimum': 1,
-                    'maximum': 168,
-                },
-                'include_processed': {
-                    'type': 'boolean',
-                    'description': 'Include items already processed in this session (default: false)',
-                    'default': False,
-                },
-            },
-            'required': [],
-        }
+        return _INPUT_SCHEMA
 
     async def execute(self, hours_back: int = 24, include_processed: bool = False, **kwargs: Any) -> dict[str, Any]:
         """Get Slack status.
@@ -88,42 +96,41 @@ Items already processed in this session are filtered out unless include_processe
         )
 
         # Convert to serializable format
+        counts = status.counts_by_priority
         result: dict[str, Any] = {
-            'generated_at': status.generated_at.isoformat(),
+            'generated_at': status.generated_at,
             'summary': {
                 'total_items': len(status.items),
-                'critical_count': len(status.by_priority[Priority.CRITICAL]),
-                'high_count': len(status.by_priority[Priority.HIGH]),
-                'medium_count': len(status.by_priority[Priority.MEDIUM]),
-                'low_count': len(status.by_priority[Priority.LOW]),
+                'critical_count': counts[Priority.CRITICAL],
+                'high_count': counts[Priority.HIGH],
+                'medium_count': counts[Priority.MEDIUM],
+                'low_count': counts[Priority.LOW],
                 'reminders_count': len(status.reminders),
             },
-            'items': [],
-            'reminders': status.reminders,
-        }
-
-        # Add session info if available
-        if self._session:
-            result['session'] = {
-                'session_id': self._session.session_id,
-                'processed_count': len(self._session.processed_items),
-                'filtered_processed': not include_processed,
-            }
-
-        for item in status.items:
-            result['items'].append(
+            'items': [
                 {
-                    'priority': item.priority.name,
+                    'priority': _PRIORITY_NAMES[item.priority],
                     'channel': item.formatted_channel,
                     'channel_id': item.channel_id,
                     'message_ts': item.message_ts,
                     'user': item.formatted_user,
                     'text_preview': item.text_preview,
-                    'timestamp': item.timestamp.isoformat() if item.timestamp else None,
+                    'timestamp': item.timestamp,
                     'link': item.link,
                     'reason': item.reason,
                     'thread_ts': item.thread_ts,
                 }
-            )
+                for item in status.items
+            ],
+            'reminders': status.reminders,
+        }
+
+        # Add session info if available
+        if self._session:
+            result['session'] = {
+                'session_id': self._session.session_id,
+                'processed_count': len(self._session.processed_items),
+                'filtered_processed': not include_processed,
+            }
 
         return result
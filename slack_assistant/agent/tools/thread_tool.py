@@ -1,22 +1,83 @@
 """Thread tool for getting full thread conversations."""
 
+import asyncio
+import urllib.parse
 from collections import defaultdict
+from functools import lru_cache
 from typing import Any
 
 from slack_assistant.agent.tools.base import BaseTool
+from slack_assistant.db.models import Message
 from slack_assistant.db.repository import Repository
-from slack_assistant.formatting import EntityResolver, collect_entities
+from slack_assistant.formatting import CollectedEntities, EntityResolver, collect_entities
 from slack_assistant.formatting.patterns import format_text
 from slack_assistant.slack.client import SlackClient
 
 
+_INPUT_SCHEMA: dict[str, Any] = {
+    'type': 'object',
+    'properties': {
+        'channel_id': {
+            'type': 'string',
+            'description': 'Channel ID (e.g., C1234567890)',
+        },
+        'thread_ts': {
+            'type': 'string',
+            'description': 'Thread timestamp (e.g., 1234567890.123456)',
+        },
+        'message_link': {
+            'type': 'string',
+            'description': 'Slack message permalink (alternative to channel_id/thread_ts)',
+        },
+        'refresh_reactions': {
+            'type': 'boolean',
+            'description': 'If true, fetch live reactions from Slack API (default: false, uses cached data)',
+        },
+    },
+    'required': [],
+}
+
+
+@lru_cache(maxsize=1024)
+def _parse_slack_link(link: str) -> tuple[str, str] | None:
+    """Parse a Slack permalink or slack:// URL into (channel_id, message_ts).
+
+    Cached because users tend to paste the same link repeatedly.
+    """
+    parsed = urllib.parse.urlparse(link)
+
+    if 'slack.com' in parsed.netloc or parsed.path.startswith('/archives/'):
+        parts = parsed.path.strip('/').split('/')
+        if len(parts) >= 2 and parts[0] == 'archives':
+            channel_id = parts[1]
+            if len(parts) >= 3:
+                ts_part = parts[2]
+                if ts_part.startswith('p'):
+                    ts_digits = ts_part[1:]
+                    message_ts = f'{ts_digits[:-6]}.{ts_digits[-6:]}'
+                    return channel_id, message_ts
+
+    elif parsed.scheme == 'slack':
+        params = urllib.parse.parse_qs(parsed.query)
+        channel_id = params.get('id', [None])[0]
+        message_ts = params.get('message', [None])[0]
+        if channel_id and message_ts:
+            return channel_id, message_ts
+
+    return None
+
+
 class ThreadTool(BaseTool):
     """Tool for getting full thread conversations."""
 
+    # Live reaction fetches in flight at once, shared by all calls to this tool
+    MAX_CONCURRENT_REACTION_FETCHES = 4
+
     def __init__(self, client: SlackClient, repository: Repository):
         self._client = client
         self._repository = repository
         self._resolver = EntityResolver(repository)
+        self._reactions_semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_REACTION_FETCHES)
 
     @property
     def name(self) -> str:
@@ -31,28 +92,7 @@ Use refresh_reactions=true to fetch live reactions from Slack API."""
 
     @property
     def input_schema(self) -> dict[str, Any]:
-        return {
-            'type': 'object',
-            'properties': {
-                'channel_id': {
-                    'type': 'string',
-                    'description': 'Channel ID (e.g., C1234567890)',
-                },
-                'thread_ts': {
-                    'type': 'string',
-                    'description': 'Thread timestamp (e.g., 1234567890.123456)',
-                },
-                'message_link': {
-                    'type': 'string',
-                    'description': 'Slack message permalink (alternative to channel_id/thread_ts)',
-                },
-                'refresh_reactions': {
-                    'type': 'boolean',
-                    'description': 'If true, fetch live reactions from Slack API (default: false, uses cached data)',
-                },
-            },
-            'required': [],
-        }
+        return _INPUT_SCHEMA
 
     async def execute(
         self,
@@ -103,38 +143,22 @@ Use refresh_reactions=true to fetch live reactions from Slack API."""
             entities.channel_ids.add(msg.channel_id)
             all_entities.merge(entities)
 
-        # Get reactions - either from database or live API
-        reactions_source = 'database'
-        reactions_by_msg_id: dict[int, dict[str, list[str]]] = {}
-
-        if refresh_reactions:
-            # Fetch live reactions from Slack API and update database
-            reactions_source = 'live_api'
-            for msg in messages:
-                live_reactions = await self._client.get_message_reactions(channel_id, msg.ts)
-                if live_reactions:
-                    # Store in database for future use
-                    await self._repository.upsert_reactions(msg.id, live_reactions)
-                    # Format for output: {emoji: [user1, user2]}
-                    reactions_by_msg_id[msg.id] = self._format_reactions(live_reactions)
-                    # Collect user IDs from reactions for name resolution
-                    for reaction in live_reactions:
-                        for user_id in reaction.get('users', []):
-                            all_entities.user_ids.add(user_id)
-                else:
-                    reactions_by_msg_id[msg.id] = {}
-        else:
-            # Get reactions from database
-            message_ids = [msg.id for msg in messages]
-            db_reactions = await self._repository.get_reactions_for_messages_batch(message_ids)
-            for msg_id, reaction_list in db_reactions.items():
-                grouped: dict[str, list[str]] = defaultdict(list)
-                for reaction in reaction_list:
-                    grouped[reaction.name].append(reaction.user_id)
-                    all_entities.user_ids.add(reaction.user_id)
-                reactions_by_msg_id[msg_id] = dict(grouped)
-
-        context = await self._resolver.resolve(all_entities)
+        # Resolve authors, mentions and the channel while reactions load
+        resolve_task = asyncio.create_task(self._resolver.resolve(all_entities))
+        try:
+            reactions_source, reactions_by_msg_id, reaction_user_ids = await self._load_reactions(
+                channel_id, messages, refresh_reactions
+            )
+        except BaseException:
+            resolve_task.cancel()
+            raise
+
+        context = await resolve_task
+        # Reacting users outside the thread need a second, usually cached, lookup
+        extra_user_ids = reaction_user_ids - context.users.keys()
+        if extra_user_ids:
+            extra_context = await self._resolver.resolve(CollectedEntities(user_ids=extra_user_ids))
+            context.users.update(extra_context.users)
 
         # Get channel name
         channel_name = context.channels.get(channel_id, channel_id)
@@ -153,7 +177,7 @@ Use refresh_reactions=true to fetch live reactions from Slack API."""
                 'user': context.users.get(msg.user_id, msg.user_id) if msg.user_id else 'unknown',
                 'user_id': msg.user_id,
                 'text': format_text(msg.text, context.users, context.channels) if msg.text else '',
-                'timestamp': msg.created_at.isoformat() if msg.created_at else None,
+                'timestamp': msg.created_at,
                 'is_parent': msg.ts == thread_ts,
                 'link': self._client.get_message_link(channel_id, msg.ts, msg.thread_ts),
                 'reactions': formatted_reactions,
@@ -169,6 +193,60 @@ Use refresh_reactions=true to fetch live reactions from Slack API."""
             'reactions_source': reactions_source,
         }
 
+    async def _load_reactions(
+        self,
+        channel_id: str,
+        messages: list[Message],
+        refresh_reactions: bool,
+    ) -> tuple[str, dict[int, dict[str, list[str]]], set[str]]:
+        """Load reactions for thread messages, either from database or live API.
+
+        Args:
+            channel_id: Channel ID.
+            messages: Thread messages.
+            refresh_reactions: If True, fetch live reactions from Slack API.
+
+        Returns:
+            Tuple of (reactions source, {message_id: {emoji: [user_ids]}},
+            user IDs of everyone who reacted).
+        """
+        reactions_by_msg_id: dict[int, dict[str, list[str]]] = {}
+        user_ids: set[str] = set()
+
+        if refresh_reactions:
+            # Fetch live reactions from Slack API and update database
+            async def fetch_reactions(msg: Message) -> tuple[Message, list[dict[str, Any]]]:
+                async with self._reactions_semaphore:
+                    return msg, await self._client.get_message_reactions(channel_id, msg.ts)
+
+            # Fetch concurrently (semaphore limits parallelism), then collect in message order
+            fetched = await asyncio.gather(*[fetch_reactions(msg) for msg in messages])
+            refreshed: list[tuple[int, list[dict[str, Any]]]] = []
+            for msg, live_reactions in fetched:
+                if live_reactions:
+                    refreshed.append((msg.id, live_reactions))
+                    # Format for output: {emoji: [user1, user2]}
+                    reactions_by_msg_id[msg.id] = self._format_reactions(live_reactions)
+                    # Collect user IDs from reactions for name resolution
+                    for reaction in live_reactions:
+                        user_ids.update(reaction.get('users', []))
+                else:
+                    reactions_by_msg_id[msg.id] = {}
+            # Store in database for future use
+            await self._repository.upsert_reactions_bulk(refreshed)
+            return 'live_api', reactions_by_msg_id, user_ids
+
+        # Get reactions from database
+        message_ids = [msg.id for msg in messages]
+        db_reactions = await self._repository.get_reactions_for_messages_batch(message_ids)
+        for msg_id, reaction_list in db_reactions.items():
+            grouped: dict[str, list[str]] = defaultdict(list)
+            for reaction in reaction_list:
+                grouped[reaction.name].append(reaction.user_id)
+                user_ids.add(reaction.user_id)
+            reactions_by_msg_id[msg_id] = dict(grouped)
+        return 'database', reactions_by_msg_id, user_ids
+
     def _format_reactions(self, reactions: list[dict[str, Any]]) -> dict[str, list[str]]:
         """Format Slack API reactions to {emoji: [user_ids]} dict.
 
@@ -194,26 +272,4 @@ Use refresh_reactions=true to fetch live reactions from Slack API."""
         Returns:
             Tuple of (channel_id, message_ts) or None.
         """
-        import urllib.parse
-
-        parsed = urllib.parse.urlparse(link)
-
-        if 'slack.com' in parsed.netloc or parsed.path.startswith('/archives/'):
-            parts = parsed.path.strip('/').split('/')
-            if len(parts) >= 2 and parts[0] == 'archives':
-                channel_id = parts[1]
-                if len(parts) >= 3:
-                    ts_part = parts[2]
-                    if ts_part.startswith('p'):
-                        ts_digits = ts_part[1:]
-                        message_ts = f'{ts_digits[:-6]}.{ts_digits[-6:]}'
-                        return channel_id, message_ts
-
-        elif parsed.scheme == 'slack':
-            params = urllib.parse.parse_qs(parsed.query)
-            channel_id = params.get('id', [None])[0]
-            message_ts = params.get('message', [None])[0]
-            if channel_id and message_ts:
-                return channel_id, message_ts
-
-        return None
+        return _parse_slack_link(link)
@@ -349,11 +349,13 @@ def status_agent():
 
     async def run_agent():
         from slack_assistant.agent import AgentController
+        from slack_assistant.agent.llm import close_llm_clients
         from slack_assistant.cli.interactive import run_interactive
         from slack_assistant.services.embeddings import EmbeddingService
 
         client = SlackClient(config.slack_user_token)
         repository = Repository()
+        agent = None
 
         try:
             await get_pool()
@@ -372,6 +374,9 @@ def status_agent():
             await run_interactive(agent)
 
         finally:
+            if agent is not None:
+                await agent.close()
+            await close_llm_clients()
             await close_pool()
 
     run_async(run_agent())
@@ -393,11 +398,13 @@ def status_agent_limited():
 
     async def run_agent():
         from slack_assistant.agent.controller_limited import LimitedAgentController
+        from slack_assistant.agent.llm import close_llm_clients
         from slack_assistant.cli.interactive import run_interactive
         from slack_assistant.services.embeddings import EmbeddingService
 
         client = SlackClient(config.slack_user_token)
         repository = Repository()
+        agent = None
 
         try:
             await get_pool()
@@ -416,6 +423,9 @@ def status_agent_limited():
             await run_interactive(agent)
 
         finally:
+            if agent is not None:
+                await agent.close()
+            await close_llm_clients()
             await close_pool()
 
     run_async(run_agent())
@@ -44,6 +44,9 @@ class Config:
     anthropic_api_key: str = field(default_factory=lambda: os.environ.get('ANTHROPIC_API_KEY', ''))
     openai_api_key: str = field(default_factory=lambda: os.environ.get('OPENAI_API_KEY', ''))
 
+    # Agent tool execution
+    max_tool_concurrency: int = field(default_factory=lambda: int(os.environ.get('MAX_TOOL_CONCURRENCY', '5')))
+
     # Context Summarization (for status-agent-limited)
     context_max_recent_turns: int = field(
         default_factory=lambda: int(os.environ.get('CONTEXT_MAX_RECENT_TURNS', '4'))
@@ -3,13 +3,21 @@
 from datetime import datetime
 from typing import Any
 
-from sqlalchemy import delete, select
+from sqlalchemy import ColumnElement, delete, select, tuple_
 from sqlalchemy.dialects.postgresql import insert
 
 from slack_assistant.db.connection import get_session
 from slack_assistant.db.models import Channel, Message, Reaction, Reminder, SyncState, User
 
 
+def _exclude_message_keys(exclude_ids: set[str] | None) -> ColumnElement[bool] | None:
+    """Build a filter leaving out messages whose "channel_id:ts" key is in exclude_ids."""
+    if not exclude_ids:
+        return None
+    excluded = [tuple(key.split(':', 1)) for key in exclude_ids]
+    return tuple_(Message.channel_id, Message.ts).not_in(excluded)
+
+
 class Repository:
     """Database repository for Slack Assistant."""
 
@@ -186,22 +194,35 @@ class Repository:
 
     async def upsert_reactions(self, message_id: int, reactions: list[dict[str, Any]]) -> None:
         """Update reactions for a message (replace all)."""
+        await self.upsert_reactions_bulk([(message_id, reactions)])
+
+    async def upsert_reactions_bulk(self, reactions_by_message: list[tuple[int, list[dict[str, Any]]]]) -> None:
+        """Replace reactions for several messages in one transaction.
+
+        Args:
+            reactions_by_message: (message_id, reactions) pairs, with reactions
+                in the Slack API shape ({'name': ..., 'users': [...]}).
+        """
+        if not reactions_by_message:
+            return
+
+        rows = [
+            {'message_id': message_id, 'name': reaction.get('name', ''), 'user_id': user_id}
+            for message_id, reactions in reactions_by_message
+            for reaction in reactions
+            for user_id in reaction.get('users', [])
+        ]
+        message_ids = [message_id for message_id, _ in reactions_by_message]
+
         async with get_session() as session:
             # Delete existing reactions
-            await session.execute(delete(Reaction).where(Reaction.message_id == message_id))
+            await session.execute(delete(Reaction).where(Reaction.message_id.in_(message_ids)))
 
-            # Insert new reactions
-            for reaction in reactions:
-                name = reaction.get('name', '')
-                users = reaction.get('users', [])
-                for user_id in users:
-                    stmt = insert(Reaction).values(
-                        message_id=message_id,
-                        name=name,
-                        user_id=user_id,
-                    )
-                    stmt = stmt.on_conflict_do_nothing()
-                    await session.execute(stmt)
+            # Insert new reactions as a single multi-row statement
+            if rows:
+                stmt = insert(Reaction).values(rows)
+                stmt = stmt.on_conflict_do_nothing(index_elements=['message_id', 'name', 'user_id'])
+                await session.execute(stmt)
 
             await session.commit()
 
@@ -347,8 +368,16 @@ class Repository:
 
     # Status queries
 
-    async def get_unread_mentions(self, user_id: str, since: datetime | None = None) -> list[Message]:
-        """Get messages that mention a user."""
+    async def get_unread_mentions(
+        self, user_id: str, since: datetime | None = None, exclude_ids: set[str] | None = None
+    ) -> list[Message]:
+        """Get messages that mention a user.
+
+        Args:
+            user_id: User whose mentions to find.
+            since: Only include messages created after this time.
+            exclude_ids: Message keys ("channel_id:ts") to leave out in the query.
+        """
         async with get_session() as session:
             mention_pattern = f'%<@{user_id}>%'
             stmt = select(Message).where(Message.text.like(mention_pattern))
@@ -356,18 +385,33 @@ class Repository:
             if since:
                 stmt = stmt.where(Message.created_at > since)
 
+            excluded = _exclude_message_keys(exclude_ids)
+            if excluded is not None:
+                stmt = stmt.where(excluded)
+
             stmt = stmt.order_by(Message.created_at.desc()).limit(50)
             result = await session.execute(stmt)
             return list(result.scalars().all())
 
-    async def get_dm_messages(self, since: datetime | None = None) -> list[Message]:
-        """Get recent DM messages."""
+    async def get_dm_messages(
+        self, since: datetime | None = None, exclude_ids: set[str] | None = None
+    ) -> list[Message]:
+        """Get recent DM messages.
+
+        Args:
+            since: Only include messages created after this time.
+            exclude_ids: Message keys ("channel_id:ts") to leave out in the query.
+        """
         async with get_session() as session:
             stmt = select(Message).join(Channel, Message.channel_id == Channel.id).where(Channel.channel_type == 'im')
 
             if since:
                 stmt = stmt.where(Message.created_at > since)
 
+            excluded = _exclude_message_keys(exclude_ids)
+            if excluded is not None:
+                stmt = stmt.where(excluded)
+
             stmt = stmt.order_by(Message.created_at.desc()).limit(50)
             result = await session.execute(stmt)
             return list(result.scalars().all())
@@ -630,6 +674,7 @@ class Repository:
         since: datetime,
         limit: int = 100,
         include_own_messages: bool = True,
+        exclude_ids: set[str] | None = None,
     ) -> list[dict[str, Any]]:
         """Get recent messages for LLM analysis without pre-filtering.
 
@@ -642,6 +687,8 @@ class Repository:
             since: Datetime to look back from.
             limit: Maximum number of messages to return.
             include_own_messages: Whether to include messages sent by the user.
+            exclude_ids: Message keys ("channel_id:ts") to leave out. Filtered in the
+                query, so up to ``limit`` other messages are still returned.
 
         Returns:
             List of message dicts with channel context for LLM analysis.
@@ -675,6 +722,10 @@ class Repository:
             if not include_own_messages:
                 stmt = stmt.where(Message.user_id != user_id)
 
+            excluded = _exclude_message_keys(exclude_ids)
+            if excluded is not None:
+                stmt = stmt.where(excluded)
+
             result = await session.execute(stmt)
             rows = result.all()
 
@@ -700,6 +751,7 @@ class Repository:
                     'id': f'{row.channel_id}:{row.ts}',
                     'db_id': row.id,
                     'channel_id': row.channel_id,
+                    'ts': row.ts,
                     'channel': f'#{row.channel_name}' if row.channel_name else row.channel_id,
                     'channel_type': row.channel_type,
                     'user_id': row.user_id,
@@ -1,7 +1,13 @@
 """Message formatting utilities for Slack markup."""
 
 from slack_assistant.formatting.models import FormattedStatusItem
-from slack_assistant.formatting.patterns import CollectedEntities, collect_entities, format_text
+from slack_assistant.formatting.patterns import (
+    CollectedEntities,
+    TextTemplate,
+    collect_entities,
+    format_text,
+    prepare_text,
+)
 from slack_assistant.formatting.resolver import EntityResolver, ResolvedContext
 
 
@@ -10,6 +16,8 @@ __all__ = [
     'EntityResolver',
     'FormattedStatusItem',
     'ResolvedContext',
+    'TextTemplate',
     'collect_entities',
     'format_text',
+    'prepare_text',
 ]
@@ -65,6 +65,56 @@ def collect_entities(text: str | None) -> CollectedEntities:
     return entities
 
 
+@dataclass(slots=True)
+class TextTemplate:
+    """Slack text formatted except for user mentions, which are filled in by render()."""
+
+    # Formatted literal text alternating with user IDs: [text, user_id, text, ..., text]
+    parts: list[str]
+    user_ids: set[str]
+
+    def render(self, users: dict[str, str]) -> str:
+        """Fill in user mentions.
+
+        Args:
+            users: Mapping of user_id -> display_name.
+
+        Returns:
+            Formatted text with resolved mentions.
+        """
+        parts = self.parts
+        if len(parts) == 1:
+            return parts[0]
+        out = parts.copy()
+        for idx in range(1, len(out), 2):
+            out[idx] = f'@{users.get(out[idx], out[idx])}'
+        return ''.join(out)
+
+
+def prepare_text(text: str | None, channels: dict[str, str]) -> TextTemplate:
+    """Parse Slack text once, collecting mentioned users before their names are known.
+
+    Everything except user mentions is formatted as in format_text; mentions are
+    left as slots so the caller can fetch all users in one batch and then render.
+
+    Args:
+        text: Raw Slack message text.
+        channels: Mapping of channel_id -> name.
+
+    Returns:
+        TextTemplate with the mentioned user IDs.
+    """
+    if not text:
+        return TextTemplate([''], set())
+
+    # split() with one capture group alternates literal text and user IDs
+    parts = USER_MENTION.split(text)
+    for idx in range(0, len(parts), 2):
+        if parts[idx]:
+            parts[idx] = format_text(parts[idx], {}, channels)
+    return TextTemplate(parts, set(parts[1::2]))
+
+
 def format_text(text: str | None, users: dict[str, str], channels: dict[str, str]) -> str:
     """Format Slack markup to human-readable text.
 
@@ -2,10 +2,13 @@
 
 import uuid
 from datetime import datetime
+from functools import lru_cache
+from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 
+@lru_cache(maxsize=512)
 def normalize_emoji_name(name: str) -> str:
     """Normalize emoji name to Slack format (lowercase, underscores, no colons).
 
@@ -62,6 +65,52 @@ class UserPreferences(BaseModel):
     facts: list[UserFact] = Field(default_factory=list)
     emoji_patterns: list[EmojiPattern] = Field(default_factory=list)
 
+    # Lazily built lookup maps, keyed by (field name, item attribute)
+    _indexes: dict[tuple[str, str], dict[str, Any]] = PrivateAttr(default_factory=dict)
+
+    def _index_for(self, field: str, key: str = 'id') -> dict[str, Any]:
+        """Get a lookup map for a list field, rebuilding it if the list changed size."""
+        items = getattr(self, field)
+        index = self._indexes.get((field, key))
+        if index is None or len(index) != len(items):
+            # Reversed so the first item wins on duplicate keys, like a linear scan
+            index = {getattr(item, key): item for item in reversed(items)}
+            self._indexes[field, key] = index
+        return index
+
+    def _remove_by_id(self, field: str, item_id: str) -> bool:
+        item = self._index_for(field).pop(item_id, None)
+        if item is None:
+            return False
+        getattr(self, field).remove(item)
+        for index_key in [k for k in self._indexes if k[0] == field and k[1] != 'id']:
+            del self._indexes[index_key]
+        return True
+
+    def remove_rule(self, rule_id: str) -> bool:
+        """Remove a rule by id.
+
+        Returns:
+            True if the rule existed and was removed.
+        """
+        return self._remove_by_id('rules', rule_id)
+
+    def remove_fact(self, fact_id: str) -> bool:
+        """Remove a fact by id.
+
+        Returns:
+            True if the fact existed and was removed.
+        """
+        return self._remove_by_id('facts', fact_id)
+
+    def remove_emoji_pattern(self, pattern_id: str) -> bool:
+        """Remove an emoji pattern by id.
+
+        Returns:
+            True if the pattern existed and was removed.
+        """
+        return self._remove_by_id('emoji_patterns', pattern_id)
+
     def get_rules_text(self) -> str:
         """Get rules as formatted text for prompts."""
         if not self.rules:
@@ -112,8 +161,4 @@ class UserPreferences(BaseModel):
         Returns:
             EmojiPattern or None if not found.
         """
-        normalized = normalize_emoji_name(emoji)
-        for pattern in self.emoji_patterns:
-            if pattern.emoji == normalized:
-                return pattern
-        return None
+        return self._index_for('emoji_patterns', 'emoji').get(normalize_emoji_name(emoji))
@@ -25,27 +25,56 @@ class PreferenceStorage:
 
         self._storage_dir = storage_dir
         self._prefs_file = storage_dir / 'preferences.json'
+        self._version = 0
+        # Parsed preferences plus the (mtime_ns, size) of the file they came from
+        self._cached: tuple[tuple[int, int], UserPreferences] | None = None
+
+    @property
+    def path(self) -> Path:
+        """Path to the preferences file."""
+        return self._prefs_file
+
+    @property
+    def version(self) -> int:
+        """Counter bumped on every save through this instance."""
+        return self._version
 
     def _ensure_dir(self) -> None:
         """Ensure storage directory exists."""
         self._storage_dir.mkdir(parents=True, exist_ok=True)
 
+    def _file_key(self) -> tuple[int, int] | None:
+        try:
+            stat = self._prefs_file.stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
     def load(self) -> UserPreferences:
         """Load preferences from disk.
 
+        The parsed result is reused until the file's mtime or size changes, so
+        callers that mutate the returned instance must save() it.
+
         Returns:
             UserPreferences instance.
         """
-        if not self._prefs_file.exists():
+        key = self._file_key()
+        if key is None:
+            self._cached = None
             return UserPreferences()
+        if self._cached is not None and self._cached[0] == key:
+            return self._cached[1]
 
         try:
             with open(self._prefs_file) as f:
                 data = json.load(f)
-            return UserPreferences.model_validate(data)
+            prefs = UserPreferences.model_validate(data)
         except (json.JSONDecodeError, ValueError) as e:
             logger.warning(f'Failed to load preferences: {e}')
             return UserPreferences()
+        self._cached = (key, prefs)
+        return prefs
 
     def save(self, prefs: UserPreferences) -> None:
         """Save preferences to disk.
@@ -57,5 +86,8 @@ class PreferenceStorage:
 
         with open(self._prefs_file, 'w') as f:
             json.dump(prefs.model_dump(), f, indent=2)
+        self._version += 1
+        key = self._file_key()
+        self._cached = (key, prefs) if key is not None else None
 
         logger.debug(f'Saved preferences to {self._prefs_file}')
@@ -1,7 +1,9 @@
 """Embedding generation service for vector search."""
 
 import asyncio
+import itertools
 import logging
+from collections import OrderedDict
 from typing import Any
 
 from sqlalchemy import func, select
@@ -34,10 +36,20 @@ def _get_model():
 class EmbeddingService:
     """Service for generating and storing message embeddings."""
 
+    QUERY_CACHE_SIZE = 1024
+    # Concurrent query misses wait this long to be embedded together, up to QUERY_BATCH_SIZE per model call
+    QUERY_BATCH_DELAY = 0.005
+    QUERY_BATCH_SIZE = 32
+
     def __init__(self, repository: Repository, api_key: str | None = None):
         self.repository = repository
         self.api_key = api_key
         self.model = get_config().embedding_model
+        # LRU of search query embeddings keyed by (model, normalized query)
+        self._query_cache: OrderedDict[tuple[str, str], list[float]] = OrderedDict()
+        # Normalized query -> future for misses waiting on the next batch
+        self._pending_queries: dict[str, asyncio.Future[list[float] | None]] = {}
+        self._flush_task: asyncio.Task[None] | None = None
 
     def _generate_sync(self, text: str) -> list[float]:
         """Synchronous embedding generation."""
@@ -58,6 +70,87 @@ class EmbeddingService:
             logger.error(f'Failed to generate embedding: {e}')
             return None
 
+    def _generate_batch_sync(self, texts: list[str]) -> list[list[float]]:
+        """Synchronous embedding generation for several texts in one model call."""
+        model = _get_model()
+        embeddings = model.encode(texts, normalize_embeddings=True, show_progress_bar=False)
+        return embeddings.tolist()
+
+    async def generate_embeddings(self, texts: list[str]) -> list[list[float]] | None:
+        """Generate embeddings for several texts in one model call.
+
+        Args:
+            texts: Non-empty texts to embed.
+
+        Returns:
+            One embedding per text in input order, or None on failure.
+        """
+        try:
+            return await asyncio.to_thread(self._generate_batch_sync, texts)
+        except Exception as e:
+            logger.error(f'Failed to generate embeddings: {e}')
+            return None
+
+    async def _flush_queries(self) -> None:
+        """Embed pending queries in batches until none are left."""
+        batch: dict[str, asyncio.Future[list[float] | None]] = {}
+        try:
+            # Give concurrent callers a moment to join the batch
+            await asyncio.sleep(self.QUERY_BATCH_DELAY)
+            while self._pending_queries:
+                batch = dict(itertools.islice(self._pending_queries.items(), self.QUERY_BATCH_SIZE))
+                for text in batch:
+                    del self._pending_queries[text]
+                embeddings = await self.generate_embeddings(list(batch))
+                for future, embedding in zip(batch.values(), embeddings or itertools.repeat(None), strict=False):
+                    if not future.done():
+                        future.set_result(embedding)
+        finally:
+            self._flush_task = None
+            # Only reached with unresolved futures if this task was cancelled
+            for future in itertools.chain(batch.values(), self._pending_queries.values()):
+                future.cancel()
+            self._pending_queries.clear()
+
+    async def embed_query(self, query: str) -> list[float] | None:
+        """Generate embedding for a search query, reusing recent results.
+
+        Queries that differ only in whitespace share a cache entry. Misses from
+        concurrent callers are embedded together in one model call, and
+        identical in-flight queries share a single result. Failed generations
+        are not cached.
+
+        Args:
+            query: Search query text.
+
+        Returns:
+            Embedding vector, or None if it could not be generated.
+        """
+        key = (self.model, ' '.join(query.split()))
+        embedding = self._query_cache.get(key)
+        if embedding is not None:
+            self._query_cache.move_to_end(key)
+            return embedding
+
+        text = key[1]
+        if not text:
+            return None
+
+        future = self._pending_queries.get(text)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._pending_queries[text] = future
+            if self._flush_task is None:
+                self._flush_task = asyncio.create_task(self._flush_queries())
+
+        # Shielded so one cancelled caller doesn't fail the others waiting on the same query
+        embedding = await asyncio.shield(future)
+        if embedding is not None and key not in self._query_cache:
+            self._query_cache[key] = embedding
+            if len(self._query_cache) > self.QUERY_CACHE_SIZE:
+                self._query_cache.popitem(last=False)
+        return embedding
+
     async def embed_message(self, message_id: int, text: str) -> bool:
         """Generate and store embedding for a message."""
         embedding = await self.generate_embedding(text)
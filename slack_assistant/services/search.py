@@ -96,7 +96,7 @@ class SearchService:
             return []
 
         # Generate embedding for query
-        query_embedding = await self.embedding_service.generate_embedding(query)
+        query_embedding = await self.embedding_service.embed_query(query)
         if query_embedding is None:
             logger.warning('Could not generate query embedding')
             return []
@@ -1,6 +1,7 @@
 """Status service for generating attention-needed items."""
 
 import logging
+from collections import Counter
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import TYPE_CHECKING, Any
@@ -42,6 +43,12 @@ class Status:
             result[item.priority].append(item)
         return result
 
+    @property
+    def counts_by_priority(self) -> dict[Priority, int]:
+        """Count items per priority without grouping them."""
+        counts = Counter(item.priority for item in self.items)
+        return {p: counts[p] for p in Priority}
+
 
 class StatusService:
     """Service for generating status reports."""
@@ -86,12 +93,19 @@ class StatusService:
         prefs = self._prefs_storage.load()
         acknowledgment_emojis = prefs.get_acknowledgment_emojis()
 
+        # Session-processed mentions and DMs are excluded in the queries so they don't use up the limits
+        session_processed_keys: set[str] = set()
+        if session is not None:
+            session_processed_keys = session.get_processed_keys()
+
         # Phase 1: Collect raw data and entity IDs
         raw_items: list[dict[str, Any]] = []
         all_entities = CollectedEntities()
 
         # Collect mentions
-        mentions = await self.repository.get_unread_mentions(self.client.user_id, since)
+        mentions = await self.repository.get_unread_mentions(
+            self.client.user_id, since, exclude_ids=session_processed_keys
+        )
 
         # Check which mentions the user has already replied to
         mention_contexts = [(msg.channel_id, msg.thread_ts, msg.ts) for msg in mentions]
@@ -130,7 +144,7 @@ class StatusService:
             )
 
         # Collect DMs
-        dms = await self.repository.get_dm_messages(since)
+        dms = await self.repository.get_dm_messages(since, exclude_ids=session_processed_keys)
         # Filter out messages WE sent to others, but keep messages in self-DM channel
         self_dm_channel_ids = await self.repository.get_self_dm_channel_ids()
         dms = [m for m in dms if m.user_id != self.client.user_id or m.channel_id in self_dm_channel_ids]
@@ -154,7 +168,8 @@ class StatusService:
                 }
             )
 
-        # Collect thread replies
+        # Collect thread replies. Processed replies are filtered after keeping the newest
+        # reply per thread, so a thread stays hidden once its latest reply is processed
         thread_data = await self.repository.get_threads_with_replies(self.client.user_id, since)
         seen_threads = set()
         for row in thread_data:
@@ -195,11 +210,6 @@ class StatusService:
                 acknowledgment_emojis=acknowledgment_emojis,
             )
 
-        # Get session processed items if session provided
-        session_processed_keys: set[str] = set()
-        if session is not None:
-            session_processed_keys = session.get_processed_keys()
-
         # Phase 3: Create formatted items with filtering
         items: list[FormattedStatusItem] = []
         filtered_session_count = 0
@@ -208,7 +218,7 @@ class StatusService:
         for raw in raw_items:
             item_key = f'{raw["channel_id"]}:{raw["message_ts"]}'
 
-            # Filter out session-processed items
+            # Thread replies, and anything the queries could not see
             if item_key in session_processed_keys:
                 filtered_session_count += 1
                 continue
@@ -7,12 +7,13 @@ from slack_assistant.session.models import (
     ProcessedItem,
     SessionState,
 )
-from slack_assistant.session.storage import SessionStorage
+from slack_assistant.session.storage import DebouncedSessionStorage, SessionStorage
 
 
 __all__ = [
     'AnalyzedItem',
     'ConversationSummary',
+    'DebouncedSessionStorage',
     'ItemDisposition',
     'ProcessedItem',
     'SessionState',
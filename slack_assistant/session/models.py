@@ -4,7 +4,7 @@ import uuid
 from datetime import datetime
 from enum import Enum
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 
 class ItemDisposition(str, Enum):
@@ -68,6 +68,9 @@ class SessionState(BaseModel):
     conversation_summary: ConversationSummary | None = None
     current_focus: str | None = None
 
+    # (number of processed items it covers, their keys), kept in step by add_processed_item
+    _processed_keys: tuple[int, set[str]] | None = PrivateAttr(default=None)
+
     def touch(self) -> None:
         """Update last activity timestamp."""
         self.last_activity_at = datetime.now().isoformat()
@@ -99,17 +102,28 @@ class SessionState(BaseModel):
             disposition=disposition,
             notes=notes,
         )
+        keys = self.get_processed_keys()
         self.processed_items.append(item)
+        keys.add(item.key)
+        self._processed_keys = (len(self.processed_items), keys)
         self.touch()
         return item
 
     def get_processed_keys(self) -> set[str]:
         """Get set of processed item keys.
 
+        The set is cached and updated as items are added, so callers must not
+        mutate it. It is rebuilt whenever processed_items changes length
+        outside add_processed_item.
+
         Returns:
             Set of "channel_id:message_ts" keys.
         """
-        return {item.key for item in self.processed_items}
+        cached = self._processed_keys
+        if cached is None or cached[0] != len(self.processed_items):
+            cached = (len(self.processed_items), {item.key for item in self.processed_items})
+            self._processed_keys = cached
+        return cached[1]
 
     def add_analyzed_item(
         self,
@@ -189,8 +203,7 @@ class SessionState(BaseModel):
         Returns:
             True if item has been processed.
         """
-        key = f'{channel_id}:{message_ts}'
-        return key in self.get_processed_keys()
+        return f'{channel_id}:{message_ts}' in self.get_processed_keys()
 
     def get_session_age_hours(self) -> float:
         """Get session age in hours.
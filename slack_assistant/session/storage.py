@@ -1,10 +1,12 @@
 """Session storage using JSON files."""
 
-import json
+import asyncio
 import logging
 from datetime import datetime
 from pathlib import Path
 
+import orjson
+
 from slack_assistant.session.models import SessionState
 
 
@@ -46,10 +48,9 @@ class SessionStorage:
             return None
 
         try:
-            with open(self._session_file) as f:
-                data = json.load(f)
+            data = orjson.loads(self._session_file.read_bytes())
             return SessionState.model_validate(data)
-        except (json.JSONDecodeError, ValueError) as e:
+        except ValueError as e:
             logger.warning(f'Failed to load session: {e}')
             return None
 
@@ -59,14 +60,22 @@ class SessionStorage:
         Args:
             session: Session state to save.
         """
-        self._ensure_dirs()
         session.touch()
+        self._write(session)
 
-        with open(self._session_file, 'w') as f:
-            json.dump(session.model_dump(), f, indent=2)
+    def _write(self, session: SessionState) -> None:
+        """Write session state to the current session file.
 
+        Args:
+            session: Session state to write.
+        """
+        self._ensure_dirs()
+        self._session_file.write_bytes(orjson.dumps(session.model_dump(), option=orjson.OPT_INDENT_2))
         logger.debug(f'Saved session {session.session_id} to {self._session_file}')
 
+    def flush(self) -> None:
+        """Persist any pending writes (saves are synchronous here, so this is a no-op)."""
+
     def archive(self, session: SessionState | None = None) -> Path | None:
         """Archive the current session to history.
 
@@ -90,8 +99,7 @@ class SessionStorage:
         archive_path = self._history_dir / archive_name
 
         # Save to archive
-        with open(archive_path, 'w') as f:
-            json.dump(session.model_dump(), f, indent=2)
+        archive_path.write_bytes(orjson.dumps(session.model_dump(), option=orjson.OPT_INDENT_2))
 
         logger.info(f'Archived session {session.session_id} to {archive_path}')
 
@@ -182,10 +190,9 @@ class SessionStorage:
             return None
 
         try:
-            with open(archive_path) as f:
-                data = json.load(f)
+            data = orjson.loads(archive_path.read_bytes())
             return SessionState.model_validate(data)
-        except (json.JSONDecodeError, ValueError) as e:
+        except ValueError as e:
             logger.warning(f'Failed to load archived session: {e}')
             return None
 
@@ -210,3 +217,92 @@ class SessionStorage:
         # Save the restored session as current
         self.save(session)
         return session
+
+
+class DebouncedSessionStorage(SessionStorage):
+    """Session storage that coalesces bursts of saves into a single write.
+
+    save() updates the in-memory session immediately and schedules the disk
+    write after a short delay; further saves within that window replace the
+    pending write. Call flush() before shutdown to persist pending state.
+    Outside a running event loop, saves are written immediately.
+    """
+
+    def __init__(self, storage_dir: Path | None = None, delay: float = 0.5):
+        """Initialize storage.
+
+        Args:
+            storage_dir: Directory for storing sessions.
+                         Defaults to ~/.slack-assistant/
+            delay: Seconds to wait for further saves before writing.
+        """
+        super().__init__(storage_dir)
+        self._delay = delay
+        self._pending: SessionState | None = None
+        self._task: asyncio.Task | None = None
+
+    def save(self, session: SessionState) -> None:
+        """Schedule session to be saved to disk.
+
+        Args:
+            session: Session state to save.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            super().save(session)
+            return
+
+        session.touch()
+        self._pending = session
+        self._cancel_task()
+        self._task = loop.create_task(self._delayed_write())
+
+    async def _delayed_write(self) -> None:
+        """Write the pending session once the debounce window elapses."""
+        await asyncio.sleep(self._delay)
+        self._task = None
+        self.flush()
+
+    def _cancel_task(self) -> None:
+        """Cancel the scheduled write, if any."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def flush(self) -> None:
+        """Write any pending session state to disk now."""
+        self._cancel_task()
+        if self._pending is not None:
+            session, self._pending = self._pending, None
+            self._write(session)
+
+    def load(self) -> SessionState | None:
+        """Load current session from disk, flushing pending writes first.
+
+        Returns:
+            SessionState instance or None if no session exists.
+        """
+        self.flush()
+        return super().load()
+
+    def archive(self, session: SessionState | None = None) -> Path | None:
+        """Archive the current session to history.
+
+        A pending write is flushed first so it can't recreate the current
+        session file after it has been archived and removed.
+
+        Args:
+            session: Session to archive, or load current if None.
+
+        Returns:
+            Path to archived file, or None if nothing to archive.
+        """
+        self.flush()
+        return super().archive(session)
+
+    def clear(self) -> None:
+        """Clear the current session without archiving."""
+        self._cancel_task()
+        self._pending = None
+        super().clear()
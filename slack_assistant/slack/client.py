@@ -1,6 +1,7 @@
 """Slack API client wrapper with rate limiting."""
 
 import logging
+from collections.abc import Iterable
 from typing import Any
 
 from slack_sdk.errors import SlackApiError
@@ -241,6 +242,17 @@ class SlackClient:
             base_url += f'?thread_ts={thread_formatted}'
         return base_url
 
+    def get_message_links(self, messages: Iterable[tuple[str, str, str | None]]) -> list[str]:
+        """Generate Slack message permalinks for many messages at once.
+
+        Args:
+            messages: (channel_id, message_ts, thread_ts) tuples.
+
+        Returns:
+            Permalinks in the same order.
+        """
+        return [self.get_message_link(channel_id, ts, thread_ts) for channel_id, ts, thread_ts in messages]
+
     async def get_message_reactions(
         self,
         channel_id: str,
@@ -1,13 +1,26 @@
 """Tests for the agent module."""
 
+import asyncio
 import tempfile
+from datetime import datetime
 from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
+from slack_assistant.agent.controller import AgentController
+from slack_assistant.agent.controller_limited import LimitedAgentController
 from slack_assistant.agent.conversation import ConversationManager
-from slack_assistant.agent.llm.models import LLMResponse, ToolCall
+from slack_assistant.agent.llm import close_llm_clients, get_llm_client, reset_llm_client_cache
+from slack_assistant.agent.llm.anthropic import AnthropicClient, _with_cache_breakpoint
+from slack_assistant.agent.llm.models import LLMResponse, TokenUsage, ToolCall
+from slack_assistant.agent.llm.openai import OpenAIClient
+from slack_assistant.agent.prompts import SYSTEM_PROMPT_STATIC, build_system_prompt
 from slack_assistant.agent.tools.base import BaseTool, ToolRegistry
+from slack_assistant.agent.tools.context_tool import ContextTool
+from slack_assistant.agent.tools.prefs_tool import PreferencesTool
+from slack_assistant.agent.tools.search_tool import SearchTool
+from slack_assistant.agent.tools.thread_tool import ThreadTool
 from slack_assistant.preferences import PreferenceStorage, UserFact, UserPreferences, UserRule
 
 
@@ -46,6 +59,16 @@ class TestConversationManager:
         assert content[1]['id'] == 'tc_123'
         assert content[1]['name'] == 'get_status'
 
+    def test_add_assistant_message_with_tool_call_objects(self):
+        manager = ConversationManager()
+        tool_calls = [ToolCall(id='tc_123', name='get_status', input={'hours_back': 24})]
+        manager.add_assistant_message(None, tool_calls)
+
+        messages = manager.build_messages()
+        assert messages[0]['content'] == [
+            {'type': 'tool_use', 'id': 'tc_123', 'name': 'get_status', 'input': {'hours_back': 24}}
+        ]
+
     def test_add_tool_result(self):
         manager = ConversationManager()
         manager.add_tool_result('tc_123', {'status': 'ok'})
@@ -56,6 +79,12 @@ class TestConversationManager:
         assert messages[0]['content'][0]['type'] == 'tool_result'
         assert messages[0]['content'][0]['tool_use_id'] == 'tc_123'
 
+    def test_add_tool_result_compact_json(self):
+        manager = ConversationManager()
+        manager.add_tool_result('tc_123', {'status': 'ok', 'items': [1, 2]})
+
+        assert manager.build_messages()[0]['content'][0]['content'] == '{"status":"ok","items":[1,2]}'
+
     def test_clear(self):
         manager = ConversationManager()
         manager.add_user_message('Hello')
@@ -87,6 +116,18 @@ class TestConversationManager:
         assert '2 user' in summary
         assert '1 assistant' in summary
 
+    def test_get_summary_counts_after_trim(self):
+        manager = ConversationManager(max_messages=3)
+        manager.add_user_message('Message 1')
+        manager.add_assistant_message('Response 1')
+        manager.add_user_message('Message 2')
+        manager.add_assistant_message('Response 2')
+
+        assert manager.get_summary() == '3 messages (1 user, 2 assistant)'
+
+        manager.clear()
+        assert manager.get_summary() == '0 messages (0 user, 0 assistant)'
+
     def test_add_assistant_message_empty_content_skipped(self):
         """Test that assistant messages with no content are skipped.
 
@@ -125,6 +166,10 @@ class TestLLMModels:
         assert tc.name == 'get_status'
         assert tc.input == {'hours_back': 24}
 
+    def test_token_usage_total(self):
+        usage = TokenUsage(input_tokens=100, output_tokens=20, cache_read_input_tokens=80)
+        assert usage.total_tokens == 120
+
     def test_llm_response_text_only(self):
         response = LLMResponse(text='Hello', tool_calls=None, stop_reason='end_turn')
         assert response.text == 'Hello'
@@ -137,6 +182,133 @@ class TestLLMModels:
         assert len(response.tool_calls) == 1
 
 
+class TestAnthropicCacheBreakpoint:
+    """Tests for prompt cache markers on Anthropic requests."""
+
+    def test_marks_last_block_without_mutating_history(self):
+        messages = [
+            {'role': 'user', 'content': 'Hello'},
+            {'role': 'user', 'content': [{'type': 'tool_result', 'tool_use_id': 'tc_1', 'content': 'ok'}]},
+        ]
+
+        marked = _with_cache_breakpoint(messages)
+
+        assert marked[0] is messages[0]
+        assert marked[1]['content'][-1]['cache_control'] == {'type': 'ephemeral'}
+        assert 'cache_control' not in messages[1]['content'][-1]
+
+    def test_wraps_string_content(self):
+        marked = _with_cache_breakpoint([{'role': 'user', 'content': 'Hello'}])
+
+        assert marked[0]['content'] == [{'type': 'text', 'text': 'Hello', 'cache_control': {'type': 'ephemeral'}}]
+
+    def test_empty_messages(self):
+        assert _with_cache_breakpoint([]) == []
+
+    async def test_tools_formatted_once_with_last_tool_marked(self):
+        client = AnthropicClient()
+        response = MagicMock(content=[], stop_reason='end_turn')
+        response.usage = MagicMock(input_tokens=1, output_tokens=1, cache_read_input_tokens=0)
+        client.client = MagicMock()
+        client.client.messages.create = AsyncMock(return_value=response)
+        tools = [MockTool().to_dict(), {**MockTool().to_dict(), 'name': 'other'}]
+
+        await client.complete(messages=[{'role': 'user', 'content': 'Hi'}], tools=tools)
+        await client.complete(messages=[{'role': 'user', 'content': 'Hi'}], tools=tools)
+
+        first, second = (call.kwargs['tools'] for call in client.client.messages.create.call_args_list)
+        assert first is second
+        assert 'cache_control' not in first[0]
+        assert first[-1]['cache_control'] == {'type': 'ephemeral'}
+        assert 'cache_control' not in tools[-1]
+
+
+class TestSystemPrompt:
+    """Tests for system prompt layout."""
+
+    def test_static_instructions_precede_context(self):
+        blocks = build_system_prompt(user_context='User ID: U123', session_context='New session started: s1')
+
+        assert blocks[0]['text'] == SYSTEM_PROMPT_STATIC
+        assert '{' not in blocks[0]['text']
+        assert 'User ID: U123' in blocks[1]['text']
+        assert 'No remembered facts.' in blocks[1]['text']
+
+    def test_prompt_memoized_and_static_block_shared(self):
+        first = build_system_prompt(user_context='User ID: U1')
+
+        assert build_system_prompt(user_context='User ID: U1') is first
+        assert build_system_prompt(user_context='User ID: U2')[0] is first[0]
+
+    async def test_anthropic_marks_static_and_last_block(self):
+        client = AnthropicClient()
+        response = MagicMock(content=[], stop_reason='end_turn')
+        response.usage = MagicMock(input_tokens=1, output_tokens=1, cache_read_input_tokens=0)
+        client.client = MagicMock()
+        client.client.messages.create = AsyncMock(return_value=response)
+        system = build_system_prompt()
+
+        await client.complete(messages=[{'role': 'user', 'content': 'Hi'}], system=system)
+
+        sent = client.client.messages.create.call_args.kwargs['system']
+        assert [block.get('cache_control') for block in sent] == [{'type': 'ephemeral'}, {'type': 'ephemeral'}]
+        assert 'cache_control' not in system[0]
+
+
+class TestAnthropicConnectionPool:
+    """Tests for the HTTP connection pool shared by Anthropic clients."""
+
+    async def test_clients_share_pool_until_closed(self):
+        first = AnthropicClient()
+        second = AnthropicClient()
+        assert first.client._client is second.client._client
+
+        await first.aclose()
+
+        assert second.client._client.is_closed
+        assert AnthropicClient().client._client is not second.client._client
+
+
+class TestOpenAIMessageCache:
+    """Tests for reusing converted messages across OpenAI requests."""
+
+    @pytest.fixture
+    def client(self) -> OpenAIClient:
+        client = OpenAIClient.__new__(OpenAIClient)
+        client.model = 'gpt-test'
+        response = MagicMock(usage=None)
+        response.choices = [MagicMock(finish_reason='stop')]
+        response.choices[0].message.content = 'ok'
+        response.choices[0].message.tool_calls = None
+        client.client = MagicMock()
+        client.client.chat.completions.create = AsyncMock(return_value=response)
+        return client
+
+    async def test_other_callers_keep_conversation_cache(self, client: OpenAIClient, mocker):
+        history = [
+            {'role': 'user', 'content': 'Hello'},
+            {'role': 'assistant', 'content': [{'type': 'text', 'text': 'Hi'}]},
+        ]
+        cache: dict = {}
+        await client.complete(messages=history, message_cache=cache)
+
+        # A summarizer request through the same shared client
+        await client.complete(messages=[{'role': 'user', 'content': 'Summarize'}])
+
+        format_spy = mocker.spy(client, '_format_message')
+        history.append({'role': 'user', 'content': 'Next'})
+        await client.complete(messages=history, message_cache=cache)
+
+        format_spy.assert_called_once_with(history[-1])
+        assert set(cache) == {id(msg) for msg in history}
+        sent = client.client.chat.completions.create.call_args.kwargs['messages']
+        assert sent == [
+            {'role': 'user', 'content': 'Hello'},
+            {'role': 'assistant', 'content': 'Hi'},
+            {'role': 'user', 'content': 'Next'},
+        ]
+
+
 class MockTool(BaseTool):
     """Mock tool for testing."""
 
@@ -190,6 +362,17 @@ class TestToolRegistry:
         assert 'description' in definitions[0]
         assert 'input_schema' in definitions[0]
 
+    def test_get_tool_definitions_cached_until_register(self):
+        registry = ToolRegistry()
+        registry.register(MockTool())
+
+        definitions = registry.get_tool_definitions()
+        assert registry.get_tool_definitions() is definitions
+
+        tracker = {'active': 0, 'peak': 0}
+        registry.register(ConcurrencyTrackingTool('other', tracker))
+        assert [d['name'] for d in registry.get_tool_definitions()] == ['mock_tool', 'other']
+
     @pytest.mark.asyncio
     async def test_execute(self):
         registry = ToolRegistry()
@@ -233,6 +416,31 @@ class TestPreferenceStorage:
             assert len(loaded.facts) == 1
             assert loaded.facts[0].content == 'Meeting on Friday'
 
+    def test_save_bumps_version(self, tmp_path: Path):
+        storage = PreferenceStorage(tmp_path)
+        assert storage.version == 0
+
+        storage.save(UserPreferences())
+        storage.save(UserPreferences())
+
+        assert storage.version == 2
+
+    def test_load_reuses_parsed_preferences(self, tmp_path: Path):
+        storage = PreferenceStorage(tmp_path)
+        storage.save(UserPreferences(rules=[UserRule(description='Rule 1')]))
+
+        assert storage.load() is storage.load()
+
+    def test_load_picks_up_external_changes(self, tmp_path: Path):
+        storage = PreferenceStorage(tmp_path)
+        storage.save(UserPreferences())
+        assert storage.load().rules == []
+
+        other = PreferenceStorage(tmp_path)
+        other.save(UserPreferences(rules=[UserRule(description='Written elsewhere')]))
+
+        assert [r.description for r in storage.load().rules] == ['Written elsewhere']
+
     def test_get_rules_text_empty(self):
         prefs = UserPreferences()
         assert prefs.get_rules_text() == 'No custom rules defined.'
@@ -256,3 +464,479 @@ class TestPreferenceStorage:
 
         text = prefs.get_facts_text()
         assert 'Important fact' in text
+
+
+class TestPreferencesTool:
+    """Tests for PreferencesTool action dispatch."""
+
+    async def test_add_and_remove_rule(self, tmp_path: Path):
+        tool = PreferencesTool(PreferenceStorage(tmp_path))
+
+        added = await tool.execute(action='add_rule', content='Highlight @boss')
+        rule_id = added['rule']['id']
+        assert (await tool.execute(action='get_all'))['rules'][0]['id'] == rule_id
+
+        assert await tool.execute(action='remove_rule', id=rule_id) == {'success': True, 'removed_id': rule_id}
+        assert (await tool.execute(action='remove_rule', id=rule_id))['success'] is False
+
+    async def test_add_emoji_pattern_updates_existing(self, tmp_path: Path):
+        tool = PreferencesTool(PreferenceStorage(tmp_path))
+
+        first = await tool.execute(action='add_emoji_pattern', emoji=':Eyes:', meaning='seen', priority_adjustment=5)
+        second = await tool.execute(action='add_emoji_pattern', emoji='eyes', meaning='read', marks_as_handled=True)
+
+        assert first['emoji_pattern']['priority_adjustment'] == 2
+        assert second['updated'] is True
+        assert second['emoji_pattern']['id'] == first['emoji_pattern']['id']
+        result = await tool.execute(action='get_emoji_patterns')
+        assert result['acknowledgment_emojis'] == ['eyes']
+
+    async def test_get_all_reused_until_preferences_change(self, tmp_path: Path):
+        tool = PreferencesTool(PreferenceStorage(tmp_path))
+        await tool.execute(action='add_fact', content='Standup at 10')
+
+        first = await tool.execute(action='get_all')
+        assert await tool.execute(action='get_all') is first
+
+        await tool.execute(action='add_fact', content='Demo on Friday')
+        assert len((await tool.execute(action='get_all'))['facts']) == 2
+
+    async def test_unknown_action(self, tmp_path: Path):
+        tool = PreferencesTool(PreferenceStorage(tmp_path))
+        assert await tool.execute(action='nope') == {'error': 'Unknown action: nope'}
+
+
+class TestAgentControllerSystemPrompt:
+    """Tests for system prompt caching in AgentController."""
+
+    @pytest.fixture
+    def storage(self, tmp_path: Path) -> PreferenceStorage:
+        return PreferenceStorage(tmp_path)
+
+    @pytest.fixture
+    def controller(self, storage: PreferenceStorage) -> AgentController:
+        client = MagicMock()
+        client.user_id = 'U123'
+        return AgentController(
+            client=client,
+            repository=MagicMock(),
+            llm_client=MagicMock(),
+            preference_storage=storage,
+            session_storage=MagicMock(),
+        )
+
+    async def test_prompt_cached_between_calls(self, controller: AgentController, storage: PreferenceStorage, mocker):
+        load_spy = mocker.spy(storage, 'load')
+
+        first = await controller._build_system_prompt()
+        second = await controller._build_system_prompt()
+
+        assert first is second
+        assert load_spy.call_count == 1
+
+    async def test_prompt_rebuilt_after_preferences_change(
+        self, controller: AgentController, storage: PreferenceStorage
+    ):
+        before = await controller._build_system_prompt()
+        assert 'Always highlight @boss' not in before[-1]['text']
+
+        prefs = storage.load()
+        prefs.rules.append(UserRule(description='Always highlight @boss'))
+        storage.save(prefs)
+
+        after = await controller._build_system_prompt()
+        assert 'Always highlight @boss' in after[-1]['text']
+        assert after[0] == before[0]
+
+
+class TestLimitedAgentControllerClose:
+    """Tests for LimitedAgentController shutdown."""
+
+    async def test_close_waits_for_background_summary(self, tmp_path: Path):
+        client = MagicMock()
+        client.user_id = 'U123'
+        session_storage = MagicMock()
+        controller = LimitedAgentController(
+            client=client,
+            repository=MagicMock(),
+            llm_client=MagicMock(),
+            preference_storage=PreferenceStorage(tmp_path),
+            session_storage=session_storage,
+        )
+        conversation = controller._conversation
+        conversation.max_recent_turns = 1
+        conversation.summarize_threshold = 2
+        for i in range(3):
+            conversation.add_user_message(f'Message {i}')
+            conversation.add_assistant_message(f'Response {i}')
+
+        release = asyncio.Event()
+
+        async def slow_complete(**kwargs):
+            await release.wait()
+            return LLMResponse(
+                text='Summary', tool_calls=[], stop_reason='end_turn', usage=TokenUsage(input_tokens=1, output_tokens=1)
+            )
+
+        llm = MagicMock()
+        llm.complete = AsyncMock(side_effect=slow_complete)
+        task = conversation.schedule_summarize(llm)
+        assert task is not None
+
+        close = asyncio.create_task(controller.close())
+        await asyncio.sleep(0)
+        assert not close.done()
+        session_storage.flush.assert_not_called()
+
+        release.set()
+        await close
+
+        assert conversation.summary == 'Summary'
+        session_storage.flush.assert_called_once()
+
+
+class TestContextToolCache:
+    """Tests for ContextTool result caching."""
+
+    @pytest.fixture
+    def tool(self) -> ContextTool:
+        tool = ContextTool(MagicMock(), MagicMock())
+        result = MagicMock(channel_name='general', user_name='alice', score=0.9, link='https://slack.com/x')
+        result.message.text = 'Related'
+        result.message.created_at = None
+        tool._service = MagicMock()
+        tool._service.find_context = AsyncMock(return_value=[result])
+        return tool
+
+    async def test_repeated_lookup_served_from_cache(self, tool: ContextTool):
+        first = await tool.execute(message_link='https://slack.com/archives/C1/p1', limit=5)
+        second = await tool.execute(message_link='https://slack.com/archives/C1/p1', limit=5)
+
+        assert second is first
+        tool._service.find_context.assert_awaited_once()
+
+    async def test_expired_or_empty_results_not_reused(self, tool: ContextTool):
+        tool._cache_ttl = 0
+        await tool.execute(message_link='https://slack.com/archives/C1/p1')
+        await tool.execute(message_link='https://slack.com/archives/C1/p1')
+        assert tool._service.find_context.await_count == 2
+
+        tool._service.find_context.return_value = []
+        await tool.execute(message_link='https://slack.com/archives/C1/p2')
+        assert ('https://slack.com/archives/C1/p2', 10) not in tool._cache
+
+
+class TestSearchToolCache:
+    """Tests for SearchTool similarity caching."""
+
+    @pytest.fixture
+    def tool(self) -> SearchTool:
+        embeddings = MagicMock()
+        vectors = {
+            'deploy status': [1.0, 0.0],
+            'status of deploy': [0.99, 0.141],
+            'lunch': [0.0, 1.0],
+            'coffee': [-1.0, 0.0],
+        }
+        embeddings.embed_query = AsyncMock(side_effect=lambda q: vectors[q])
+        tool = SearchTool(MagicMock(), MagicMock(), embeddings)
+        result = MagicMock(channel_name='general', user_name='alice', score=0.9, match_type='vector', link='x')
+        result.message.text = 'Deployed'
+        result.message.created_at = None
+        result.message.thread_ts = None
+        tool._service = MagicMock()
+        tool._service.search = AsyncMock(return_value=[result])
+        return tool
+
+    async def test_similar_query_served_from_cache(self, tool: SearchTool):
+        first = await tool.execute(query='deploy status')
+        second = await tool.execute(query='status of deploy')
+
+        tool._service.search.assert_awaited_once()
+        assert second['query'] == 'status of deploy'
+        assert second['results'] == first['results']
+
+    async def test_dissimilar_query_or_different_options_searches(self, tool: SearchTool):
+        await tool.execute(query='deploy status')
+        await tool.execute(query='lunch')
+        await tool.execute(query='deploy status', limit=5)
+        assert tool._service.search.await_count == 3
+
+    async def test_hit_refreshes_entry_before_eviction(self, tool: SearchTool):
+        tool.MAX_CACHE_ENTRIES = 2
+        await tool.execute(query='deploy status')
+        await tool.execute(query='lunch')
+        await tool.execute(query='status of deploy')  # Hit; 'lunch' is now least recently used
+        await tool.execute(query='coffee')  # Evicts 'lunch'
+        assert tool._service.search.await_count == 3
+
+        await tool.execute(query='deploy status')
+        await tool.execute(query='lunch')
+        assert tool._service.search.await_count == 4
+
+    async def test_expired_entries_not_reused(self, tool: SearchTool):
+        tool._cache_ttl = 0
+        await tool.execute(query='deploy status')
+        await tool.execute(query='deploy status')
+        assert tool._service.search.await_count == 2
+
+
+class TestThreadToolReactions:
+    """Tests for ThreadTool live reaction refresh."""
+
+    @pytest.fixture
+    def tool(self) -> ThreadTool:
+        messages = [MagicMock(id=i, ts=f'{i}.000', user_id='U1', channel_id='C1', text='hi') for i in range(6)]
+        repository = MagicMock()
+        repository.get_thread_messages = AsyncMock(return_value=messages)
+        repository.upsert_reactions_bulk = AsyncMock()
+        client = MagicMock()
+        client.get_message_link = MagicMock(return_value='x')
+        tool = ThreadTool(client, repository)
+        tool._resolver = MagicMock()
+        tool._resolver.resolve = AsyncMock(return_value=MagicMock(users={'U2': 'bob'}, channels={}))
+        return tool
+
+    async def test_live_reactions_fetched_concurrently_with_limit(self, tool: ThreadTool):
+        tracker = {'active': 0, 'peak': 0}
+
+        async def get_message_reactions(channel_id: str, ts: str) -> list[dict]:
+            tracker['active'] += 1
+            tracker['peak'] = max(tracker['peak'], tracker['active'])
+            await asyncio.sleep(0.01)
+            tracker['active'] -= 1
+            return [{'name': 'eyes', 'users': ['U2']}] if ts == '3.000' else []
+
+        tool._client.get_message_reactions = get_message_reactions
+        result = await tool.execute(channel_id='C1', thread_ts='0.000', refresh_reactions=True)
+
+        assert 1 < tracker['peak'] <= ThreadTool.MAX_CONCURRENT_REACTION_FETCHES
+        assert result['reactions_source'] == 'live_api'
+        assert [m['reactions'] for m in result['messages']][3] == {'eyes': ['bob']}
+        tool._repository.upsert_reactions_bulk.assert_awaited_once_with([(3, [{'name': 'eyes', 'users': ['U2']}])])
+
+    async def test_reacting_users_resolved_after_thread_entities(self, tool: ThreadTool):
+        reactions = [MagicMock(user_id='U1'), MagicMock(user_id='U3')]
+        reactions[0].name, reactions[1].name = 'eyes', 'tada'  # name is reserved in the MagicMock constructor
+        tool._repository.get_reactions_for_messages_batch = AsyncMock(return_value={0: reactions})
+        resolved: list[set[str]] = []
+
+        async def resolve(entities):
+            resolved.append(set(entities.user_ids))
+            return MagicMock(users={uid: uid.lower() for uid in entities.user_ids}, channels={})
+
+        tool._resolver.resolve = resolve
+        result = await tool.execute(channel_id='C1', thread_ts='0.000')
+
+        # Thread authors first, then only the reacting user not already resolved
+        assert resolved == [{'U1'}, {'U3'}]
+        assert result['messages'][0]['reactions'] == {'eyes': ['u1'], 'tada': ['u3']}
+
+    def test_parse_link(self, tool: ThreadTool):
+        assert tool._parse_link('https://team.slack.com/archives/C1/p1234567890123456') == ('C1', '1234567890.123456')
+        assert tool._parse_link('slack://channel?team=T1&id=C2&message=1.000100') == ('C2', '1.000100')
+        assert tool._parse_link('https://example.com/archives') is None
+
+
+class ConcurrencyTrackingTool(BaseTool):
+    """Tool that records how many of its calls overlap."""
+
+    def __init__(self, name: str, tracker: dict[str, int], serialize: bool = False):
+        self._name = name
+        self._tracker = tracker
+        self.serialize = serialize
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @property
+    def description(self) -> str:
+        return 'Tracks concurrency'
+
+    @property
+    def input_schema(self) -> dict:
+        return {'type': 'object', 'properties': {}}
+
+    async def execute(self, **kwargs):
+        self._tracker['active'] += 1
+        self._tracker['peak'] = max(self._tracker['peak'], self._tracker['active'])
+        await asyncio.sleep(0.01)
+        self._tracker['active'] -= 1
+        return {'tool': self._name}
+
+
+class TestAgentControllerToolExecution:
+    """Tests for tool call execution in AgentController."""
+
+    @pytest.fixture
+    def controller(self, tmp_path: Path) -> AgentController:
+        return AgentController(
+            client=MagicMock(),
+            repository=MagicMock(),
+            llm_client=MagicMock(),
+            preference_storage=PreferenceStorage(tmp_path),
+            session_storage=MagicMock(),
+        )
+
+    async def test_independent_tool_calls_run_concurrently(self, controller: AgentController):
+        tracker = {'active': 0, 'peak': 0}
+        controller._tools.register(ConcurrencyTrackingTool('a', tracker))
+        controller._tools.register(ConcurrencyTrackingTool('b', tracker))
+
+        results = await controller._execute_tool_calls(
+            [ToolCall(id='1', name='a', input={}), ToolCall(id='2', name='b', input={})]
+        )
+
+        assert results == [('{"tool":"a"}', False), ('{"tool":"b"}', False)]
+        assert tracker['peak'] == 2
+
+    async def test_serialized_tool_forces_sequential_execution(self, controller: AgentController):
+        tracker = {'active': 0, 'peak': 0}
+        controller._tools.register(ConcurrencyTrackingTool('a', tracker))
+        controller._tools.register(ConcurrencyTrackingTool('prefs', tracker, serialize=True))
+
+        results = await controller._execute_tool_calls(
+            [ToolCall(id='1', name='a', input={}), ToolCall(id='2', name='prefs', input={})]
+        )
+
+        assert results == [('{"tool":"a"}', False), ('{"tool":"prefs"}', False)]
+        assert tracker['peak'] == 1
+
+    async def test_tool_error_does_not_cancel_other_calls(self, controller: AgentController):
+        tracker = {'active': 0, 'peak': 0}
+        controller._tools.register(ConcurrencyTrackingTool('a', tracker))
+
+        results = await controller._execute_tool_calls(
+            [ToolCall(id='1', name='missing', input={}), ToolCall(id='2', name='a', input={})]
+        )
+
+        assert results[0][1] is True
+        assert results[1] == ('{"tool":"a"}', False)
+
+    async def test_datetime_results_encoded_as_iso(self, controller: AgentController):
+        tool = ConcurrencyTrackingTool('a', {'active': 0, 'peak': 0})
+        tool.execute = AsyncMock(return_value={'at': datetime(2024, 1, 2, 3, 4, 5, 600), 'none': None})
+        controller._tools.register(tool)
+
+        results = await controller._execute_tool_calls([ToolCall(id='1', name='a', input={})])
+
+        assert results == [('{"at":"2024-01-02T03:04:05.000600","none":null}', False)]
+
+    async def test_streamed_tool_calls_start_before_response_completes(self, controller: AgentController):
+        tracker = {'active': 0, 'peak': 0}
+        controller._tools.register(ConcurrencyTrackingTool('a', tracker))
+        controller._tools.register(ConcurrencyTrackingTool('prefs', tracker, serialize=True))
+        calls = [ToolCall(id='1', name='a', input={}), ToolCall(id='2', name='prefs', input={})]
+
+        async def streaming_complete(on_tool_call, **kwargs):
+            for tool_call in calls:
+                on_tool_call(tool_call)
+            await asyncio.sleep(0)
+            assert tracker['active'] == 1
+            return LLMResponse(text=None, tool_calls=calls, stop_reason='tool_use')
+
+        controller._llm.complete = streaming_complete
+
+        response, started = await controller._complete([], 'system', [])
+        results = await controller._execute_tool_calls(response.tool_calls, started)
+
+        assert list(started) == ['1']
+        assert results == [('{"tool":"a"}', False), ('{"tool":"prefs"}', False)]
+        assert tracker['peak'] == 1
+
+    async def test_streamed_call_after_serialized_call_waits(self, controller: AgentController):
+        tracker = {'active': 0, 'peak': 0}
+        controller._tools.register(ConcurrencyTrackingTool('a', tracker))
+        controller._tools.register(ConcurrencyTrackingTool('prefs', tracker, serialize=True))
+        calls = [ToolCall(id='1', name='prefs', input={}), ToolCall(id='2', name='a', input={})]
+
+        async def streaming_complete(on_tool_call, **kwargs):
+            for tool_call in calls:
+                on_tool_call(tool_call)
+            await asyncio.sleep(0.02)
+            # a must not run ahead of the prefs call requested before it
+            assert tracker['active'] == 0
+            return LLMResponse(text=None, tool_calls=calls, stop_reason='tool_use')
+
+        controller._llm.complete = streaming_complete
+
+        response, started = await controller._complete([], 'system', [])
+        results = await controller._execute_tool_calls(response.tool_calls, started)
+
+        assert started == {}
+        assert results == [('{"tool":"prefs"}', False), ('{"tool":"a"}', False)]
+        assert tracker['peak'] == 1
+
+    async def test_streamed_calls_start_one_at_a_time_before_serialized_call(self, controller: AgentController):
+        tracker = {'active': 0, 'peak': 0}
+        controller._tools.register(ConcurrencyTrackingTool('a', tracker))
+        controller._tools.register(ConcurrencyTrackingTool('b', tracker))
+        controller._tools.register(ConcurrencyTrackingTool('prefs', tracker, serialize=True))
+        calls = [
+            ToolCall(id='1', name='a', input={}),
+            ToolCall(id='2', name='b', input={}),
+            ToolCall(id='3', name='prefs', input={}),
+        ]
+
+        async def streaming_complete(on_tool_call, **kwargs):
+            for tool_call in calls:
+                on_tool_call(tool_call)
+            return LLMResponse(text=None, tool_calls=calls, stop_reason='tool_use')
+
+        controller._llm.complete = streaming_complete
+
+        response, started = await controller._complete([], 'system', [])
+        results = await controller._execute_tool_calls(response.tool_calls, started)
+
+        assert list(started) == ['1']
+        assert [result for result, _ in results] == ['{"tool":"a"}', '{"tool":"b"}', '{"tool":"prefs"}']
+        assert tracker['peak'] == 1
+
+
+class TestAgentControllerClose:
+    """Tests for AgentController shutdown."""
+
+    async def test_close_flushes_session_and_leaves_shared_llm_client_open(self, tmp_path: Path, mocker):
+        llm = AsyncMock()
+        mocker.patch('slack_assistant.agent.controller.get_llm_client', return_value=llm)
+        session_storage = MagicMock()
+        controller = AgentController(
+            client=MagicMock(),
+            repository=MagicMock(),
+            preference_storage=PreferenceStorage(tmp_path),
+            session_storage=session_storage,
+        )
+
+        await controller.close()
+
+        session_storage.flush.assert_called_once()
+        llm.aclose.assert_not_awaited()
+
+
+class TestLLMClientFactory:
+    """Tests for the shared LLM client factory."""
+
+    @pytest.fixture(autouse=True)
+    def reset_cache(self):
+        reset_llm_client_cache()
+        yield
+        reset_llm_client_cache()
+
+    def test_client_shared_per_provider(self):
+        client = get_llm_client('anthropic')
+        assert get_llm_client('anthropic') is client
+        assert isinstance(client, AnthropicClient)
+
+    def test_unknown_provider(self):
+        with pytest.raises(ValueError, match='Unknown LLM provider'):
+            get_llm_client('unknown')
+
+    async def test_close_llm_clients(self, mocker):
+        client = get_llm_client('anthropic')
+        aclose = mocker.patch.object(client, 'aclose', AsyncMock())
+
+        await close_llm_clients()
+
+        aclose.assert_awaited_once()
+        assert get_llm_client('anthropic') is not client
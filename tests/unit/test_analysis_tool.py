@@ -17,7 +17,9 @@ class TestAnalysisTool:
     def mock_client(self):
         client = MagicMock()
         client.user_id = 'U123'
-        client.get_message_link = MagicMock(return_value='https://slack.com/archives/C123/p123')
+        client.get_message_links = MagicMock(
+            side_effect=lambda messages: ['https://slack.com/archives/C123/p123' for _ in messages]
+        )
         return client
 
     @pytest.fixture
@@ -84,6 +86,7 @@ class TestAnalysisTool:
                 'id': 'C123:1234567890.123456',
                 'db_id': 1,
                 'channel_id': 'C123',
+                'ts': '1234567890.123456',
                 'channel': '#general',
                 'channel_type': 'public_channel',
                 'user_id': 'U456',
@@ -123,6 +126,7 @@ class TestAnalysisTool:
                 'id': 'C123:1234567890.123456',
                 'db_id': 1,
                 'channel_id': 'C123',
+                'ts': '1234567890.123456',
                 'channel': '#general',
                 'channel_type': 'public_channel',
                 'user_id': 'U456',
@@ -141,8 +145,37 @@ class TestAnalysisTool:
         result = await tool.execute(text_limit=100)
 
         msg = result['messages'][0]
-        assert len(msg['text']) == 103  # 100 chars + '...'
-        assert msg['text'].endswith('...')
+        assert len(msg['text']) == 101  # No space to break on: 100 chars + '…'
+        assert msg['text'].endswith('…')
+
+    @pytest.mark.asyncio
+    async def test_execute_truncates_on_word_boundary(self, tool, mock_repository):
+        mock_repository.get_recent_messages_for_analysis.return_value = [
+            {
+                'id': 'C123:1234567890.123456',
+                'db_id': 1,
+                'channel_id': 'C123',
+                'ts': '1234567890.123456',
+                'channel': '#general',
+                'channel_type': 'public_channel',
+                'user_id': 'U456',
+                'is_own_message': False,
+                'is_mention': False,
+                'is_dm': False,
+                'is_self_dm': False,
+                'text': 'word ' * 100,
+                'thread_ts': None,
+                'timestamp': datetime.now().isoformat(),
+                'metadata_priority': 'LOW',
+            }
+        ]
+        mock_repository.get_users_batch.return_value = []
+
+        result = await tool.execute(text_limit=102)
+        assert result['messages'][0]['text'] == ' '.join(['word'] * 20) + '…'
+
+        result = await tool.execute(token_limit=25)
+        assert result['messages'][0]['text'] == ' '.join(['word'] * 20) + '…'
 
     @pytest.mark.asyncio
     async def test_execute_custom_parameters(self, tool, mock_repository):
@@ -171,6 +204,7 @@ class TestAnalysisTool:
                 'id': 'D123:1234567890.123456',
                 'db_id': 1,
                 'channel_id': 'D123',
+                'ts': '1234567890.123456',
                 'channel': '#self',
                 'channel_type': 'im',
                 'user_id': 'U123',
@@ -202,6 +236,7 @@ class TestAnalysisTool:
                 'id': 'C123:1234567890.123456',
                 'db_id': 1,
                 'channel_id': 'C123',
+                'ts': '1234567890.123456',
                 'channel': '#general',
                 'channel_type': 'public_channel',
                 'user_id': 'U456',
@@ -219,12 +254,8 @@ class TestAnalysisTool:
 
         await tool.execute()
 
-        # Verify get_message_link was called with correct params
-        mock_client.get_message_link.assert_called_once_with(
-            'C123',
-            '1234567890.123456',
-            'thread_ts_value',
-        )
+        # Verify links were generated with correct params
+        mock_client.get_message_links.assert_called_once_with([('C123', '1234567890.123456', 'thread_ts_value')])
 
     @pytest.mark.asyncio
     async def test_execute_resolves_user_names(self, tool, mock_repository):
@@ -233,6 +264,7 @@ class TestAnalysisTool:
                 'id': 'C123:1234567890.123456',
                 'db_id': 1,
                 'channel_id': 'C123',
+                'ts': '1234567890.123456',
                 'channel': '#general',
                 'channel_type': 'public_channel',
                 'user_id': 'U789',
@@ -267,6 +299,7 @@ class TestAnalysisTool:
                 'id': 'C123:1234567890.123456',
                 'db_id': 1,
                 'channel_id': 'C123',
+                'ts': '1234567890.123456',
                 'channel': '#general',
                 'channel_type': 'public_channel',
                 'user_id': 'U999',
@@ -296,6 +329,7 @@ class TestAnalysisTool:
                 'id': 'C123:1234567890.123456',
                 'db_id': 1,
                 'channel_id': 'C123',
+                'ts': '1234567890.123456',
                 'channel': '#general',
                 'channel_type': 'public_channel',
                 'user_id': 'U456',
@@ -340,6 +374,7 @@ class TestAnalysisTool:
                 'id': 'C123:1234567890.123456',
                 'db_id': 1,
                 'channel_id': 'C123',
+                'ts': '1234567890.123456',
                 'channel': '#general',
                 'channel_type': 'public_channel',
                 'user_id': 'U456',
@@ -393,27 +428,13 @@ class TestAnalysisTool:
 
         tool = AnalysisTool(mock_client, mock_repository, session)
 
+        # The repository filters analyzed messages out in the query
         mock_repository.get_recent_messages_for_analysis.return_value = [
-            {
-                'id': 'C123:1234567890.123456',  # This one is already analyzed
-                'db_id': 1,
-                'channel_id': 'C123',
-                'channel': '#general',
-                'channel_type': 'public_channel',
-                'user_id': 'U456',
-                'is_own_message': False,
-                'is_mention': False,
-                'is_dm': False,
-                'is_self_dm': False,
-                'text': 'Already analyzed message',
-                'thread_ts': None,
-                'timestamp': datetime.now().isoformat(),
-                'metadata_priority': 'HIGH',
-            },
             {
                 'id': 'C123:9999999999.999999',  # This one is new
                 'db_id': 2,
                 'channel_id': 'C123',
+                'ts': '9999999999.999999',
                 'channel': '#general',
                 'channel_type': 'public_channel',
                 'user_id': 'U789',
@@ -435,6 +456,8 @@ class TestAnalysisTool:
         assert result['returned'] == 1
         assert result['messages'][0]['id'] == 'C123:9999999999.999999'
         assert result['excluded_already_analyzed'] == 1
+        call_kwargs = mock_repository.get_recent_messages_for_analysis.call_args.kwargs
+        assert call_kwargs['exclude_ids'] == {'C123:1234567890.123456'}
 
     @pytest.mark.asyncio
     async def test_execute_include_analyzed_when_requested(self, mock_client, mock_repository):
@@ -454,6 +477,7 @@ class TestAnalysisTool:
                 'id': 'C123:1234567890.123456',
                 'db_id': 1,
                 'channel_id': 'C123',
+                'ts': '1234567890.123456',
                 'channel': '#general',
                 'channel_type': 'public_channel',
                 'user_id': 'U456',
@@ -486,6 +510,7 @@ class TestAnalysisTool:
                 'id': 'C123:1234567890.123456',
                 'db_id': 1,
                 'channel_id': 'C123',
+                'ts': '1234567890.123456',
                 'channel': '#general',
                 'channel_type': 'public_channel',
                 'user_id': 'U456',
@@ -518,6 +543,7 @@ class TestAnalysisTool:
                 'id': 'C123:1234567890.123456',
                 'db_id': 1,
                 'channel_id': 'C123',
+                'ts': '1234567890.123456',
                 'channel': '#general',
                 'channel_type': 'public_channel',
                 'user_id': 'U456',
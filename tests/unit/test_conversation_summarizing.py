@@ -1,11 +1,12 @@
 """Tests for the summarizing conversation manager."""
 
+import asyncio
 from unittest.mock import AsyncMock
 
 import pytest
 
-from slack_assistant.agent.conversation_summarizing import SummarizingConversationManager
-from slack_assistant.agent.llm.models import LLMResponse
+from slack_assistant.agent.conversation_summarizing import MASKED_OBSERVATION, SummarizingConversationManager
+from slack_assistant.agent.llm.models import LLMResponse, TokenUsage
 
 
 @pytest.fixture
@@ -16,7 +17,7 @@ def mock_llm():
         text='Concise summary of previous messages...',
         tool_calls=[],
         stop_reason='end_turn',
-        usage={'input_tokens': 100, 'output_tokens': 50}
+        usage=TokenUsage(input_tokens=100, output_tokens=50)
     ))
     return llm
 
@@ -187,6 +188,56 @@ class TestSummarizingConversationManager:
         assert len(user_messages) == 3
         assert 'Message 3' in user_messages[0]['content'] or 'Message 4' in user_messages[0]['content']
 
+    def test_build_messages_without_summary_returns_history(self):
+        """Test that build_messages does not copy history when there is no summary."""
+        manager = SummarizingConversationManager()
+        manager.add_user_message('Hello')
+
+        assert manager.build_messages() is manager.messages
+
+    def test_build_messages_with_summary_cached_until_change(self):
+        """Test that the summary-prefixed list is reused until messages or summary change."""
+        manager = SummarizingConversationManager()
+        manager.add_user_message('Hello')
+        manager.summary = 'Earlier context'
+
+        first = manager.build_messages()
+        assert manager.build_messages() is first
+
+        manager.add_assistant_message('Hi!')
+        second = manager.build_messages()
+        assert second is not first
+        assert len(second) == 3
+
+        manager.summary = 'Updated context'
+        assert 'Updated context' in manager.build_messages()[0]['content']
+
+    def test_build_messages_masks_old_tool_results(self):
+        """Test that tool results outside the last max_recent_turns - 1 turns are masked."""
+        manager = SummarizingConversationManager(max_recent_turns=2)
+        for i in range(2):
+            manager.add_user_message(f'Question {i}')
+            manager.add_assistant_message(None, [{'id': f'tc_{i}', 'name': 'search', 'input': {}}])
+            manager.add_tool_result(f'tc_{i}', {'result': i})
+            manager.add_assistant_message(f'Answer {i}')
+
+        messages = manager.build_messages()
+
+        assert messages[2]['content'][0]['content'] == MASKED_OBSERVATION
+        assert messages[2]['content'][0]['tool_use_id'] == 'tc_0'
+        assert messages[6]['content'][0]['content'] == '{"result":1}'
+        assert manager.messages[2]['content'][0]['content'] == '{"result":0}'
+        assert '1 tool results masked' in manager.get_summary()
+
+    def test_build_messages_masking_disabled(self):
+        """Test that tool results are sent in full when masking is off."""
+        manager = SummarizingConversationManager(max_recent_turns=2, mask_old_observations=False)
+        for i in range(2):
+            manager.add_user_message(f'Question {i}')
+            manager.add_tool_result(f'tc_{i}', {'result': i})
+
+        assert manager.build_messages() is manager.messages
+
     @pytest.mark.asyncio
     async def test_summary_injection_in_build_messages(self, mock_llm):
         """Test that summary is prepended to messages when building."""
@@ -238,7 +289,7 @@ class TestSummarizingConversationManager:
             text='Merged summary of all previous messages...',
             tool_calls=[],
             stop_reason='end_turn',
-            usage={'input_tokens': 200, 'output_tokens': 60}
+            usage=TokenUsage(input_tokens=200, output_tokens=60)
         ))
 
         await manager.maybe_summarize(mock_llm)
@@ -246,6 +297,26 @@ class TestSummarizingConversationManager:
         # Summary should be updated (merged)
         assert 'Merged summary' in manager.summary or manager.summary == 'Merged summary of all previous messages...'
 
+    @pytest.mark.asyncio
+    async def test_summary_merge_uses_single_call(self, mock_llm):
+        """Test that extending an existing summary takes one LLM call."""
+        manager = SummarizingConversationManager(
+            max_recent_turns=2,
+            summarize_threshold=4
+        )
+        manager.summary = 'Earlier summary'
+        for i in range(5):
+            manager.add_user_message(f'Message {i}')
+            manager.add_assistant_message(f'Response {i}')
+
+        await manager.maybe_summarize(mock_llm)
+
+        mock_llm.complete.assert_called_once()
+        prompt = mock_llm.complete.call_args.kwargs['messages'][0]['content']
+        assert 'Earlier summary' in prompt
+        assert 'USER: Message 0' in prompt
+        assert manager.summary == 'Concise summary of previous messages...'
+
     @pytest.mark.asyncio
     async def test_max_summary_length(self, mock_llm):
         """Test that summary stays under token limit."""
@@ -269,6 +340,112 @@ class TestSummarizingConversationManager:
         # Here we just check the summary was created
         assert manager.summary == 'Concise summary of previous messages...'
 
+    @pytest.mark.asyncio
+    async def test_schedule_summarize_under_threshold(self, mock_llm):
+        """Test that no background task is started under the threshold."""
+        manager = SummarizingConversationManager(summarize_threshold=4)
+        manager.add_user_message('Hello')
+
+        assert manager.schedule_summarize(mock_llm) is None
+        mock_llm.complete.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_schedule_summarize_keeps_messages_added_meanwhile(self, mock_llm):
+        """Test that background summarization only drops the summarized prefix."""
+        manager = SummarizingConversationManager(
+            max_recent_turns=2,
+            summarize_threshold=4
+        )
+        for i in range(5):
+            manager.add_user_message(f'Message {i}')
+            manager.add_assistant_message(f'Response {i}')
+
+        release = asyncio.Event()
+        response = mock_llm.complete.return_value
+
+        async def slow_complete(**kwargs):
+            await release.wait()
+            return response
+
+        mock_llm.complete = AsyncMock(side_effect=slow_complete)
+
+        task = manager.schedule_summarize(mock_llm)
+        assert task is not None
+        assert manager.schedule_summarize(mock_llm) is task
+
+        # Old turns leave the context before the summary is ready
+        assert manager._count_turns() == 2
+
+        # Conversation continues while the summary is generated
+        await asyncio.sleep(0)
+        manager.add_user_message('Message 5')
+        release.set()
+        await task
+
+        assert manager.summary == 'Concise summary of previous messages...'
+        assert [m['content'] for m in manager.messages if m['role'] == 'user'] == [
+            'Message 3',
+            'Message 4',
+            'Message 5',
+        ]
+        assert '5 messages (3 user, 2 assistant)' in manager.get_summary()
+
+    @pytest.mark.asyncio
+    async def test_schedule_summarize_skipped_while_summarizing(self, mock_llm):
+        """Test that no trim happens while maybe_summarize holds the lock."""
+        manager = SummarizingConversationManager(
+            max_recent_turns=2,
+            summarize_threshold=4
+        )
+        for i in range(5):
+            manager.add_user_message(f'Message {i}')
+            manager.add_assistant_message(f'Response {i}')
+
+        release = asyncio.Event()
+        response = mock_llm.complete.return_value
+
+        async def slow_complete(**kwargs):
+            await release.wait()
+            return response
+
+        mock_llm.complete = AsyncMock(side_effect=slow_complete)
+
+        summarizing = asyncio.create_task(manager.maybe_summarize(mock_llm))
+        await asyncio.sleep(0)
+        manager.add_user_message('Message 5')
+        manager.add_assistant_message('Response 5')
+
+        assert manager.schedule_summarize(mock_llm) is None
+        assert manager._count_turns() == 6
+
+        release.set()
+        await summarizing
+
+        # Only the prefix maybe_summarize summarized is dropped
+        assert [m['content'] for m in manager.messages if m['role'] == 'user'] == [
+            'Message 3',
+            'Message 4',
+            'Message 5',
+        ]
+        mock_llm.complete.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_schedule_summarize_failure_keeps_trimmed_context(self, mock_llm):
+        """Test that a failed background summary leaves the trimmed context intact."""
+        manager = SummarizingConversationManager(
+            max_recent_turns=2,
+            summarize_threshold=4
+        )
+        for i in range(5):
+            manager.add_user_message(f'Message {i}')
+            manager.add_assistant_message(f'Response {i}')
+        mock_llm.complete = AsyncMock(side_effect=Exception('LLM error'))
+
+        await manager.schedule_summarize(mock_llm)
+
+        assert manager.summary == ''
+        assert manager._count_turns() == 2
+
     @pytest.mark.asyncio
     async def test_fallback_on_summarization_failure(self, mock_llm):
         """Test fallback to simple truncation if summarization fails."""
@@ -318,6 +495,22 @@ class TestSummarizingConversationManager:
         assert '1 turns' in summary
         assert 'has summary' in summary
 
+    def test_estimated_tokens_tracks_history(self):
+        """Test that the token estimate grows with appended messages and resets on clear."""
+        manager = SummarizingConversationManager()
+        assert manager.estimated_tokens == 0
+
+        manager.add_user_message('x' * 400)
+        first = manager.estimated_tokens
+        assert first >= 100
+
+        manager.add_tool_result('tc_1', {'data': 'y' * 400})
+        assert manager.estimated_tokens >= first + 100
+        assert f'~{manager.estimated_tokens} tokens' in manager.get_summary()
+
+        manager.clear()
+        assert manager.estimated_tokens == 0
+
     def test_format_messages_for_summary(self):
         """Test formatting messages for summarization."""
         manager = SummarizingConversationManager()
@@ -330,7 +523,7 @@ class TestSummarizingConversationManager:
         manager.add_tool_result('tc_1', {'status': 'ok'})
 
         # Format for summary
-        formatted = manager._format_messages_for_summary(manager.messages)
+        formatted = '\n'.join(manager._format_messages_for_summary(manager.messages))
 
         assert 'USER: Hello' in formatted
         assert 'ASSISTANT: Hi there!' in formatted
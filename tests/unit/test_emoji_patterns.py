@@ -146,6 +146,30 @@ class TestUserPreferencesEmojiPatterns:
         assert found is not None
         assert found.emoji == 'white_check_mark'
 
+    def test_remove_emoji_pattern_by_id(self):
+        """Test removal by id, including patterns appended after the index was built."""
+        prefs = UserPreferences(emoji_patterns=[EmojiPattern(id='a', emoji='eyes', meaning='seen')])
+        assert prefs.remove_emoji_pattern('missing') is False
+
+        prefs.emoji_patterns.append(EmojiPattern(id='b', emoji='rocket', meaning='shipped'))
+        assert prefs.remove_emoji_pattern('b') is True
+        assert prefs.remove_emoji_pattern('a') is True
+        assert prefs.emoji_patterns == []
+        assert prefs.remove_emoji_pattern('a') is False
+
+    def test_get_emoji_pattern_tracks_list_changes(self):
+        """Test that lookups see patterns appended or removed after a previous lookup."""
+        prefs = UserPreferences(emoji_patterns=[EmojiPattern(id='a', emoji='eyes', meaning='seen')])
+        assert prefs.get_emoji_pattern('rocket') is None
+
+        prefs.emoji_patterns.append(EmojiPattern(id='b', emoji='rocket', meaning='shipped'))
+        assert prefs.get_emoji_pattern(':rocket:').id == 'b'
+
+        prefs.remove_emoji_pattern('b')
+        prefs.emoji_patterns.append(EmojiPattern(id='c', emoji='tada', meaning='done'))
+        assert prefs.get_emoji_pattern('rocket') is None
+        assert prefs.get_emoji_pattern('tada').id == 'c'
+
 
 class TestPreferenceStorageEmojiPatterns:
     """Tests for emoji pattern storage."""
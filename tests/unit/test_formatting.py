@@ -1,7 +1,7 @@
 """Tests for Slack message formatting."""
 
 from slack_assistant.formatting.models import FormattedStatusItem, Priority
-from slack_assistant.formatting.patterns import CollectedEntities, collect_entities, format_text
+from slack_assistant.formatting.patterns import CollectedEntities, collect_entities, format_text, prepare_text
 from slack_assistant.formatting.resolver import ResolvedContext
 
 
@@ -133,6 +133,27 @@ class TestFormatText:
         assert result == 'если @john.doe и @jane.smith будут ревьювать'
 
 
+class TestPrepareText:
+    """Tests for single-pass text templates."""
+
+    def test_matches_format_text(self):
+        text = '<@U123> said in <#C456|general>: check &lt;this&gt; <!here> cc <@U789|bob>'
+        users = {'U123': 'alice'}
+
+        template = prepare_text(text, {})
+
+        assert template.user_ids == {'U123', 'U789'}
+        assert template.render(users) == format_text(text, users, {})
+
+    def test_text_without_mentions(self):
+        template = prepare_text('Tom &amp; Jerry', {})
+        assert template.user_ids == set()
+        assert template.render({}) == 'Tom & Jerry'
+
+    def test_empty_text(self):
+        assert prepare_text(None, {}).render({}) == ''
+
+
 class TestResolvedContext:
     """Tests for ResolvedContext."""
 
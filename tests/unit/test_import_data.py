@@ -0,0 +1,104 @@
+"""Tests for the JSONL import script."""
+
+import importlib.util
+from contextlib import asynccontextmanager
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import orjson
+import pytest
+
+from slack_assistant.db.models import User
+
+
+_spec = importlib.util.spec_from_file_location('import_data', Path(__file__).parents[2] / 'scripts' / 'import_data.py')
+import_data = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(import_data)
+
+
+def _write_jsonl(path: Path, rows: list[dict]) -> Path:
+    path.write_bytes(b''.join(orjson.dumps(row, option=orjson.OPT_APPEND_NEWLINE) for row in rows))
+    return path
+
+
+class TestImportData:
+    """Tests for the raw asyncpg import paths."""
+
+    @pytest.fixture
+    def conn(self):
+        """Mock asyncpg connection recording executemany / COPY calls."""
+        conn = MagicMock()
+
+        @asynccontextmanager
+        async def transaction():
+            yield
+
+        conn.transaction = transaction
+        conn.execute = AsyncMock()
+        conn.executemany = AsyncMock()
+        conn.copied = []
+
+        async def copy_records_to_table(table, records, columns):
+            rows = list(records)
+            conn.copied.append((columns, rows))
+            return f'COPY {len(rows)}'
+
+        conn.copy_records_to_table = copy_records_to_table
+        return conn
+
+    @pytest.fixture(autouse=True)
+    def driver_connection(self, monkeypatch, conn):
+        """Route the scripts' raw connection lookup to the mock."""
+        monkeypatch.setattr(import_data, '_driver_connection', AsyncMock(return_value=conn))
+
+    def test_missing_keys_use_defaults(self, tmp_path):
+        """Test that missing keys get Python defaults and leave server-default columns out."""
+        input_file = _write_jsonl(tmp_path / 'users.jsonl', [{'id': 'U1', 'name': 'alice'}])
+
+        [(columns, values)] = list(import_data._iter_records(User, input_file))
+
+        record = dict(zip(columns, values, strict=True))
+        assert record == {'id': 'U1', 'name': 'alice', 'is_bot': False, 'metadata': '{}'}
+        assert 'updated_at' not in columns
+
+    async def test_import_jsonl_sends_only_present_columns(self, tmp_path, conn):
+        """Test that the upsert inserts present columns but still updates every non-pk column."""
+        input_file = _write_jsonl(
+            tmp_path / 'users.jsonl',
+            [
+                {'id': 'U1', 'name': 'alice', 'is_bot': True, 'metadata': {'tz': 'UTC'}},
+                {'id': 'U2', 'name': 'bob'},
+                {'id': 'U3', 'name': 'carol', 'updated_at': '2024-01-01T00:00:00+00:00'},
+            ],
+        )
+
+        count = await import_data.import_table_jsonl(None, User, input_file, batch_size=100)
+
+        assert count == 3
+        # U1 and U2 share a column list; U3 carries updated_at and needs its own statement
+        assert conn.executemany.await_count == 2
+        first_sql, first_batch = conn.executemany.await_args_list[0].args
+        assert first_sql.startswith('INSERT INTO users (id, name, is_bot, metadata) VALUES ($1, $2, $3, $4)')
+        assert 'updated_at = EXCLUDED.updated_at' in first_sql
+        assert first_batch == [('U1', 'alice', True, '{"tz":"UTC"}'), ('U2', 'bob', False, '{}')]
+        second_sql, _ = conn.executemany.await_args_list[1].args
+        assert second_sql.startswith('INSERT INTO users (id, name, updated_at, is_bot, metadata)')
+
+    async def test_import_copy_groups_rows_by_columns(self, tmp_path, conn):
+        """Test that COPY streams each run of same-key rows with its own column list."""
+        input_file = _write_jsonl(
+            tmp_path / 'users.jsonl',
+            [{'id': 'U1', 'name': 'alice'}, {'id': 'U2'}, {'id': 'U3'}],
+        )
+
+        count = await import_data.import_table_copy(None, User, input_file)
+
+        assert count == 3
+        assert conn.copied == [
+            (['id', 'name', 'is_bot', 'metadata'], [('U1', 'alice', False, '{}')]),
+            (['id', 'is_bot', 'metadata'], [('U2', False, '{}'), ('U3', False, '{}')]),
+        ]
+        merge_sql = conn.execute.await_args_list[-1].args[0]
+        assert (
+            'SELECT id, name, real_name, display_name, is_bot, updated_at, metadata FROM tmp_import_users' in merge_sql
+        )
@@ -1,9 +1,11 @@
 """Tests for search service."""
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from slack_assistant.services.embeddings import EmbeddingService
 from slack_assistant.services.search import SearchService
 
 
@@ -23,7 +25,7 @@ class TestVectorSearch:
     @pytest.fixture
     def mock_embedding_service(self):
         service = MagicMock()
-        service.generate_embedding = AsyncMock(return_value=[0.1, 0.2, 0.3] * 128)  # 384 dims
+        service.embed_query = AsyncMock(return_value=[0.1, 0.2, 0.3] * 128)  # 384 dims
         return service
 
     @pytest.mark.asyncio
@@ -62,7 +64,7 @@ class TestVectorSearch:
     async def test_vector_search_returns_empty_when_no_embedding(self, mock_client, mock_repository):
         """Test that vector search returns empty list when embedding generation fails."""
         mock_embedding_service = MagicMock()
-        mock_embedding_service.generate_embedding = AsyncMock(return_value=None)
+        mock_embedding_service.embed_query = AsyncMock(return_value=None)
 
         search = SearchService(mock_client, mock_repository, mock_embedding_service)
         results = await search._vector_search('test query', limit=5)
@@ -100,3 +102,64 @@ class TestVectorSearch:
             # Should use CAST(:embedding AS vector) instead of :embedding::vector
             assert 'CAST(:embedding AS vector)' in sql_text
             assert '::vector' not in sql_text
+
+
+class TestQueryEmbeddingCache:
+    """Tests for query embedding reuse and batching in EmbeddingService."""
+
+    @pytest.fixture
+    def service(self):
+        service = EmbeddingService(MagicMock())
+        service.QUERY_BATCH_DELAY = 0
+        service.generate_embeddings = AsyncMock(side_effect=lambda texts: [[0.5, 0.5] for _ in texts])
+        return service
+
+    def embedded_texts(self, service) -> list[str]:
+        return [text for call in service.generate_embeddings.await_args_list for text in call.args[0]]
+
+    @pytest.mark.asyncio
+    async def test_repeated_query_reuses_embedding(self, service):
+        first = await service.embed_query('deploy  status')
+        second = await service.embed_query(' deploy status ')
+
+        assert first == second == [0.5, 0.5]
+        assert self.embedded_texts(service) == ['deploy status']
+
+    @pytest.mark.asyncio
+    async def test_failed_embedding_not_cached(self, service):
+        service.generate_embeddings.side_effect = None
+        service.generate_embeddings.return_value = None
+        assert await service.embed_query('q') is None
+
+        service.generate_embeddings.return_value = [[1.0]]
+        assert await service.embed_query('q') == [1.0]
+        assert service.generate_embeddings.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cache_evicts_least_recently_used(self, service):
+        service.QUERY_CACHE_SIZE = 2
+        await service.embed_query('a')
+        await service.embed_query('b')
+        await service.embed_query('a')
+        await service.embed_query('c')  # Evicts 'b'
+
+        service.generate_embeddings.reset_mock()
+        await service.embed_query('a')
+        await service.embed_query('b')
+        assert self.embedded_texts(service) == ['b']
+
+    @pytest.mark.asyncio
+    async def test_concurrent_queries_embedded_in_one_batch(self, service):
+        results = await asyncio.gather(
+            service.embed_query('a'), service.embed_query('b'), service.embed_query('a'), service.embed_query('')
+        )
+
+        assert results == [[0.5, 0.5], [0.5, 0.5], [0.5, 0.5], None]
+        service.generate_embeddings.assert_awaited_once_with(['a', 'b'])
+
+    @pytest.mark.asyncio
+    async def test_batches_capped_at_batch_size(self, service):
+        service.QUERY_BATCH_SIZE = 2
+        await asyncio.gather(*(service.embed_query(q) for q in 'abcde'))
+
+        assert [call.args[0] for call in service.generate_embeddings.await_args_list] == [['a', 'b'], ['c', 'd'], ['e']]
@@ -1,12 +1,15 @@
 """Tests for session management."""
 
+import asyncio
 from pathlib import Path
 
 import pytest
 
+from slack_assistant.agent.tools.session_tool import SessionTool
 from slack_assistant.session import (
     AnalyzedItem,
     ConversationSummary,
+    DebouncedSessionStorage,
     ItemDisposition,
     ProcessedItem,
     SessionState,
@@ -62,6 +65,17 @@ class TestSessionModels:
         keys = session.get_processed_keys()
         assert keys == {'C123:1111.1111', 'C456:2222.2222'}
 
+    def test_session_state_processed_keys_track_direct_appends(self):
+        """Test that the cached key set notices items appended to the list directly."""
+        session = SessionState()
+        session.add_processed_item('C123', '1111.1111', ItemDisposition.REVIEWED)
+        assert session.is_item_processed('C456', '2222.2222') is False
+
+        session.processed_items.append(
+            ProcessedItem(channel_id='C456', message_ts='2222.2222', disposition=ItemDisposition.DEFERRED)
+        )
+        assert session.is_item_processed('C456', '2222.2222') is True
+
     def test_session_state_touch(self):
         """Test touching session updates last_activity_at."""
         session = SessionState()
@@ -179,6 +193,53 @@ class TestSessionStorage:
         assert len(archives) == 3
 
 
+class TestDebouncedSessionStorage:
+    """Tests for debounced session storage."""
+
+    @pytest.fixture
+    def tmp_storage(self, tmp_path: Path) -> DebouncedSessionStorage:
+        """Create a debounced storage instance with temp directory."""
+        return DebouncedSessionStorage(storage_dir=tmp_path, delay=0.01)
+
+    async def test_saves_are_coalesced(self, tmp_storage: DebouncedSessionStorage, mocker):
+        """Test that a burst of saves results in a single write."""
+        write_spy = mocker.spy(tmp_storage, '_write')
+        session = SessionState(session_id='burst')
+
+        for _ in range(5):
+            tmp_storage.save(session)
+        assert write_spy.call_count == 0
+
+        await asyncio.sleep(0.05)
+        assert write_spy.call_count == 1
+        assert SessionStorage(storage_dir=tmp_storage._storage_dir).load().session_id == 'burst'
+
+    async def test_flush_writes_pending(self, tmp_storage: DebouncedSessionStorage):
+        """Test that flush persists a pending save immediately."""
+        tmp_storage.save(SessionState(session_id='pending'))
+        tmp_storage.flush()
+
+        assert SessionStorage(storage_dir=tmp_storage._storage_dir).load().session_id == 'pending'
+
+    async def test_archive_drops_pending_write(self, tmp_storage: DebouncedSessionStorage):
+        """Test that a pending write can't recreate an archived session file."""
+        session = SessionState(session_id='archive_me')
+        tmp_storage.save(session)
+
+        archive_path = tmp_storage.archive(session)
+        await asyncio.sleep(0.05)
+
+        assert archive_path is not None
+        assert archive_path.exists()
+        assert tmp_storage.load() is None
+
+    def test_save_without_event_loop_writes_immediately(self, tmp_storage: DebouncedSessionStorage):
+        """Test that saves outside an event loop are not deferred."""
+        tmp_storage.save(SessionState(session_id='sync'))
+
+        assert SessionStorage(storage_dir=tmp_storage._storage_dir).load().session_id == 'sync'
+
+
 class TestItemDisposition:
     """Tests for item disposition enum."""
 
@@ -327,3 +388,36 @@ class TestSessionStateAnalyzedItems:
 
         summary = session.get_summary_text()
         assert 'Items analyzed: 2' in summary
+
+
+class TestSessionTool:
+    """Tests for SessionTool action dispatch."""
+
+    @pytest.fixture
+    def tool(self, tmp_path: Path) -> SessionTool:
+        return SessionTool(SessionStorage(tmp_path), SessionState())
+
+    async def test_mark_item_actions_set_disposition(self, tool: SessionTool):
+        await tool.execute(action='mark_item_deferred', channel_id='C1', message_ts='1.0')
+        await tool.execute(action='mark_item_acted_on', channel_id='C1', message_ts='2.0')
+
+        result = await tool.execute(action='get_processed_items')
+        assert [item['disposition'] for item in result['items']] == ['deferred', 'acted_on']
+
+    async def test_processed_items_serialized_incrementally(self, tool: SessionTool):
+        await tool.execute(action='mark_item_reviewed', channel_id='C1', message_ts='1.0', notes='first')
+        first = await tool.execute(action='get_processed_items')
+        await tool.execute(action='mark_item_reviewed', channel_id='C1', message_ts='2.0')
+        second = await tool.execute(action='get_processed_items')
+
+        assert second['items'][0] is first['items'][0]
+        assert [item['message_ts'] for item in second['items']] == ['1.0', '2.0']
+        assert second['total_items'] == 2
+
+    async def test_keyword_actions_dispatched(self, tool: SessionTool):
+        assert (await tool.execute(action='set_focus', focus='release'))['focus'] == 'release'
+        assert (await tool.execute(action='get_session_info'))['current_focus'] == 'release'
+        assert await tool.execute(action='save_summary') == {'error': 'summary_text is required'}
+
+    async def test_unknown_action(self, tool: SessionTool):
+        assert await tool.execute(action='nope') == {'error': 'Unknown action: nope'}
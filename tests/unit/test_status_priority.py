@@ -8,6 +8,7 @@ import pytest
 from slack_assistant.db.models import Channel, Message
 from slack_assistant.formatting.models import Priority
 from slack_assistant.services.status import StatusService
+from slack_assistant.session import ItemDisposition, SessionState
 
 
 @pytest.fixture
@@ -204,3 +205,55 @@ class TestStatusMentionPriority:
         # Second mention (not replied) should be CRITICAL
         assert items_by_channel['C456'].priority == Priority.CRITICAL
         assert 'already replied' not in items_by_channel['C456'].reason
+
+        assert status.counts_by_priority == {p: len(items) for p, items in status.by_priority.items()}
+
+
+class TestStatusSessionFilter:
+    """Tests for excluding session-processed items."""
+
+    @pytest.mark.asyncio
+    async def test_processed_keys_passed_to_queries(self, status_service, mock_repository):
+        session = SessionState()
+        session.add_processed_item('C123', '1234567890.000001', ItemDisposition.REVIEWED)
+
+        await status_service.get_status(session=session)
+
+        expected = {'C123:1234567890.000001'}
+        assert mock_repository.get_unread_mentions.call_args.kwargs['exclude_ids'] == expected
+        assert mock_repository.get_dm_messages.call_args.kwargs['exclude_ids'] == expected
+        assert 'exclude_ids' not in mock_repository.get_threads_with_replies.call_args.kwargs
+
+    @pytest.mark.asyncio
+    async def test_thread_hidden_when_latest_reply_processed(self, status_service, mock_repository):
+        """A thread whose newest reply was processed should not resurface via an older reply."""
+        thread_ts = '1234567890.000000'
+        replies = [
+            {
+                'channel_id': 'C123',
+                'channel_name': 'general',
+                'ts': ts,
+                'thread_ts': thread_ts,
+                'user_id': 'U_OTHER_USER',
+                'text': text,
+                'created_at': created_at,
+            }
+            # Newest first, as returned by the repository
+            for ts, text, created_at in [
+                ('1234567890.000002', 'Newest reply', datetime(2024, 1, 1, 12, 5)),
+                ('1234567890.000001', 'Older reply', datetime(2024, 1, 1, 12, 0)),
+            ]
+        ]
+
+        async def get_threads_with_replies(user_id, since=None, exclude_ids=None):
+            # Filters like the query would if processed keys were pushed down to it
+            return [r for r in replies if f'{r["channel_id"]}:{r["ts"]}' not in (exclude_ids or ())]
+
+        mock_repository.get_threads_with_replies = AsyncMock(side_effect=get_threads_with_replies)
+        session = SessionState()
+        session.add_processed_item('C123', '1234567890.000002', ItemDisposition.REVIEWED)
+
+        status = await status_service.get_status(session=session)
+
+        assert status.items == []
+        assert status.filtered_session_items == 1